@@ -0,0 +1,72 @@
+"""
+Benchmark do custo de registrar pagamentos: print síncrono contra o
+AsyncLogHandler, com vários threads escrevendo em um stdout simulado que
+leva 20 µs por write (terminal ou pipe com leitor lento), e o custo do log
+desligado por nível.
+
+Execute com: python -m benchmarks.bench_async_logging
+"""
+import io
+import logging
+import threading
+import time
+from contextlib import redirect_stdout
+
+from src.domain.entities.money import Money
+from src.domain.entities.payment import CreditCardProcessor, PaymentInfo
+from src.infrastructure.config.logging_config import APP_LOGGER, LoggingConfig
+
+PAYMENTS_PER_THREAD = 5_000
+THREADS = 8
+WRITE_LATENCY = 0.00002
+
+
+class SlowStream(io.StringIO):
+    """Stream em que cada write custa uma chamada de sistema lenta"""
+
+    def write(self, text: str) -> int:
+        time.sleep(WRITE_LATENCY)
+        return len(text)
+
+
+def run(function) -> float:
+    """Retorna chamadas por segundo com THREADS threads chamando a função"""
+    def worker():
+        for _ in range(PAYMENTS_PER_THREAD):
+            function()
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return THREADS * PAYMENTS_PER_THREAD / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    payment = PaymentInfo(amount=Money(1050), description="Pedido bench")
+    processor = CreditCardProcessor()
+
+    with redirect_stdout(SlowStream()):
+        printed = run(lambda: print(f"Processando pagamento com cartão de crédito: {payment}"))
+
+    handler = LoggingConfig.configure(stream=SlowStream(), capacity=100_000)
+    logged = run(lambda: processor.process_payment(payment))
+    handler.flush()
+    written, dropped = handler.written, handler.dropped
+
+    LoggingConfig.configure(level=logging.WARNING, stream=SlowStream())
+    disabled = run(lambda: processor.process_payment(payment))
+
+    for handler in list(logging.getLogger(APP_LOGGER).handlers):
+        handler.close()
+
+    print(f"print síncrono:         {printed:>12,.0f} chamadas/s")
+    print(f"AsyncLogHandler (INFO): {logged:>12,.0f} chamadas/s ({written:,} escritos, {dropped:,} descartados)")
+    print(f"log desligado:          {disabled:>12,.0f} chamadas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark de vazão do BatchingPaymentProcessor contra chamadas diretas,
+variando a quantidade de threads chamadoras, com um gateway simulado
+de 10 ms por ida e volta.
+
+Execute com: python -m benchmarks.bench_batching_payment_processor
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.domain.entities.money import Money
+from src.domain.entities.payment import PaymentInfo, PaymentProcessor
+from src.infrastructure.services.batching_payment_processor import BatchingPaymentProcessor
+from src.infrastructure.services.simulated_payment_processor import (
+    SimulatedLatencyBlockingPaymentProcessor
+)
+
+LATENCY = 0.01
+PAYMENTS = 2_000
+
+
+def run(processor: PaymentProcessor, threads: int) -> float:
+    """Retorna pagamentos por segundo com a quantidade de threads informada"""
+    payment = PaymentInfo(amount=Money(1000), description="bench")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: processor.process_payment(payment), range(PAYMENTS)))
+    return PAYMENTS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(
+        f"{'threads':>8} {'direto (pag/s)':>15} {'idas':>6}"
+        f" {'lotes (pag/s)':>14} {'idas':>6} {'lote médio':>11}"
+    )
+    for threads in (1, 8, 32, 128):
+        direct_gateway = SimulatedLatencyBlockingPaymentProcessor(latency=LATENCY)
+        direct = run(direct_gateway, threads)
+
+        gateway = SimulatedLatencyBlockingPaymentProcessor(latency=LATENCY)
+        with BatchingPaymentProcessor(gateway, max_batch_size=64, max_in_flight=4) as processor:
+            batched = run(processor, threads)
+        average_batch = sum(gateway.batch_sizes) / len(gateway.batch_sizes)
+
+        print(
+            f"{threads:>8} {direct:>15,.0f} {direct_gateway.round_trips:>6}"
+            f" {batched:>14,.0f} {gateway.round_trips:>6} {average_batch:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark do envio de email em massa: um bloco por vez em uma conexão
+contra blocos paralelos em K conexões, usando o LocalSmtpServer com 1 ms
+de latência por mensagem.
+
+Execute com: python -m benchmarks.bench_bulk_email
+"""
+import time
+
+from src.domain.interfaces.notification_service import (
+    NotificationContent,
+    NotificationRecipient,
+    NotificationType
+)
+from src.infrastructure.services.email_notification_service import EmailNotificationService
+from src.infrastructure.services.local_smtp_server import LocalSmtpServer
+
+RECIPIENTS = 2_000
+
+
+def run(concurrency: int) -> float:
+    """Retorna mensagens por segundo com a concorrência informada"""
+    recipients = [
+        NotificationRecipient(identifier=f"cliente{i}@example.com", type=NotificationType.EMAIL)
+        for i in range(RECIPIENTS)
+    ]
+    content = NotificationContent(subject="Promoção", body="Aproveite!")
+    with LocalSmtpServer(handshake_latency=0.005, message_latency=0.001) as server:
+        service = EmailNotificationService(
+            smtp_host=server.host,
+            smtp_port=server.port,
+            smtp_user="user",
+            smtp_password="password",
+            default_from_email="loja@example.com",
+            use_tls=False,
+            pool_size=concurrency,
+            bulk_concurrency=concurrency
+        )
+        start = time.perf_counter()
+        results = service.send_bulk_notifications(recipients, content)
+        elapsed = time.perf_counter() - start
+        service.close()
+    assert all(result.success for result in results)
+    return RECIPIENTS / elapsed
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(f"{'conexões':>9} {'msg/s':>10}")
+    for concurrency in (1, 2, 4, 8):
+        print(f"{concurrency:>9} {run(concurrency):>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
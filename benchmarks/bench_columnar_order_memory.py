@@ -0,0 +1,60 @@
+"""
+Benchmark de memória por item: InMemoryOrderRepository (objetos Order e
+OrderItem com Money) contra ColumnarOrderRepository (colunas array).
+
+Execute com: python -m benchmarks.bench_columnar_order_memory
+"""
+import gc
+import tracemalloc
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.infrastructure.repositories.columnar_order_repository import ColumnarOrderRepository
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+
+ORDERS = 50_000
+ITEMS_PER_ORDER = 10
+PRODUCTS = 5_000
+
+
+def fill(repository) -> None:
+    """Grava os pedidos do benchmark no repositório"""
+    for i in range(ORDERS):
+        items = [
+            OrderItem(
+                product_id=f"product-{(i * ITEMS_PER_ORDER + j) % PRODUCTS}",
+                quantity=j + 1,
+                price=Money((i + j) % 500 * 100 + j)
+            )
+            for j in range(ITEMS_PER_ORDER)
+        ]
+        order = Order(id=f"order-{i}", items=items, total=Money.zero())
+        order.calculate_total()
+        repository.save(order)
+
+
+def measure(factory) -> float:
+    """Retorna os bytes retidos por item após preencher o repositório"""
+    gc.collect()
+    tracemalloc.start()
+    repository = factory()
+    fill(repository)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del repository
+    return retained / (ORDERS * ITEMS_PER_ORDER)
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(f"{ORDERS:,} pedidos x {ITEMS_PER_ORDER} itens")
+    for name, factory in (
+        ("InMemoryOrderRepository", InMemoryOrderRepository),
+        ("ColumnarOrderRepository", ColumnarOrderRepository),
+    ):
+        print(f"{name:<26} {measure(factory):>8.1f} bytes/item")
+
+
+if __name__ == "__main__":
+    main()
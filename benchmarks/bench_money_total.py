@@ -0,0 +1,45 @@
+"""
+Micro-benchmark do cálculo de total de pedidos com 1.000 itens:
+soma com Decimal (representação anterior) contra Money em unidades
+mínimas inteiras (Order.calculate_total).
+
+Execute com: python -m benchmarks.bench_money_total
+"""
+import timeit
+from decimal import Decimal
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+
+ITEMS = 1_000
+
+
+def decimal_total(items) -> Decimal:
+    """Cálculo anterior: um Decimal por item, somado a partir de int 0"""
+    return sum(price * Decimal(quantity) for price, quantity in items)
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    decimal_items = [(Decimal(f"{i % 500}.{i % 100:02d}"), i % 7 + 1) for i in range(ITEMS)]
+    order = Order(
+        id="bench",
+        items=[
+            OrderItem(product_id=f"p{i}", quantity=quantity, price=Money.from_decimal(price))
+            for i, (price, quantity) in enumerate(decimal_items)
+        ],
+        total=Money.zero()
+    )
+
+    number = 2_000
+    decimal_time = min(timeit.repeat(lambda: decimal_total(decimal_items), number=number, repeat=5)) / number
+    money_time = min(timeit.repeat(order.calculate_total, number=number, repeat=5)) / number
+
+    assert order.total.to_decimal() == decimal_total(decimal_items)
+    print(f"pedido com {ITEMS} itens")
+    print(f"Decimal: {decimal_time * 1e6:8.1f} µs")
+    print(f"Money:   {money_time * 1e6:8.1f} µs ({decimal_time / money_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
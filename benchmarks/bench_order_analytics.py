@@ -0,0 +1,82 @@
+"""
+Benchmark dos agregados de pedidos: recálculo com laços Python e Decimal
+sobre InMemoryOrderRepository.orders contra as consultas do OrderAnalytics,
+mantido de forma incremental a cada gravação.
+
+Execute com: python -m benchmarks.bench_order_analytics
+"""
+import heapq
+import random
+import time
+from collections import defaultdict
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+from src.infrastructure.repositories.order_analytics import AnalyticsOrderRepository
+
+ORDERS = 100_000
+PRODUCTS = 1_000
+
+
+def make_orders() -> list:
+    """Gera pedidos com 1 a 5 itens de produtos aleatórios"""
+    rng = random.Random(42)
+    orders = []
+    for i in range(ORDERS):
+        items = [
+            OrderItem(f"prod-{rng.randrange(PRODUCTS)}", rng.randint(1, 5), Money(rng.randint(100, 20_000)))
+            for _ in range(rng.randint(1, 5))
+        ]
+        order = Order(id=str(i), items=items, total=Money.zero())
+        order.calculate_total()
+        orders.append(order)
+    return orders
+
+
+def recompute(repository: InMemoryOrderRepository) -> tuple:
+    """Recalcula receita por produto, top 10 e histograma percorrendo os pedidos"""
+    revenue = defaultdict(int)
+    histogram = defaultdict(int)
+    for order in repository.orders.values():
+        for item in order.items:
+            revenue[item.product_id] += item.price.to_decimal() * item.quantity
+        histogram[int(order.total.to_decimal() // 100)] += 1
+    top = heapq.nlargest(10, revenue.items(), key=lambda entry: entry[1])
+    return revenue, top, histogram
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    orders = make_orders()
+
+    plain = InMemoryOrderRepository()
+    start = time.perf_counter()
+    plain.save_many(orders)
+    plain_save = time.perf_counter() - start
+
+    tracked = AnalyticsOrderRepository(InMemoryOrderRepository())
+    start = time.perf_counter()
+    tracked.save_many(orders)
+    tracked_save = time.perf_counter() - start
+
+    start = time.perf_counter()
+    recompute(plain)
+    full = time.perf_counter() - start
+
+    analytics = tracked.analytics
+    start = time.perf_counter()
+    analytics.revenue_by_product()
+    analytics.top_products(10)
+    analytics.order_value_histogram()
+    analytics.daily_totals()
+    incremental = time.perf_counter() - start
+
+    print(f"gravação sem agregados:   {plain_save * 1000:>9.1f} ms")
+    print(f"gravação com agregados:   {tracked_save * 1000:>9.1f} ms")
+    print(f"recálculo completo:       {full * 1000:>9.1f} ms")
+    print(f"consulta incremental:     {incremental * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
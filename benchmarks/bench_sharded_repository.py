@@ -0,0 +1,43 @@
+"""
+Benchmark de vazão do ShardedInMemoryOrderRepository com várias threads,
+variando a quantidade de shards (1 shard equivale a um lock global).
+
+Execute com: python -m benchmarks.bench_sharded_repository
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.infrastructure.repositories.sharded_memory_repository import ShardedInMemoryOrderRepository
+
+OPERATIONS_PER_THREAD = 50_000
+
+
+def run(shards: int, threads: int) -> float:
+    """Retorna operações por segundo para a configuração informada"""
+    repo = ShardedInMemoryOrderRepository(shards=shards)
+    item = OrderItem(product_id="p", quantity=1, price=Money(100))
+
+    def worker(worker_id: int) -> None:
+        for i in range(OPERATIONS_PER_THREAD):
+            order_id = f"{worker_id}-{i % 1_000}"
+            repo.save(Order(id=order_id, items=[item], total=Money(100)))
+            repo.find_by_id(order_id)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+    return threads * OPERATIONS_PER_THREAD * 2 / elapsed
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(f"{'threads':>8} {'1 shard (ops/s)':>16} {'16 shards (ops/s)':>18}")
+    for threads in (1, 4, 8):
+        print(f"{threads:>8} {run(1, threads):>16,.0f} {run(16, threads):>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark de envio de emails: uma conexão nova (conexão, saudação e LOGIN)
+por mensagem, como o EmailNotificationService fazia, contra o
+SmtpConnectionPool, usando o LocalSmtpServer com 5 ms de latência na
+saudação e na autenticação e 0,5 ms por mensagem.
+
+Execute com: python -m benchmarks.bench_smtp_connection_pool
+"""
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+
+from src.infrastructure.services.local_smtp_server import LocalSmtpServer
+from src.infrastructure.services.smtp_connection_pool import SmtpConnectionPool
+
+MESSAGES = 200
+
+
+def make_message(index: int) -> MIMEText:
+    """Cria uma mensagem de teste"""
+    message = MIMEText("Seu pedido foi criado.")
+    message["From"] = "loja@example.com"
+    message["To"] = f"cliente{index}@example.com"
+    message["Subject"] = "Pedido criado"
+    return message
+
+
+def send_unpooled(server: LocalSmtpServer, message: MIMEText) -> None:
+    """Abre, autentica e fecha uma conexão para a mensagem"""
+    with smtplib.SMTP(server.host, server.port) as connection:
+        connection.login("user", "password")
+        connection.send_message(message)
+
+
+def run(send, threads: int) -> float:
+    """Retorna mensagens por segundo"""
+    messages = [make_message(i) for i in range(MESSAGES)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(send, messages))
+    return MESSAGES / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(f"{'threads':>8} {'sem pool (msg/s)':>17} {'conexões':>9} {'com pool (msg/s)':>17} {'conexões':>9}")
+    for threads in (1, 4):
+        with LocalSmtpServer(handshake_latency=0.005, message_latency=0.0005) as server:
+            unpooled = run(lambda message: send_unpooled(server, message), threads)
+            unpooled_connections = server.connections_opened
+
+        with LocalSmtpServer(handshake_latency=0.005, message_latency=0.0005) as server:
+            with SmtpConnectionPool(
+                server.host, server.port, "user", "password", size=threads, use_tls=False
+            ) as pool:
+                pooled = run(pool.send, threads)
+            pooled_connections = server.connections_opened
+
+        print(
+            f"{threads:>8} {unpooled:>17,.0f} {unpooled_connections:>9}"
+            f" {pooled:>17,.0f} {pooled_connections:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark de snapshot e restauração dos repositórios em memória,
+comparado com a reconstrução a partir do zero (save um a um).
+
+Execute com: python -m benchmarks.bench_snapshot_restore
+"""
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.user import User
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+from src.infrastructure.repositories.memory_user_repository import InMemoryUserRepository
+
+
+def build_users(count: int) -> InMemoryUserRepository:
+    """Cria o repositório de usuários com save um a um"""
+    repo = InMemoryUserRepository()
+    now = datetime.now()
+    for i in range(count):
+        repo.save(User(id=f"{i:09d}", name=f"User {i}", email=f"user{i}@example.com", created_at=now))
+    return repo
+
+
+def build_orders(count: int) -> InMemoryOrderRepository:
+    """Cria o repositório de pedidos com save um a um"""
+    repo = InMemoryOrderRepository()
+    for i in range(count):
+        items = [OrderItem(product_id=f"p{(i + j) % 1000}", quantity=1, price=Money(990)) for j in range(3)]
+        repo.save(Order(id=f"{i:09d}", items=items, total=Money(i % 997 * 100)))
+    return repo
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(f"{'repositório':<10} {'entidades':>10} {'rebuild (s)':>12} {'snapshot (s)':>13} {'restore (s)':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.snapshot")
+        for name, build, repository_class in (
+            ("users", build_users, InMemoryUserRepository),
+            ("orders", build_orders, InMemoryOrderRepository),
+        ):
+            for count in (10_000, 100_000, 200_000):
+                start = time.perf_counter()
+                repo = build(count)
+                rebuild = time.perf_counter() - start
+
+                start = time.perf_counter()
+                repo.snapshot(path)
+                snapshot = time.perf_counter() - start
+
+                start = time.perf_counter()
+                repository_class().restore(path)
+                restore = time.perf_counter() - start
+
+                print(f"{name:<10} {count:>10,} {rebuild:>12.3f} {snapshot:>13.3f} {restore:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark de inserção nos repositórios SQLite: uma chamada por entidade
+(save) contra gravação em lote (save_many com executemany).
+
+Execute com: python -m benchmarks.bench_sqlite_bulk_insert
+"""
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.user import User
+from src.infrastructure.repositories.sqlite_order_repository import SqliteOrderRepository
+from src.infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+
+COUNT = 20_000
+
+
+def make_users():
+    """Gera os usuários do benchmark"""
+    now = datetime.now()
+    return [
+        User(id=f"{i:08d}", name=f"User {i}", email=f"user{i}@example.com", created_at=now)
+        for i in range(COUNT)
+    ]
+
+
+def make_orders():
+    """Gera os pedidos do benchmark, com três itens cada"""
+    return [
+        Order(
+            id=f"{i:08d}",
+            items=[OrderItem(product_id=f"p{j}", quantity=j + 1, price=Money(990)) for j in range(3)],
+            total=Money(5940)
+        )
+        for i in range(COUNT)
+    ]
+
+
+def measure(repository_class, entities, batched: bool) -> float:
+    """Retorna as entidades gravadas por segundo em um banco em arquivo"""
+    with tempfile.TemporaryDirectory() as directory:
+        repo = repository_class(os.path.join(directory, "bench.db"))
+        start = time.perf_counter()
+        if batched:
+            repo.save_many(entities)
+        else:
+            for entity in entities:
+                repo.save(entity)
+        elapsed = time.perf_counter() - start
+        repo.close()
+    return len(entities) / elapsed
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(f"{'repositório':<24} {'save (ops/s)':>14} {'save_many (ops/s)':>18}")
+    for repository_class, factory in (
+        (SqliteUserRepository, make_users),
+        (SqliteOrderRepository, make_orders),
+    ):
+        entities = factory()
+        single = measure(repository_class, entities, batched=False)
+        batched = measure(repository_class, entities, batched=True)
+        print(f"{repository_class.__name__:<24} {single:>14,.0f} {batched:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Micro-benchmark da montagem do email de pedido criado (pedido com 5 itens):
+f-string com formatação manual dos itens (implementação anterior), template
+compilado a cada notificação e template compilado uma vez no TemplateRegistry.
+
+Execute com: python -m benchmarks.bench_template_render
+"""
+import timeit
+
+from src.application.templates.template_registry import compile_template, format_money
+from src.application.use_cases.notify_order_created_use_case import (
+    ORDER_CREATED_BODY,
+    ORDER_CREATED_TEMPLATES,
+    register_order_created_templates
+)
+from src.application.templates.template_registry import TemplateRegistry
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+
+ITEMS = 5
+
+
+def fstring_body(customer_name: str, order: Order) -> str:
+    """Implementação anterior do NotifyOrderCreatedUseCase"""
+    items = "\n".join(
+        f"- {item.product_id}: {item.quantity}x {format_money(item.price)}"
+        for item in order.items
+    )
+    return f"""
+Olá {customer_name},
+
+Seu pedido foi criado com sucesso!
+
+Número do pedido: {order.id}
+Total: {format_money(order.total)}
+
+Itens do pedido:
+{items}
+
+Obrigado por sua compra!
+            """.strip()
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    order = Order(
+        id="bench",
+        items=[OrderItem(f"prod{i}", i + 1, Money(1_000 + i * 250)) for i in range(ITEMS)],
+        total=Money.zero()
+    )
+    order.calculate_total()
+    data = {"customer_name": "Ana", "order": order}
+    registry = register_order_created_templates(TemplateRegistry())
+    source = ORDER_CREATED_TEMPLATES[ORDER_CREATED_BODY]
+
+    assert registry.render(ORDER_CREATED_BODY, data) == fstring_body("Ana", order)
+
+    cases = [
+        ("f-string", lambda: fstring_body("Ana", order)),
+        ("compilado a cada envio", lambda: compile_template(source)(data)),
+        ("TemplateRegistry", lambda: registry.render(ORDER_CREATED_BODY, data))
+    ]
+    number = 10_000
+    print(f"corpo do email de pedido criado, pedido com {ITEMS} itens")
+    baseline = None
+    for name, case in cases:
+        elapsed = min(timeit.repeat(case, number=number, repeat=5)) / number
+        baseline = baseline or elapsed
+        print(f"{name:24} {elapsed * 1e6:8.2f} µs/notificação ({elapsed / baseline:.2f}x)")
+    print(f"compilações no registro: {registry.compilations}")
+
+
+if __name__ == "__main__":
+    main()
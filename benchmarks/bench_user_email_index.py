@@ -0,0 +1,44 @@
+"""
+Benchmark da busca de usuários por email no InMemoryUserRepository.
+
+Compara o índice secundário (find_by_email) com a varredura linear
+sobre find_all() para quantidades crescentes de usuários.
+
+Execute com: python -m benchmarks.bench_user_email_index
+"""
+import timeit
+from datetime import datetime
+
+from src.domain.entities.user import User
+from src.infrastructure.repositories.memory_user_repository import InMemoryUserRepository
+
+
+def build_repository(size: int) -> InMemoryUserRepository:
+    """Cria um repositório com `size` usuários"""
+    repo = InMemoryUserRepository()
+    now = datetime.now()
+    for i in range(size):
+        repo.save(User(id=str(i), name=f"User {i}", email=f"user{i}@example.com", created_at=now))
+    return repo
+
+
+def main() -> None:
+    """Executa o benchmark"""
+    print(f"{'usuários':>10} {'índice (µs)':>12} {'varredura (µs)':>15}")
+    for size in (1_000, 10_000, 100_000, 1_000_000):
+        repo = build_repository(size)
+        target = f"user{size - 1}@example.com"
+
+        index_time = min(timeit.repeat(lambda: repo.find_by_email(target), number=1_000, repeat=3)) / 1_000
+        scan_number = max(1, 100_000 // size)
+        scan_time = min(timeit.repeat(
+            lambda: next(u for u in repo.find_all() if u.email == target),
+            number=scan_number,
+            repeat=3
+        )) / scan_number
+
+        print(f"{size:>10} {index_time * 1e6:>12.2f} {scan_time * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,11 @@
 DTOs para operações relacionadas a pedidos.
 """
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
+from src.domain.entities.money import Money
 from src.domain.entities.order import Order, OrderItem
+from src.domain.interfaces.use_case import Response
 
 
 @dataclass
@@ -13,13 +14,20 @@ class OrderItemInput:
     """DTO para entrada de item do pedido"""
     product_id: str
     quantity: int
-    price: Decimal
+    price: Money
 
 
 @dataclass
 class CreateOrderInput:
     """DTO para criação de pedido"""
     items: List[OrderItemInput]
+    idempotency_key: Optional[str] = None
+
+
+@dataclass
+class CreateOrdersBatchInput:
+    """DTO para criação de pedidos em lote"""
+    orders: List[CreateOrderInput]
 
 
 @dataclass
@@ -27,7 +35,7 @@ class OrderItemOutput:
     """DTO para saída de item do pedido"""
     product_id: str
     quantity: int
-    price: Decimal
+    price: Money
 
     @classmethod
     def from_entity(cls, item: OrderItem) -> "OrderItemOutput":
@@ -44,7 +52,7 @@ class OrderOutput:
     """DTO para saída de pedido"""
     id: str
     items: List[OrderItemOutput]
-    total: Decimal
+    total: Money
 
     @classmethod
     def from_entity(cls, order: Order) -> "OrderOutput":
@@ -53,4 +61,15 @@ class OrderOutput:
             id=order.id,
             items=[OrderItemOutput.from_entity(item) for item in order.items],
             total=order.total
-        ) 
\ No newline at end of file
+        ) 
+
+
+@dataclass
+class CreateOrdersBatchOutput:
+    """DTO para saída da criação de pedidos em lote"""
+    results: List[Response[OrderOutput]]  # Um resultado por pedido, na ordem de entrada
+
+    @property
+    def succeeded(self) -> int:
+        """Quantidade de pedidos criados com sucesso"""
+        return sum(1 for result in self.results if result.success)
@@ -3,7 +3,7 @@ DTOs para operações relacionadas a usuários.
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Iterable, List, Optional
 
 from src.domain.entities.user import User
 
@@ -38,10 +38,16 @@ class UserOutput:
 class ListUsersOutput:
     """DTO para listar usuários"""
     users: List[UserOutput]
+    next_cursor: Optional[str] = None  # Cursor da próxima página, se houver
 
     @classmethod
-    def from_entities(cls, users: List[User]) -> "ListUsersOutput":
-        """Cria um DTO a partir de uma lista de entidades"""
+    def from_entities(
+        cls,
+        users: Iterable[User],
+        next_cursor: Optional[str] = None
+    ) -> "ListUsersOutput":
+        """Cria um DTO a partir de uma sequência de entidades"""
         return cls(
-            users=[UserOutput.from_entity(user) for user in users]
+            users=[UserOutput.from_entity(user) for user in users],
+            next_cursor=next_cursor
         ) 
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+Registro de templates de notificação compilados.
+
+Sintaxe (subconjunto do Mustache, sem escape de HTML):
+    {{ caminho }}            valor da variável; caminhos com pontos acessam
+                             chaves de dicionários ou atributos de objetos
+    {{ caminho | filtro }}   valor passado por um filtro registrado
+    {{# caminho }}...{{/ caminho }}
+                             repete o trecho para cada elemento da lista
+                             (ou uma vez, se o valor for verdadeiro e não
+                             for lista); dentro dele os nomes são buscados
+                             primeiro no elemento e depois nos escopos externos
+
+Cada template é analisado uma única vez e convertido no código-fonte de uma
+função de renderização, como o módulo dataclasses faz com __init__;
+renderizar é só executar essa função.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from src.domain.entities.money import Money
+from src.domain.interfaces.template_renderer import TemplateRenderer
+
+RenderFunction = Callable[[Mapping[str, Any]], str]
+
+_TAG = re.compile(r"\{\{\s*([#/]?)\s*([A-Za-z_][\w.]*)\s*(?:\|\s*([A-Za-z_]\w*)\s*)?\}\}")
+# Linhas que contêm apenas uma tag de seção não geram linha em branco
+_STANDALONE_SECTION = re.compile(r"^[ \t]*(\{\{\s*[#/][^}]*\}\})[ \t]*\r?\n", re.MULTILINE)
+
+_MISSING = object()
+
+
+def format_money(value: Money) -> str:
+    """Formata um valor monetário para exibição"""
+    if value.currency == "BRL":
+        return f"R$ {value.to_decimal():.2f}"
+    return str(value)
+
+
+DEFAULT_FILTERS: Dict[str, Callable[[Any], str]] = {
+    "money": format_money,
+    "upper": lambda value: str(value).upper(),
+    "lower": lambda value: str(value).lower()
+}
+
+
+def _get(value: Any, name: str) -> Any:
+    """Chave de dicionário ou atributo de objeto, sem o isinstance de ABC no caso comum"""
+    if isinstance(value, dict):
+        return value.get(name, _MISSING)
+    result = getattr(value, name, _MISSING)
+    if result is _MISSING and isinstance(value, Mapping):
+        return value.get(name, _MISSING)
+    return result
+
+
+def _missing(path: str) -> KeyError:
+    """Erro de variável ausente no template"""
+    return KeyError(f"Variável de template não encontrada: {path}")
+
+
+def _section(value: Any) -> Any:
+    """Elementos sobre os quais uma seção é repetida"""
+    if isinstance(value, (list, tuple)):
+        return value
+    return (value,) if value else ()
+
+
+def compile_template(
+    source: str,
+    filters: Optional[Mapping[str, Callable[[Any], str]]] = None
+) -> RenderFunction:
+    """
+    Compila o template em uma função render(data) -> str
+
+    Raises:
+        ValueError: Se o template tiver seções desbalanceadas ou filtro desconhecido
+    """
+    filters = DEFAULT_FILTERS if filters is None else filters
+    source = _STANDALONE_SECTION.sub(r"\1", source)
+    namespace: Dict[str, Any] = {
+        "_get": _get, "_missing": _missing, "_section": _section, "_str": str, "_MISSING": _MISSING
+    }
+    lines = ["def render(data):", "    _out = []", "    _append = _out.append"]
+    # Pilha de seções abertas: (caminho, variável do elemento)
+    sections: List[Tuple[str, str]] = []
+    position = 0
+
+    def emit(code: str) -> None:
+        lines.append("    " * (len(sections) + 1) + code)
+
+    def literal(text: str) -> None:
+        if text:
+            name = f"_text{len(namespace)}"
+            namespace[name] = text
+            emit(f"_append({name})")
+
+    def lookup(path: str) -> None:
+        # Busca inline em _value: escopos do mais interno para o mais externo
+        head, *rest = path.split(".")
+        getters = [f"_get({item}, {head!r})" for _, item in reversed(sections)]
+        # data é sempre um Mapping: dispensa o _get
+        getters.append(f"data.get({head!r}, _MISSING)")
+        emit(f"_value = {getters[0]}")
+        for getter in getters[1:]:
+            emit("if _value is _MISSING:")
+            emit(f"    _value = {getter}")
+        for name in rest:
+            emit("if _value is not _MISSING:")
+            emit(f"    _value = _get(_value, {name!r})")
+        emit("if _value is _MISSING:")
+        emit(f"    raise _missing({path!r})")
+
+    for match in _TAG.finditer(source):
+        literal(source[position:match.start()])
+        position = match.end()
+        kind, path, filter_name = match.groups()
+
+        if kind == "#":
+            item = f"_item{len(sections)}"
+            lookup(path)
+            emit(f"for {item} in _section(_value):")
+            sections.append((path, item))
+        elif kind == "/":
+            if not sections or sections[-1][0] != path:
+                raise ValueError(f"Fechamento de seção inesperado: {path}")
+            if lines[-1].endswith(":"):
+                emit("pass")
+            sections.pop()
+        elif filter_name is not None:
+            if filter_name not in filters:
+                raise ValueError(f"Filtro de template desconhecido: {filter_name}")
+            name = f"_filter_{filter_name}"
+            namespace[name] = filters[filter_name]
+            lookup(path)
+            emit(f"_append({name}(_value))")
+        else:
+            lookup(path)
+            emit("_append(_str(_value))")
+
+    if sections:
+        raise ValueError(f"Seção não fechada: {sections[-1][0]}")
+    literal(source[position:])
+    lines.append("    return ''.join(_out)")
+
+    code = "\n".join(lines) + "\n"
+    exec(compile(code, "<template>", "exec"), namespace)
+    render = namespace["render"]
+    render.source = code
+    return render
+
+
+class TemplateRegistry(TemplateRenderer):
+    """
+    Templates registrados por ID, compilados sob demanda
+
+    As funções compiladas ficam em um cache LRU limitado; um template
+    removido do cache é recompilado a partir do texto no próximo uso.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        filters: Optional[Mapping[str, Callable[[Any], str]]] = None
+    ):
+        """
+        Args:
+            max_size: Quantidade máxima de templates compilados em cache
+            filters: Filtros disponíveis nos templates (padrão: DEFAULT_FILTERS)
+        """
+        if max_size <= 0:
+            raise ValueError("Tamanho do cache deve ser maior que zero")
+        self.max_size = max_size
+        self.filters = dict(DEFAULT_FILTERS if filters is None else filters)
+        self.compilations = 0
+        self._sources: Dict[str, str] = {}
+        self._compiled: "OrderedDict[str, RenderFunction]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, template_id: str, source: str) -> None:
+        """
+        Registra (ou substitui) o texto de um template
+
+        Raises:
+            ValueError: Se o template for inválido
+        """
+        render = compile_template(source, self.filters)
+        with self._lock:
+            self._sources[template_id] = source
+            self._store(template_id, render)
+
+    def is_registered(self, template_id: str) -> bool:
+        """Indica se há um template com o ID informado"""
+        return template_id in self._sources
+
+    def get(self, template_id: str) -> RenderFunction:
+        """
+        Retorna a função de renderização do template
+
+        Raises:
+            KeyError: Se o template não estiver registrado
+        """
+        with self._lock:
+            render = self._compiled.get(template_id)
+            if render is not None:
+                self._compiled.move_to_end(template_id)
+                return render
+            source = self._sources.get(template_id)
+        if source is None:
+            raise KeyError(f"Template não registrado: {template_id}")
+        render = compile_template(source, self.filters)
+        with self._lock:
+            self._store(template_id, render)
+        return render
+
+    def render(self, template_id: str, data: Mapping[str, Any]) -> str:
+        """Renderiza o template com os dados informados"""
+        return self.get(template_id)(data)
+
+    def _store(self, template_id: str, render: RenderFunction) -> None:
+        """Guarda a função compilada no LRU (chamado com o lock adquirido)"""
+        self.compilations += 1
+        self._compiled[template_id] = render
+        self._compiled.move_to_end(template_id)
+        while len(self._compiled) > self.max_size:
+            self._compiled.popitem(last=False)
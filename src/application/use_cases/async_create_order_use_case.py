@@ -0,0 +1,123 @@
+"""
+Use case assíncrono para criação de pedidos.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import List, Optional
+
+from src.application.dto.order_dto import CreateOrderInput, OrderOutput
+from src.application.use_cases.create_order_use_case import build_order
+from src.domain.entities.payment import AsyncPaymentProcessor, PaymentInfo
+from src.domain.interfaces.order_repository import OrderRepository
+from src.domain.interfaces.use_case import AsyncUseCase, Response
+
+
+class AsyncCreateOrderUseCase(AsyncUseCase[CreateOrderInput, OrderOutput]):
+    """
+    Use case assíncrono para criar um novo pedido
+
+    O pagamento é aguardado sem bloquear o event loop, com prazo máximo por
+    chamada; vários pedidos podem aguardar pagamento concorrentemente. O
+    repositório é síncrono, então o save roda no executor, fora do loop.
+    """
+
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        payment_processor: AsyncPaymentProcessor,
+        payment_timeout: Optional[float] = 5.0,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            order_repository: Repositório de pedidos
+            payment_processor: Processador de pagamento assíncrono
+            payment_timeout: Prazo de cada pagamento em segundos; None não limita
+            executor: Executor das gravações no repositório; None usa o
+                executor padrão do event loop
+        """
+        self.order_repository = order_repository
+        self.payment_processor = payment_processor
+        self.payment_timeout = payment_timeout
+        self.executor = executor
+
+    async def execute(self, request: CreateOrderInput) -> Response[OrderOutput]:
+        """
+        Executa o use case de criação de pedido
+
+        O cancelamento da tarefa (asyncio.CancelledError) é propagado ao
+        chamador; se ele chegar antes do save, o pedido não é salvo. Um save
+        já iniciado no executor termina mesmo com a tarefa cancelada.
+        """
+        try:
+            # Cria o pedido, calcula o total e valida
+            order = build_order(request)
+
+            # Processa o pagamento respeitando o prazo
+            payment = PaymentInfo(
+                amount=order.total,
+                description=f"Pedido {order.id}"
+            )
+            try:
+                approved = await asyncio.wait_for(
+                    self.payment_processor.process_payment(payment),
+                    timeout=self.payment_timeout
+                )
+            except asyncio.TimeoutError:
+                return Response(
+                    success=False,
+                    error="Tempo limite excedido no processamento do pagamento"
+                )
+
+            if not approved:
+                return Response(
+                    success=False,
+                    error="Falha no processamento do pagamento"
+                )
+
+            # Salva o pedido sem bloquear o event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self.order_repository.save, order)
+
+            # Retorna o DTO de saída
+            return Response(
+                success=True,
+                data=OrderOutput.from_entity(order)
+            )
+
+        except ValueError as e:
+            return Response(
+                success=False,
+                error=str(e)
+            )
+        except Exception as e:
+            return Response(
+                success=False,
+                error=f"Erro ao criar pedido: {str(e)}"
+            )
+
+    async def execute_all(
+        self,
+        requests: List[CreateOrderInput],
+        max_concurrency: Optional[int] = None
+    ) -> List[Response[OrderOutput]]:
+        """
+        Executa vários pedidos concorrentemente no mesmo event loop
+
+        Args:
+            requests: Pedidos a criar
+            max_concurrency: Limite de pagamentos simultâneos; None não limita
+
+        Returns:
+            List[Response[OrderOutput]]: Um resultado por pedido, na ordem de entrada
+        """
+        if max_concurrency is None:
+            return list(await asyncio.gather(*(self.execute(r) for r in requests)))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def limited(request: CreateOrderInput) -> Response[OrderOutput]:
+            async with semaphore:
+                return await self.execute(request)
+
+        return list(await asyncio.gather(*(limited(r) for r in requests)))
@@ -1,55 +1,102 @@
 """
 Use case para criação de pedidos.
 """
+import hashlib
 import uuid
-from decimal import Decimal
+from typing import Optional
 
 from src.application.dto.order_dto import CreateOrderInput, OrderOutput
+from src.domain.interfaces.idempotency_store import IdempotencyStore
 from src.domain.interfaces.order_repository import OrderRepository
 from src.domain.interfaces.use_case import UseCase, Response
-from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem, check_quantity
 from src.domain.entities.payment import PaymentProcessor, PaymentInfo
 
 
+def build_order(request: CreateOrderInput) -> Order:
+    """
+    Converte o DTO de entrada em um pedido com total calculado e validado
+
+    Raises:
+        TypeError: Se alguma quantidade não for int
+        ValueError: Se o pedido for inválido
+    """
+    order = Order(
+        id=str(uuid.uuid4()),
+        items=[
+            OrderItem(
+                product_id=item.product_id,
+                quantity=check_quantity(item.quantity),
+                price=item.price
+            )
+            for item in request.items
+        ],
+        total=Money.zero()
+    )
+    order.calculate_total()
+    order.validate()
+    return order
+
+
+def request_fingerprint(request: CreateOrderInput) -> str:
+    """Hash do conteúdo da requisição, para detectar chaves reutilizadas"""
+    content = repr([
+        (item.product_id, item.quantity, item.price.amount, item.price.currency)
+        for item in request.items
+    ])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class CreateOrderUseCase(UseCase[CreateOrderInput, OrderOutput]):
     """Use case para criar um novo pedido"""
 
     def __init__(
         self,
         order_repository: OrderRepository,
-        payment_processor: PaymentProcessor
+        payment_processor: PaymentProcessor,
+        idempotency_store: Optional[IdempotencyStore] = None
     ):
         self.order_repository = order_repository
         self.payment_processor = payment_processor
+        self.idempotency_store = idempotency_store
 
     def execute(self, request: CreateOrderInput) -> Response[OrderOutput]:
-        """Executa o use case de criação de pedido"""
+        """
+        Executa o use case de criação de pedido
+
+        Com um armazenamento de idempotência configurado, requisições com a
+        mesma idempotency_key criam e cobram o pedido uma única vez e
+        recebem a mesma resposta. Só respostas de sucesso são guardadas:
+        uma recusa de pagamento ou erro temporário pode ser tentado de novo
+        com a mesma chave.
+        """
+        if request.idempotency_key is None or self.idempotency_store is None:
+            return self._create_order(request)
         try:
-            # Converte os DTOs de entrada em entidades
-            order_items = [
-                OrderItem(
-                    product_id=item.product_id,
-                    quantity=item.quantity,
-                    price=item.price
-                )
-                for item in request.items
-            ]
-
-            # Cria o pedido
-            order = Order(
-                id=str(uuid.uuid4()),
-                items=order_items,
-                total=Decimal(0)
+            return self.idempotency_store.run_once(
+                request.idempotency_key,
+                lambda: self._create_order(request),
+                fingerprint=request_fingerprint(request),
+                store_if=lambda response: response.success
+            )
+        except ValueError as e:
+            return Response(success=False, error=str(e))
+        except TimeoutError:
+            return Response(
+                success=False,
+                error="Requisição com a mesma chave de idempotência ainda em andamento"
             )
 
-            # Calcula o total e valida o pedido
-            order.calculate_total()
-            order.validate()
+    def _create_order(self, request: CreateOrderInput) -> Response[OrderOutput]:
+        """Cria, cobra e salva o pedido"""
+        try:
+            # Cria o pedido, calcula o total e valida
+            order = build_order(request)
 
             # Processa o pagamento
             payment = PaymentInfo(
                 amount=order.total,
-                currency="BRL",
                 description=f"Pedido {order.id}"
             )
 
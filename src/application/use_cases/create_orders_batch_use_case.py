@@ -0,0 +1,118 @@
+"""
+Use case para criação de pedidos em lote.
+"""
+from typing import List, Optional, Tuple
+
+from src.application.dto.order_dto import (
+    CreateOrderInput,
+    CreateOrdersBatchInput,
+    CreateOrdersBatchOutput,
+    OrderOutput
+)
+from src.application.use_cases.create_order_use_case import CreateOrderUseCase, build_order
+from src.domain.entities.order import Order
+from src.domain.entities.payment import PaymentInfo, PaymentProcessor
+from src.domain.interfaces.idempotency_store import IdempotencyStore
+from src.domain.interfaces.order_repository import OrderRepository
+from src.domain.interfaces.use_case import UseCase, Response
+
+
+class CreateOrdersBatchUseCase(UseCase[CreateOrdersBatchInput, CreateOrdersBatchOutput]):
+    """
+    Use case para criar vários pedidos de uma vez
+
+    Valida e totaliza todos os pedidos em uma passada, processa os
+    pagamentos com uma única chamada a process_payments e grava os pedidos
+    pagos com um único save_many. Cada pedido recebe seu próprio Response.
+
+    Pedidos com idempotency_key passam um a um pelo CreateOrderUseCase com
+    o armazenamento de idempotência, fora da chamada em lote: um lote
+    repetido não cobra de novo esses pedidos. Sem armazenamento, pedidos
+    com chave são recusados em vez de cobrados sem proteção.
+    """
+
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        payment_processor: PaymentProcessor,
+        idempotency_store: Optional[IdempotencyStore] = None
+    ):
+        self.order_repository = order_repository
+        self.payment_processor = payment_processor
+        self.idempotency_store = idempotency_store
+        self._create_order = CreateOrderUseCase(
+            order_repository,
+            payment_processor,
+            idempotency_store
+        )
+
+    def execute(self, request: CreateOrdersBatchInput) -> Response[CreateOrdersBatchOutput]:
+        """Executa o use case de criação de pedidos em lote"""
+        results: List[Optional[Response[OrderOutput]]] = [None] * len(request.orders)
+
+        # Valida e totaliza todos os pedidos
+        valid: List[Tuple[int, Order]] = []
+        for position, order_input in enumerate(request.orders):
+            if order_input.idempotency_key is not None:
+                results[position] = self._create_keyed_order(order_input)
+                continue
+            try:
+                valid.append((position, build_order(order_input)))
+            except ValueError as e:
+                results[position] = Response(success=False, error=str(e))
+            except Exception as e:
+                # Um pedido malformado não derruba o lote
+                results[position] = Response(
+                    success=False,
+                    error=f"Erro ao criar pedido: {str(e)}"
+                )
+
+        try:
+            # Processa todos os pagamentos em uma chamada
+            approvals = self.payment_processor.process_payments([
+                PaymentInfo(amount=order.total, description=f"Pedido {order.id}")
+                for _, order in valid
+            ])
+            if len(approvals) != len(valid):
+                raise RuntimeError("Quantidade de resultados diferente da de pagamentos")
+
+            paid: List[Tuple[int, Order]] = []
+            for (position, order), approved in zip(valid, approvals):
+                if approved:
+                    paid.append((position, order))
+                else:
+                    results[position] = Response(
+                        success=False,
+                        error="Falha no processamento do pagamento"
+                    )
+
+            # Salva os pedidos pagos com uma única escrita
+            self.order_repository.save_many(order for _, order in paid)
+
+            for position, order in paid:
+                results[position] = Response(
+                    success=True,
+                    data=OrderOutput.from_entity(order)
+                )
+
+        except Exception as e:
+            for position, _ in valid:
+                if results[position] is None:
+                    results[position] = Response(
+                        success=False,
+                        error=f"Erro ao criar pedido: {str(e)}"
+                    )
+
+        return Response(
+            success=True,
+            data=CreateOrdersBatchOutput(results=results)
+        )
+
+    def _create_keyed_order(self, order_input: CreateOrderInput) -> Response[OrderOutput]:
+        """Cria o pedido com chave pelo caminho idempotente de pedido único"""
+        if self.idempotency_store is None:
+            return Response(
+                success=False,
+                error="Chave de idempotência requer um armazenamento de idempotência"
+            )
+        return self._create_order.execute(order_input)
@@ -2,6 +2,8 @@
 Use case para listar usuários.
 """
 from dataclasses import dataclass
+from itertools import islice
+from typing import Optional
 
 from src.application.dto.user_dto import ListUsersOutput
 from src.domain.interfaces.use_case import UseCase, Response
@@ -10,12 +12,13 @@ from src.domain.interfaces.user_repository import UserRepository
 
 @dataclass
 class ListUsersInput:
-    """DTO vazio para entrada do use case de listar usuários"""
-    pass
+    """DTO para entrada do use case de listar usuários"""
+    limit: Optional[int] = None  # Tamanho da página; None lista todos
+    cursor: Optional[str] = None  # ID do último usuário da página anterior
 
 
 class ListUsersUseCase(UseCase[ListUsersInput, ListUsersOutput]):
-    """Use case para listar todos os usuários"""
+    """Use case para listar os usuários, com paginação por cursor"""
 
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
@@ -23,17 +26,36 @@ class ListUsersUseCase(UseCase[ListUsersInput, ListUsersOutput]):
     def execute(self, request: ListUsersInput) -> Response[ListUsersOutput]:
         """Executa o use case de listar usuários"""
         try:
-            # Busca todos os usuários
-            users = self.user_repository.find_all()
+            if request.limit is not None and request.limit <= 0:
+                raise ValueError("Limite deve ser maior que zero")
+
+            if request.limit is None:
+                # Sem paginação: percorre o repositório sem cópia intermediária
+                return Response(
+                    success=True,
+                    data=ListUsersOutput.from_entities(
+                        self.user_repository.iter_users(after=request.cursor)
+                    )
+                )
+
+            # Busca um usuário a mais para saber se existe próxima página
+            users = self.user_repository.iter_users(
+                after=request.cursor,
+                limit=request.limit + 1
+            )
+            output = ListUsersOutput.from_entities(islice(users, request.limit))
+            has_more = next(users, None) is not None
+            if has_more and output.users:
+                output.next_cursor = output.users[-1].id
 
             # Retorna o DTO de saída
             return Response(
                 success=True,
-                data=ListUsersOutput.from_entities(users)
+                data=output
             )
 
         except Exception as e:
             return Response(
                 success=False,
                 error=str(e)
-            ) 
\ No newline at end of file
+            )
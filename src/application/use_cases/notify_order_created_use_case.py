@@ -2,7 +2,7 @@
 Use case para notificar sobre a criação de um pedido.
 """
 from dataclasses import dataclass
-from decimal import Decimal
+from typing import Optional, Tuple, Union
 
 from src.domain.interfaces.use_case import UseCase, Response
 from src.domain.interfaces.notification_service import (
@@ -12,8 +12,43 @@ from src.domain.interfaces.notification_service import (
     NotificationType,
     NotificationResult
 )
+from src.domain.interfaces.notification_dispatcher import NotificationDispatcher, NotificationTicket
 from src.domain.interfaces.notification_factory import NotificationFactory
+from src.domain.interfaces.template_renderer import TemplateRenderer
 from src.domain.entities.order import Order
+from src.application.templates.template_registry import TemplateRegistry
+
+ORDER_CREATED_SUBJECT = "order_created/subject"
+ORDER_CREATED_BODY = "order_created/body"
+
+ORDER_CREATED_TEMPLATES = {
+    ORDER_CREATED_SUBJECT: "Pedido {{order.id}} criado com sucesso!",
+    ORDER_CREATED_BODY: """Olá {{customer_name}},
+
+Seu pedido foi criado com sucesso!
+
+Número do pedido: {{order.id}}
+Total: {{order.total|money}}
+
+Itens do pedido:
+{{#order.items}}
+- {{product_id}}: {{quantity}}x {{price|money}}
+{{/order.items}}
+
+Obrigado por sua compra!"""
+}
+
+
+def register_order_created_templates(registry: TemplateRegistry) -> TemplateRegistry:
+    """Registra os templates de pedido criado que ainda não estiverem no registro"""
+    for template_id, source in ORDER_CREATED_TEMPLATES.items():
+        if not registry.is_registered(template_id):
+            registry.register(template_id, source)
+    return registry
+
+
+# Registro compartilhado: cada template é compilado uma vez por processo
+_default_registry = register_order_created_templates(TemplateRegistry())
 
 
 @dataclass
@@ -26,56 +61,49 @@ class NotifyOrderCreatedInput:
 
 
 class NotifyOrderCreatedUseCase(UseCase[NotifyOrderCreatedInput, NotificationResult]):
-    """Use case para notificar sobre a criação de um pedido"""
+    """
+    Use case para notificar sobre a criação de um pedido
+
+    Com um dispatcher configurado, a notificação é montada no thread
+    chamador e enviada em segundo plano: execute retorna imediatamente uma
+    resposta com o NotificationTicket, pelo qual se aguarda ou consulta o
+    NotificationResult.
+
+    Assunto e corpo vêm de templates compilados uma única vez no
+    TemplateRegistry; por notificação só se executa a função compilada.
+
+    O serviço é pedido à factory a cada execução: use uma factory com cache
+    (NotificationConfig.create_factory() já vem com ele) para que o serviço
+    e suas conexões sejam reutilizados entre chamadas.
+    """
 
     def __init__(
         self,
         notification_factory: NotificationFactory,
-        notification_config: dict
+        notification_config: dict,
+        dispatcher: Optional[NotificationDispatcher] = None,
+        template_registry: Optional[TemplateRegistry] = None
     ):
         self.notification_factory = notification_factory
         self.notification_config = notification_config
+        self.dispatcher = dispatcher
+        self.template_renderer: TemplateRenderer = (
+            register_order_created_templates(template_registry)
+            if template_registry is not None else _default_registry
+        )
 
-    def execute(self, request: NotifyOrderCreatedInput) -> Response[NotificationResult]:
+    def execute(
+        self,
+        request: NotifyOrderCreatedInput
+    ) -> Response[Union[NotificationResult, NotificationTicket]]:
         """Executa o use case"""
         try:
-            # Cria o serviço de notificação usando a factory
-            notification_service = self.notification_factory.create_notification_service(
-                request.notification_type,
-                self.notification_config
-            )
-
-            # Cria o destinatário
-            recipient = NotificationRecipient(
-                identifier=request.customer_email,
-                type=NotificationType.EMAIL,
-                name=request.customer_name
-            )
-
-            # Formata o valor total
-            total = request.order.total
-            if isinstance(total, Decimal):
-                formatted_total = f"R$ {total:.2f}"
-            else:
-                formatted_total = str(total)
-
-            # Cria o conteúdo da notificação
-            content = NotificationContent(
-                subject=f"Pedido {request.order.id} criado com sucesso!",
-                body=f"""
-Olá {request.customer_name},
-
-Seu pedido foi criado com sucesso!
+            notification_service, recipient, content = self._build_notification(request)
 
-Número do pedido: {request.order.id}
-Total: {formatted_total}
-
-Itens do pedido:
-{self._format_order_items(request.order)}
-
-Obrigado por sua compra!
-                """.strip()
-            )
+            if self.dispatcher is not None:
+                # Aceita para envio em segundo plano
+                ticket = self.dispatcher.submit(notification_service, recipient, content)
+                return Response(success=True, data=ticket)
 
             # Envia a notificação
             result = notification_service.send_notification(recipient, content)
@@ -92,16 +120,28 @@ Obrigado por sua compra!
                 error=f"Erro ao enviar notificação: {str(e)}"
             )
 
-    def _format_order_items(self, order: Order) -> str:
-        """Formata os itens do pedido para exibição"""
-        items_text = []
-        for item in order.items:
-            price = (
-                f"R$ {item.price:.2f}"
-                if isinstance(item.price, Decimal)
-                else str(item.price)
-            )
-            items_text.append(
-                f"- {item.product_id}: {item.quantity}x {price}"
-            )
-        return "\n".join(items_text) 
\ No newline at end of file
+    def _build_notification(
+        self,
+        request: NotifyOrderCreatedInput
+    ) -> Tuple[NotificationService, NotificationRecipient, NotificationContent]:
+        """Cria o serviço, o destinatário e o conteúdo da notificação"""
+        # Cria o serviço de notificação usando a factory
+        notification_service = self.notification_factory.create_notification_service(
+            request.notification_type,
+            self.notification_config
+        )
+
+        # Cria o destinatário
+        recipient = NotificationRecipient(
+            identifier=request.customer_email,
+            type=NotificationType.EMAIL,
+            name=request.customer_name
+        )
+
+        # Renderiza o conteúdo com os templates compilados
+        data = {"customer_name": request.customer_name, "order": request.order}
+        content = NotificationContent(
+            subject=self.template_renderer.render(ORDER_CREATED_SUBJECT, data),
+            body=self.template_renderer.render(ORDER_CREATED_BODY, data)
+        )
+        return notification_service, recipient, content
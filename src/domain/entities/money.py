@@ -0,0 +1,93 @@
+"""
+Value object para valores monetários.
+
+O valor é guardado em unidades mínimas inteiras (centavos), de modo que a
+aritmética do caminho quente (somas e multiplicações por quantidade) é
+feita com int. A conversão exata para Decimal acontece apenas nas bordas
+(entrada dos controllers, DTOs de saída e persistência textual).
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+
+DEFAULT_CURRENCY = "BRL"
+
+
+@dataclass(frozen=True, slots=True)
+class Money:
+    """Valor monetário em unidades mínimas inteiras"""
+    amount: int  # Unidades mínimas (ex.: centavos)
+    currency: str = DEFAULT_CURRENCY
+
+    # Casas decimais das unidades mínimas
+    DECIMAL_PLACES = 2
+
+    def __post_init__(self) -> None:
+        # bool é subclasse de int, mas não é um valor monetário
+        if type(self.amount) is not int:
+            raise TypeError(f"Valor em unidades mínimas deve ser int: {self.amount!r}")
+
+    @classmethod
+    def from_decimal(cls, value: Decimal, currency: str = DEFAULT_CURRENCY) -> "Money":
+        """
+        Converte um Decimal (ou string/int) sem perda de precisão
+
+        Raises:
+            ValueError: Se o valor tiver mais casas decimais que o suportado
+        """
+        scaled = Decimal(value).scaleb(cls.DECIMAL_PLACES)
+        amount = int(scaled)
+        if amount != scaled:
+            raise ValueError(
+                f"Valor {value} excede {cls.DECIMAL_PLACES} casas decimais"
+            )
+        return cls(amount, currency)
+
+    @classmethod
+    def zero(cls, currency: str = DEFAULT_CURRENCY) -> "Money":
+        """Retorna o valor zero na moeda informada"""
+        return cls(0, currency)
+
+    def to_decimal(self) -> Decimal:
+        """Converte para Decimal com as casas decimais da moeda"""
+        return Decimal(self.amount).scaleb(-self.DECIMAL_PLACES)
+
+    def _check_currency(self, other: "Money") -> None:
+        if self.currency != other.currency:
+            raise ValueError(
+                f"Moedas diferentes: {self.currency} e {other.currency}"
+            )
+
+    def __add__(self, other: "Money") -> "Money":
+        self._check_currency(other)
+        return Money(self.amount + other.amount, self.currency)
+
+    def __sub__(self, other: "Money") -> "Money":
+        self._check_currency(other)
+        return Money(self.amount - other.amount, self.currency)
+
+    def __mul__(self, quantity: int) -> "Money":
+        # Só quantidades inteiras: float perderia a exatidão das unidades mínimas
+        if type(quantity) is not int:
+            return NotImplemented
+        return Money(self.amount * quantity, self.currency)
+
+    __rmul__ = __mul__
+
+    def __lt__(self, other: "Money") -> bool:
+        self._check_currency(other)
+        return self.amount < other.amount
+
+    def __le__(self, other: "Money") -> bool:
+        self._check_currency(other)
+        return self.amount <= other.amount
+
+    def __gt__(self, other: "Money") -> bool:
+        self._check_currency(other)
+        return self.amount > other.amount
+
+    def __ge__(self, other: "Money") -> bool:
+        self._check_currency(other)
+        return self.amount >= other.amount
+
+    def __str__(self) -> str:
+        return f"{self.to_decimal()} {self.currency}"
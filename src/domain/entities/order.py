@@ -1,39 +1,171 @@
 """
 Entidades de domínio relacionadas a pedidos.
 """
-from dataclasses import dataclass
-from decimal import Decimal
-from typing import List
+from dataclasses import dataclass, replace
+from typing import ClassVar, List, Optional, Tuple
 
+from src.domain.entities.money import Money
+from src.domain.entities.validation import Rule, Validator
 
-@dataclass
+ORDER_VALIDATOR: "Validator[Order]" = Validator([
+    Rule("items", "Pedido deve ter pelo menos um item"),
+    Rule("quantity", "Quantidade de itens deve ser maior que zero", ">", 0, collection="items"),
+    Rule("price.amount", "Preço dos itens deve ser maior que zero", ">", 0, collection="items")
+])
+
+
+def check_quantity(quantity: object) -> int:
+    """
+    Garante que a quantidade é um int (bool é subclasse de int, mas não é quantidade)
+
+    Raises:
+        TypeError: Se a quantidade não for int
+    """
+    if type(quantity) is not int:
+        raise TypeError(f"Quantidade deve ser int: {quantity!r}")
+    return quantity
+
+
+@dataclass(frozen=True)
 class OrderItem:
-    """Item do pedido"""
+    """Item do pedido (imutável; alterações criam um novo item)"""
     product_id: str
     quantity: int
-    price: Decimal
+    price: Money
 
-    def calculate_total(self) -> Decimal:
+    def calculate_total(self) -> Money:
         """Calcula o total do item"""
-        return self.price * Decimal(self.quantity)
+        return self.price * self.quantity
 
 
 @dataclass
 class Order:
-    """Pedido"""
+    """
+    Pedido
+
+    add_item, remove_item e update_quantity mantêm o total em O(1).
+    validate() guarda os itens validados e só refaz as verificações se a
+    lista mudou, inclusive por alterações feitas diretamente em items; como
+    os itens são imutáveis, basta comparar suas identidades. Alterações
+    diretas em items ainda exigem calculate_total().
+    """
+    # Se True, cada alteração confere o total incremental com o recálculo completo
+    debug_totals: ClassVar[bool] = False
+
     id: str
     items: List[OrderItem]
-    total: Decimal
+    total: Money
+
+    def __post_init__(self):
+        # Itens da última validação; atributo comum, fora dos campos do dataclass
+        self._validated_items: Optional[Tuple[OrderItem, ...]] = None
+
+    def __getstate__(self) -> dict:
+        """Serializa só os campos: o pedido restaurado será validado de novo"""
+        state = self.__dict__.copy()
+        state.pop("_validated_items", None)
+        return state
+
+    @classmethod
+    def trusted(cls, id: str, items: List[OrderItem], total: Money) -> "Order":
+        """Cria o pedido já marcado como validado (ex.: lido do armazenamento)"""
+        order = cls(id=id, items=items, total=total)
+        order._validated_items = tuple(items)
+        return order
+
+    def copy(self) -> "Order":
+        """
+        Cópia independente do pedido, preservando o estado de validação
+
+        A lista de itens é nova; os itens, imutáveis, são compartilhados.
+        """
+        clone = Order(id=self.id, items=list(self.items), total=self.total)
+        clone._validated_items = getattr(self, "_validated_items", None)
+        return clone
+
+    @property
+    def dirty(self) -> bool:
+        """Indica se os itens mudaram desde a última validação (O(n))"""
+        return tuple(self.items) != getattr(self, "_validated_items", None)
+
+    def invalidate(self) -> None:
+        """Força a próxima chamada a validate() a refazer as verificações"""
+        self._validated_items = None
+
+    def add_item(self, item: OrderItem) -> None:
+        """
+        Adiciona um item e soma o seu valor ao total
+
+        Raises:
+            ValueError: Se o item estiver em outra moeda
+        """
+        item_total = item.calculate_total()
+        if self.items:
+            self.total = self.total + item_total
+        else:
+            self.total = item_total
+        self.items.append(item)
+        self._changed()
+
+    def remove_item(self, product_id: str) -> OrderItem:
+        """
+        Remove o primeiro item do produto e subtrai o seu valor do total
+
+        Raises:
+            ValueError: Se o produto não estiver no pedido
+        """
+        item = self._find_item(product_id)
+        self.items.remove(item)
+        self.total = self.total - item.calculate_total()
+        self._changed()
+        return item
+
+    def update_quantity(self, product_id: str, quantity: int) -> None:
+        """
+        Altera a quantidade do primeiro item do produto, ajustando o total pela diferença
+
+        Raises:
+            ValueError: Se o produto não estiver no pedido
+        """
+        position = self._find_position(product_id)
+        item = self.items[position]
+        self.total = self.total + item.price * (quantity - item.quantity)
+        self.items[position] = replace(item, quantity=quantity)
+        self._changed()
+
+    def _find_item(self, product_id: str) -> OrderItem:
+        """Retorna o primeiro item do produto"""
+        return self.items[self._find_position(product_id)]
+
+    def _find_position(self, product_id: str) -> int:
+        """Retorna a posição do primeiro item do produto"""
+        for position, item in enumerate(self.items):
+            if item.product_id == product_id:
+                return position
+        raise ValueError(f"Produto {product_id} não está no pedido")
+
+    def _changed(self) -> None:
+        """Em modo debug, confere o total incremental com o recálculo"""
+        if Order.debug_totals:
+            running = self.total
+            self.calculate_total()
+            if running != self.total:
+                raise AssertionError(f"Total incremental {running} difere do recalculado {self.total}")
 
     def calculate_total(self) -> None:
-        """Calcula o total do pedido"""
-        self.total = sum(item.calculate_total() for item in self.items)
+        """Calcula o total do pedido somando as unidades mínimas como int"""
+        currency = self.items[0].price.currency if self.items else self.total.currency
+        amount = 0
+        for item in self.items:
+            if item.price.currency != currency:
+                raise ValueError("Itens do pedido devem usar a mesma moeda")
+            amount += item.price.amount * item.quantity
+        self.total = Money(amount, currency)
 
     def validate(self) -> None:
-        """Valida o pedido"""
-        if not self.items:
-            raise ValueError("Pedido deve ter pelo menos um item")
-        if any(item.quantity <= 0 for item in self.items):
-            raise ValueError("Quantidade de itens deve ser maior que zero")
-        if any(item.price <= 0 for item in self.items):
-            raise ValueError("Preço dos itens deve ser maior que zero") 
\ No newline at end of file
+        """Valida o pedido, se os itens mudaram desde a última validação"""
+        items = tuple(self.items)
+        if items == getattr(self, "_validated_items", None):
+            return
+        ORDER_VALIDATOR.validate(self)
+        self._validated_items = items
@@ -2,18 +2,39 @@
 Este módulo demonstra o Open/Closed Principle (OCP).
 Novas formas de pagamento podem ser adicionadas sem modificar o código existente.
 """
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from decimal import Decimal
+from typing import List
+
+from src.domain.entities.money import Money
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class PaymentInfo:
     """Informações do pagamento"""
-    amount: Decimal
-    currency: str
+    amount: Money
     description: str
 
+    @property
+    def currency(self) -> str:
+        """Moeda do pagamento"""
+        return self.amount.currency
+
+
+def _log_payment(method: str, payment: PaymentInfo) -> None:
+    """Registra o processamento; sem custo de formatação se INFO estiver desligado"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processando pagamento", extra={"fields": {
+            "method": method,
+            "amount": payment.amount.amount,
+            "currency": payment.currency,
+            "description": payment.description
+        }})
+
 
 class PaymentProcessor(ABC):
     """Interface base para processadores de pagamento"""
@@ -23,13 +44,25 @@ class PaymentProcessor(ABC):
         """Processa um pagamento"""
         pass
 
+    def process_payments(self, payments: List[PaymentInfo]) -> List[bool]:
+        """
+        Processa vários pagamentos em uma única chamada
+
+        Implementação padrão que delega para process_payment; processadores
+        cujo gateway aceita lotes devem sobrescrevê-la.
+
+        Returns:
+            List[bool]: Um resultado por pagamento, na ordem de entrada
+        """
+        return [self.process_payment(payment) for payment in payments]
+
 
 class CreditCardProcessor(PaymentProcessor):
     """Processador de pagamentos com cartão de crédito"""
     
     def process_payment(self, payment: PaymentInfo) -> bool:
         """Processa pagamento com cartão de crédito"""
-        print(f"Processando pagamento com cartão de crédito: {payment}")
+        _log_payment("credit_card", payment)
         return True
 
 
@@ -38,7 +71,7 @@ class PayPalProcessor(PaymentProcessor):
     
     def process_payment(self, payment: PaymentInfo) -> bool:
         """Processa pagamento com PayPal"""
-        print(f"Processando pagamento com PayPal: {payment}")
+        _log_payment("paypal", payment)
         return True
 
 
@@ -47,5 +80,52 @@ class PixProcessor(PaymentProcessor):
     
     def process_payment(self, payment: PaymentInfo) -> bool:
         """Processa pagamento com Pix"""
-        print(f"Processando pagamento com Pix: {payment}")
-        return True 
\ No newline at end of file
+        _log_payment("pix", payment)
+        return True
+
+
+class AsyncPaymentProcessor(ABC):
+    """Interface base para processadores de pagamento assíncronos"""
+
+    @abstractmethod
+    async def process_payment(self, payment: PaymentInfo) -> bool:
+        """Processa um pagamento sem bloquear o event loop"""
+        pass
+
+    async def process_payments(self, payments: List[PaymentInfo]) -> List[bool]:
+        """
+        Processa vários pagamentos concorrentemente
+
+        Returns:
+            List[bool]: Um resultado por pagamento, na ordem de entrada
+        """
+        return list(await asyncio.gather(
+            *(self.process_payment(payment) for payment in payments)
+        ))
+
+
+class AsyncCreditCardProcessor(AsyncPaymentProcessor):
+    """Processador assíncrono de pagamentos com cartão de crédito"""
+
+    async def process_payment(self, payment: PaymentInfo) -> bool:
+        """Processa pagamento com cartão de crédito"""
+        _log_payment("credit_card", payment)
+        return True
+
+
+class AsyncPayPalProcessor(AsyncPaymentProcessor):
+    """Processador assíncrono de pagamentos com PayPal"""
+
+    async def process_payment(self, payment: PaymentInfo) -> bool:
+        """Processa pagamento com PayPal"""
+        _log_payment("paypal", payment)
+        return True
+
+
+class AsyncPixProcessor(AsyncPaymentProcessor):
+    """Processador assíncrono de pagamentos com Pix"""
+
+    async def process_payment(self, payment: PaymentInfo) -> bool:
+        """Processa pagamento com Pix"""
+        _log_payment("pix", payment)
+        return True
@@ -5,6 +5,20 @@ Cada classe tem uma única responsabilidade.
 from dataclasses import dataclass
 from datetime import datetime
 
+from src.domain.entities.validation import Rule, Validator
+
+
+def normalize_email(email: str) -> str:
+    """Normaliza o email para comparação (sem espaços e em minúsculas)"""
+    return email.strip().lower()
+
+
+USER_VALIDATOR: "Validator[User]" = Validator([
+    Rule("name", "Nome do usuário não pode estar vazio"),
+    Rule("email", "Email inválido"),
+    Rule("email", "Email inválido", "contains", "@")
+])
+
 
 @dataclass
 class User:
@@ -17,9 +31,16 @@ class User:
     def __post_init__(self):
         self.validate()
 
+    @classmethod
+    def trusted(cls, id: str, name: str, email: str, created_at: datetime) -> "User":
+        """Cria o usuário sem validar, para dados já validados (ex.: lidos do armazenamento)"""
+        user = cls.__new__(cls)
+        user.id = id
+        user.name = name
+        user.email = email
+        user.created_at = created_at
+        return user
+
     def validate(self) -> None:
         """Valida os dados do usuário"""
-        if not self.name:
-            raise ValueError("Nome do usuário não pode estar vazio")
-        if not self.email or "@" not in self.email:
-            raise ValueError("Email inválido") 
\ No newline at end of file
+        USER_VALIDATOR.validate(self) 
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Motor de validação declarativo para as entidades.
+
+Cada entidade declara suas regras como dados (atributo, operação, valor e
+mensagem). O Validator gera, uma única vez, o código-fonte de uma função
+que avalia todas as regras com expressões inline — sem chamadas por regra —
+e percorre cada coleção uma só vez, verificando todas as regras de item no
+mesmo laço, como o módulo dataclasses faz com __init__.
+
+Regras da entidade são verificadas antes das regras de item; em cada grupo
+vence a mensagem da primeira regra declarada que falhar.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Sequence, TypeVar
+
+EntityType = TypeVar("EntityType")
+
+# Operações suportadas e o template da expressão que é verdadeira se a regra passar
+_OPERATIONS = {
+    "truthy": "{path}",
+    "contains": "{value} in {path}",
+    ">": "{path} > {value}",
+    ">=": "{path} >= {value}",
+    "<": "{path} < {value}",
+    "<=": "{path} <= {value}",
+    "==": "{path} == {value}",
+    "!=": "{path} != {value}",
+    "check": "{value}({path})"
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Regra de validação declarativa
+
+    Exemplos:
+        Rule("name", "Nome vazio")                      # name não vazio
+        Rule("price.amount", "Preço inválido", ">", 0, collection="items")
+        Rule("email", "Email inválido", "check", is_valid_email)
+    """
+    field: str  # Atributo verificado; aceita caminho com pontos
+    message: str
+    op: str = "truthy"
+    value: Any = None
+    # Se informado, a regra vale para cada elemento dessa coleção da entidade
+    collection: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ValidationFailure:
+    """Erro de validação de uma entidade em um lote"""
+    index: int
+    message: str
+
+
+def _path(root: str, dotted: str) -> str:
+    """Monta o acesso ao atributo, recusando nomes que não sejam identificadores"""
+    parts = dotted.split(".")
+    if not all(part.isidentifier() for part in parts):
+        raise ValueError(f"Atributo inválido na regra: {dotted}")
+    return ".".join([root, *parts])
+
+
+class Validator(Generic[EntityType]):
+    """Verificador compilado a partir de uma lista de regras"""
+
+    def __init__(self, rules: Sequence[Rule]):
+        """
+        Args:
+            rules: Regras em ordem de prioridade das mensagens
+
+        Raises:
+            ValueError: Se alguma regra usar operação ou atributo inválido
+        """
+        self.rules = tuple(rules)
+        self.source = self._generate_source()
+        namespace: Dict[str, Any] = {}
+        constants = {f"_value{i}": rule.value for i, rule in enumerate(self.rules)}
+        constants["_messages"] = tuple(rule.message for rule in self.rules)
+        exec(compile(self.source, "<validator>", "exec"), constants, namespace)
+        self._check: Callable[[Any], Optional[str]] = namespace["check"]
+
+    def _generate_source(self) -> str:
+        """Gera o código da função check(entity) -> mensagem ou None"""
+        none = len(self.rules)
+        lines = ["def check(entity):"]
+        groups: Dict[str, List[int]] = {}
+        for position, rule in enumerate(self.rules):
+            if rule.op not in _OPERATIONS:
+                raise ValueError(f"Operação de validação não suportada: {rule.op}")
+            if rule.collection is None:
+                condition = self._condition(position, "entity")
+                lines.append(f"    if not ({condition}):")
+                lines.append(f"        return _messages[{position}]")
+            else:
+                groups.setdefault(rule.collection, []).append(position)
+
+        if groups:
+            lines.append(f"    failed = {none}")
+            for collection, positions in groups.items():
+                lines.append(f"    for item in {_path('entity', collection)}:")
+                for position in positions:
+                    condition = self._condition(position, "item")
+                    lines.append(f"        if failed > {position} and not ({condition}):")
+                    lines.append(f"            failed = {position}")
+                    if position == positions[0]:
+                        # Nenhuma regra do grupo tem prioridade maior que esta
+                        lines.append("            break")
+            lines.append(f"    if failed < {none}:")
+            lines.append("        return _messages[failed]")
+        lines.append("    return None")
+        return "\n".join(lines) + "\n"
+
+    def _condition(self, position: int, root: str) -> str:
+        """Expressão verdadeira quando a regra passa"""
+        rule = self.rules[position]
+        return _OPERATIONS[rule.op].format(path=_path(root, rule.field), value=f"_value{position}")
+
+    def first_error(self, entity: EntityType) -> Optional[str]:
+        """Retorna a mensagem do erro mais prioritário, ou None se a entidade for válida"""
+        return self._check(entity)
+
+    def validate(self, entity: EntityType) -> None:
+        """
+        Valida a entidade
+
+        Raises:
+            ValueError: Com a mensagem do erro mais prioritário
+        """
+        message = self._check(entity)
+        if message is not None:
+            raise ValueError(message)
+
+    def validate_many(self, entities: Iterable[EntityType]) -> List[ValidationFailure]:
+        """Valida todas as entidades e retorna os erros de cada uma, na ordem de entrada"""
+        check = self._check
+        return [
+            ValidationFailure(index, message)
+            for index, message in enumerate(map(check, entities))
+            if message is not None
+        ]
@@ -0,0 +1,44 @@
+"""
+Interface para armazenamento de resultados por chave de idempotência.
+"""
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, TypeVar
+
+ResultType = TypeVar("ResultType")
+
+
+class IdempotencyStore(ABC):
+    """Interface para execução única de operações por chave de idempotência"""
+
+    @abstractmethod
+    def run_once(
+        self,
+        key: str,
+        operation: Callable[[], ResultType],
+        fingerprint: Optional[str] = None,
+        store_if: Optional[Callable[[ResultType], bool]] = None
+    ) -> ResultType:
+        """
+        Executa a operação uma única vez por chave
+
+        Uma chamada concorrente com a mesma chave aguarda a execução em
+        andamento e recebe o mesmo resultado; uma chamada posterior recebe o
+        resultado guardado sem executar a operação novamente. Se a operação
+        lançar uma exceção, ou se store_if recusar o resultado, ele não é
+        guardado e a chave fica livre para uma nova tentativa.
+
+        Args:
+            key: Chave de idempotência informada pelo cliente
+            operation: Operação a executar
+            fingerprint: Hash do conteúdo da requisição; a mesma chave com
+                outro conteúdo é recusada
+            store_if: Decide se o resultado é guardado (padrão: sempre)
+
+        Returns:
+            ResultType: Resultado da primeira execução guardada da chave
+
+        Raises:
+            ValueError: Se a chave já foi usada com outro fingerprint
+            TimeoutError: Se a execução em andamento não terminar a tempo
+        """
+        pass
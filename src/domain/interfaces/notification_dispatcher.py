@@ -0,0 +1,61 @@
+"""
+Interface para despacho de notificações em segundo plano.
+"""
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Optional
+
+from src.domain.interfaces.notification_service import (
+    NotificationContent,
+    NotificationRecipient,
+    NotificationResult,
+    NotificationService
+)
+
+
+class NotificationTicket:
+    """Comprovante de uma notificação aceita para envio em segundo plano"""
+
+    def __init__(self, ticket_id: str, future: "Future[NotificationResult]"):
+        self.id = ticket_id
+        self._future = future
+
+    def done(self) -> bool:
+        """Indica se o envio já terminou"""
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> NotificationResult:
+        """
+        Aguarda e retorna o resultado do envio
+
+        Raises:
+            TimeoutError: Se o envio não terminar dentro do timeout
+        """
+        return self._future.result(timeout)
+
+    def __repr__(self) -> str:
+        return f"NotificationTicket(id={self.id!r}, done={self.done()})"
+
+
+class NotificationDispatcher(ABC):
+    """Interface para envio de notificações fora do thread chamador"""
+
+    @abstractmethod
+    def submit(
+        self,
+        service: NotificationService,
+        recipient: NotificationRecipient,
+        content: NotificationContent
+    ) -> NotificationTicket:
+        """
+        Aceita a notificação para envio e retorna imediatamente
+
+        Raises:
+            RuntimeError: Se a fila estiver cheia ou o dispatcher encerrado
+        """
+        pass
+
+    @abstractmethod
+    def get_ticket(self, ticket_id: str) -> Optional[NotificationTicket]:
+        """Retorna um comprovante recente pelo ID, ou None"""
+        pass
@@ -77,4 +77,14 @@ class NotificationService(ABC):
         Returns:
             List[NotificationResult]: Lista com os resultados dos envios
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def close(self) -> None:
+        """
+        Libera os recursos do serviço (conexões, threads etc.)
+
+        O serviço deve continuar utilizável depois, reabrindo os recursos
+        sob demanda: quem o obteve de uma factory com cache pode ainda ter
+        envios pendentes quando ele é removido do cache. Implementação
+        padrão sem efeito; serviços com recursos devem sobrescrevê-la.
+        """
@@ -1,7 +1,7 @@
 """
 Interface para o repositório de pedidos.
 """
-from typing import Protocol, Optional
+from typing import Iterable, List, Protocol, Optional
 
 from src.domain.entities.order import Order
 
@@ -15,4 +15,24 @@ class OrderRepository(Protocol):
 
     def find_by_id(self, order_id: str) -> Optional[Order]:
         """Busca um pedido por ID"""
-        pass 
\ No newline at end of file
+        pass 
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """
+        Salva vários pedidos de uma vez
+
+        Implementação padrão que delega para save; repositórios que suportam
+        gravação em lote devem sobrescrevê-la.
+        """
+        for order in orders:
+            self.save(order)
+
+    def find_many(self, order_ids: Iterable[str]) -> List[Optional[Order]]:
+        """
+        Busca vários pedidos por ID
+
+        Returns:
+            List[Optional[Order]]: Um item por ID, na ordem de entrada,
+            com None para os IDs não encontrados
+        """
+        return [self.find_by_id(order_id) for order_id in order_ids]
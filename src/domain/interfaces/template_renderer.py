@@ -0,0 +1,26 @@
+"""
+Interface para renderização de templates de notificação.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Mapping
+
+
+class TemplateRenderer(ABC):
+    """Interface para renderização de templates por ID"""
+
+    @abstractmethod
+    def render(self, template_id: str, data: Mapping[str, Any]) -> str:
+        """
+        Renderiza o template com os dados informados
+
+        Args:
+            template_id: ID do template registrado
+            data: Variáveis disponíveis no template
+
+        Returns:
+            str: Texto renderizado
+
+        Raises:
+            KeyError: Se o template ou uma variável não existir
+        """
+        pass
@@ -23,4 +23,13 @@ class UseCase(Generic[InputType, OutputType], ABC):
     @abstractmethod
     def execute(self, request: InputType) -> Response[OutputType]:
         """Executa o use case"""
-        pass 
\ No newline at end of file
+        pass
+
+
+class AsyncUseCase(Generic[InputType, OutputType], ABC):
+    """Interface base para use cases assíncronos"""
+
+    @abstractmethod
+    async def execute(self, request: InputType) -> Response[OutputType]:
+        """Executa o use case"""
+        pass
@@ -2,7 +2,7 @@
 Interface para o repositório de usuários.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from src.domain.entities.user import User
 
@@ -12,20 +12,68 @@ class UserRepository(ABC):
     
     @abstractmethod
     def save(self, user: User) -> None:
-        """Salva um usuário"""
+        """
+        Salva um usuário
+
+        Raises:
+            ValueError: Se o email já pertencer a outro usuário
+        """
         pass
 
+    def save_many(self, users: Iterable[User]) -> None:
+        """
+        Salva vários usuários de uma vez
+
+        Implementação padrão que delega para save; repositórios que suportam
+        gravação em lote devem sobrescrevê-la.
+        """
+        for user in users:
+            self.save(user)
+
     @abstractmethod
     def find_by_id(self, user_id: str) -> Optional[User]:
         """Busca um usuário por ID"""
         pass
 
+    def find_many(self, user_ids: Iterable[str]) -> List[Optional[User]]:
+        """
+        Busca vários usuários por ID
+
+        Returns:
+            List[Optional[User]]: Um item por ID, na ordem de entrada,
+            com None para os IDs não encontrados
+        """
+        return [self.find_by_id(user_id) for user_id in user_ids]
+
+    @abstractmethod
+    def find_by_email(self, email: str) -> Optional[User]:
+        """Busca um usuário pelo email (comparação normalizada)"""
+        pass
+
     @abstractmethod
     def find_all(self) -> List[User]:
         """Retorna todos os usuários"""
         pass
 
+    @abstractmethod
+    def iter_users(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[User]:
+        """
+        Percorre os usuários em ordem crescente de ID sem materializar a lista
+
+        Args:
+            after: ID do último usuário já lido (cursor); None começa do início
+            limit: Quantidade máxima de usuários; None percorre até o fim
+
+        Returns:
+            Iterator[User]: Gerador de usuários
+        """
+        pass
+
     @abstractmethod
     def delete(self, user_id: str) -> None:
         """Remove um usuário"""
-        pass 
\ No newline at end of file
+        pass
@@ -0,0 +1,56 @@
+"""
+Configuração do logging da aplicação.
+"""
+import logging
+from typing import Optional, TextIO, Union
+
+from src.infrastructure.services.async_log_handler import AsyncLogHandler
+
+# Logger raiz da aplicação; os módulos usam logging.getLogger(__name__)
+APP_LOGGER = "src"
+
+
+class LoggingConfig:
+    """Configuração do logging da aplicação"""
+
+    @staticmethod
+    def configure(
+        level: Union[int, str] = logging.INFO,
+        stream: Optional[TextIO] = None,
+        capacity: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.05
+    ) -> AsyncLogHandler:
+        """
+        Instala o AsyncLogHandler no logger da aplicação
+
+        Chamadas repetidas substituem o handler anterior, escrevendo antes
+        os registros pendentes. Registros abaixo do nível são descartados
+        em logger.isEnabledFor, antes de qualquer formatação.
+
+        Args:
+            level: Nível mínimo dos registros
+            stream: Destino dos logs (padrão: sys.stderr)
+            capacity: Quantidade máxima de registros aguardando escrita
+            batch_size: Quantidade máxima de registros por escrita
+            flush_interval: Tempo máximo, em segundos, entre escritas
+
+        Returns:
+            AsyncLogHandler: Handler instalado, com os contadores written e dropped
+        """
+        logger = logging.getLogger(APP_LOGGER)
+        for handler in list(logger.handlers):
+            if isinstance(handler, AsyncLogHandler):
+                logger.removeHandler(handler)
+                handler.close()
+
+        handler = AsyncLogHandler(
+            stream=stream,
+            capacity=capacity,
+            batch_size=batch_size,
+            flush_interval=flush_interval
+        )
+        logger.addHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = False
+        return handler
@@ -5,6 +5,7 @@ from typing import Dict, Any
 
 from src.domain.interfaces.notification_factory import NotificationFactory
 from src.infrastructure.factories.notification_factory import (
+    CachingNotificationFactory,
     DefaultNotificationFactory,
     NotificationFactoryWithLogging
 )
@@ -35,12 +36,16 @@ class NotificationConfig:
         }
 
     @staticmethod
-    def create_factory(with_logging: bool = False) -> NotificationFactory:
+    def create_factory(with_logging: bool = False, with_cache: bool = True) -> NotificationFactory:
         """
         Cria uma instância da factory de notificação
         
         Args:
             with_logging: Se True, adiciona logging à factory
+            with_cache: Se True (padrão), reutiliza os serviços criados para
+                o mesmo tipo e configuração; sem o cache, cada chamada cria um
+                serviço novo, com seu próprio pool de conexões SMTP, que
+                precisa ser encerrado com close() por quem o criou
             
         Returns:
             NotificationFactory: Instância configurada da factory
@@ -49,5 +54,8 @@ class NotificationConfig:
         
         if with_logging:
             factory = NotificationFactoryWithLogging(factory)
+
+        if with_cache:
+            factory = CachingNotificationFactory(factory)
         
         return factory 
\ No newline at end of file
@@ -1,13 +1,20 @@
 """
 Implementação concreta da factory de serviços de notificação.
 """
-from typing import Dict, Any
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
 from src.domain.interfaces.notification_factory import NotificationFactory
 from src.domain.interfaces.notification_service import NotificationService
 from src.infrastructure.services.email_notification_service import EmailNotificationService
 from src.infrastructure.services.mock_notification_service import MockNotificationService
 
+logger = logging.getLogger(__name__)
+
 
 class DefaultNotificationFactory(NotificationFactory):
     """Implementação padrão da factory de notificações"""
@@ -36,7 +43,14 @@ class DefaultNotificationFactory(NotificationFactory):
                 smtp_port=config["smtp_port"],
                 smtp_user=config["smtp_user"],
                 smtp_password=config["smtp_password"],
-                default_from_email=config["default_from_email"]
+                default_from_email=config["default_from_email"],
+                pool_size=config.get("pool_size", 4),
+                idle_timeout=config.get("idle_timeout", 60.0),
+                use_tls=config.get("use_tls", True),
+                bulk_chunk_size=config.get("bulk_chunk_size", 100),
+                bulk_concurrency=config.get("bulk_concurrency"),
+                bulk_max_in_flight=config.get("bulk_max_in_flight", 1_000),
+                template_renderer=config.get("template_renderer")
             )
         elif notification_type == "mock":
             return MockNotificationService(
@@ -61,7 +75,115 @@ class NotificationFactoryWithLogging(NotificationFactory):
         config: Dict[str, Any]
     ) -> NotificationService:
         """Cria o serviço e registra a criação"""
-        print(f"Criando serviço de notificação do tipo: {notification_type}")
+        logger.info(
+            "Criando serviço de notificação",
+            extra={"fields": {"notification_type": notification_type}}
+        )
         service = self.factory.create_notification_service(notification_type, config)
-        print(f"Serviço criado com sucesso: {service.__class__.__name__}")
-        return service 
\ No newline at end of file
+        logger.info(
+            "Serviço criado com sucesso",
+            extra={"fields": {"service": service.__class__.__name__}}
+        )
+        return service
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """
+    Hash estável do dicionário de configuração
+
+    Independe da ordem das chaves; valores que não são JSON entram pelo repr.
+    """
+    encoded = json.dumps(config, sort_keys=True, default=repr, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CachingNotificationFactory(NotificationFactory):
+    """
+    Decorator para factory que reutiliza os serviços criados.
+    Cada combinação de tipo e configuração gera uma única instância, de modo
+    que o estado do serviço (conexões, templates compilados) sobrevive entre
+    chamadas. Serviços removidos do cache são encerrados com close(), que
+    libera suas conexões sem invalidá-los: quem ainda guarda uma referência
+    (ex.: um envio na fila do dispatcher) continua enviando normalmente.
+    """
+
+    def __init__(self, factory: NotificationFactory, max_size: int = 32):
+        """
+        Args:
+            factory: Factory que cria os serviços
+            max_size: Quantidade máxima de serviços mantidos; o usado há
+                mais tempo é encerrado quando o limite é excedido
+        """
+        if max_size <= 0:
+            raise ValueError("Tamanho do cache deve ser maior que zero")
+        self.factory = factory
+        self.max_size = max_size
+        self._services: "OrderedDict[Tuple[str, str], NotificationService]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create_notification_service(
+        self,
+        notification_type: str,
+        config: Dict[str, Any]
+    ) -> NotificationService:
+        """Retorna o serviço em cache ou o cria uma única vez"""
+        key = (notification_type, config_fingerprint(config))
+        evicted: List[NotificationService] = []
+        with self._lock:
+            service = self._services.get(key)
+            if service is not None:
+                self._services.move_to_end(key)
+                return service
+            # A criação acontece sob o lock para que cada chave gere uma única
+            # instância; os serviços abrem conexões apenas no primeiro uso
+            service = self.factory.create_notification_service(notification_type, config)
+            self._services[key] = service
+            while len(self._services) > self.max_size:
+                evicted.append(self._services.popitem(last=False)[1])
+        self._close_all(evicted)
+        return service
+
+    def invalidate(
+        self,
+        notification_type: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Remove e encerra serviços do cache
+
+        Args:
+            notification_type: Tipo a remover (None remove todos os tipos)
+            config: Configuração a remover (None remove todas do tipo)
+
+        Returns:
+            int: Quantidade de serviços removidos
+        """
+        fingerprint = config_fingerprint(config) if config is not None else None
+        with self._lock:
+            keys = [
+                key for key in self._services
+                if (notification_type is None or key[0] == notification_type)
+                and (fingerprint is None or key[1] == fingerprint)
+            ]
+            evicted = [self._services.pop(key) for key in keys]
+        self._close_all(evicted)
+        return len(evicted)
+
+    def close(self) -> None:
+        """Encerra todos os serviços em cache"""
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+    @staticmethod
+    def _close_all(services: List[NotificationService]) -> None:
+        """Encerra os serviços removidos, sem deixar uma falha impedir os demais"""
+        for service in services:
+            try:
+                service.close()
+            except Exception:
+                logger.exception(
+                    "Falha ao encerrar serviço de notificação",
+                    extra={"fields": {"service": service.__class__.__name__}}
+                )
@@ -0,0 +1,362 @@
+"""
+Decorators de repositório com cache read-through.
+
+Assim como NotificationFactoryWithLogging envolve uma factory, estes
+repositórios envolvem qualquer implementação (normalmente mais lenta) e
+servem find_by_id a partir de um cache LRU limitado, com TTL opcional.
+Gravações são write-through: o backend é atualizado e o cache recebe a
+nova versão, de modo que o pedido recém-criado é lido sem ir ao backend.
+
+Uma leitura no backend só guarda o resultado se nenhuma gravação da mesma
+chave aconteceu enquanto ela estava em andamento (ver LruCache.begin_load);
+assim um save concorrente nunca é sobrescrito pelo valor antigo.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order
+from src.domain.entities.user import User
+from src.domain.interfaces.order_repository import OrderRepository
+from src.domain.interfaces.user_repository import UserRepository
+
+EntityType = TypeVar("EntityType")
+
+# Marca as buscas negativas (ID inexistente) guardadas no cache
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Contadores do cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class LruCache(Generic[EntityType]):
+    """Cache LRU thread-safe com TTL opcional e cache de buscas negativas"""
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: Optional[float] = None,
+        negative_ttl: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size: Quantidade máxima de entradas
+            ttl: Validade das entradas em segundos; None não expira
+            negative_ttl: Validade das buscas negativas em segundos; 0 desativa
+            clock: Relógio monotônico (injetável para testes)
+        """
+        if max_size <= 0:
+            raise ValueError("Tamanho do cache deve ser maior que zero")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[object, Optional[float]]]" = OrderedDict()
+        # Leituras do backend em andamento: chave -> token da leitura
+        self._loads: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Optional[EntityType]]:
+        """
+        Busca uma entrada no cache
+
+        Returns:
+            Tuple[bool, Optional[EntityType]]: (encontrado, valor); uma busca
+            negativa em cache retorna (True, None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return True, None if value is _MISSING else value
+                del self._entries[key]
+            self.stats.misses += 1
+            return False, None
+
+    def put(self, key: str, value: Optional[EntityType]) -> None:
+        """
+        Guarda uma entrada gravada; None registra uma busca negativa
+
+        Leituras da mesma chave em andamento deixam de ser guardadas.
+        """
+        with self._lock:
+            self._loads.pop(key, None)
+            self._store(key, value)
+
+    def begin_load(self, key: str) -> object:
+        """
+        Registra o início de uma leitura da chave no backend
+
+        Returns:
+            object: Token a ser passado para finish_load
+        """
+        token = object()
+        with self._lock:
+            self._loads[key] = token
+        return token
+
+    def cancel_load(self, key: str, token: object) -> None:
+        """Descarta uma leitura que falhou"""
+        with self._lock:
+            if self._loads.get(key) is token:
+                del self._loads[key]
+
+    def finish_load(self, key: str, value: Optional[EntityType], token: object) -> None:
+        """
+        Guarda o valor lido do backend, a menos que a chave tenha sido
+        gravada ou invalidada depois de begin_load
+        """
+        with self._lock:
+            if self._loads.get(key) is not token:
+                return
+            del self._loads[key]
+            self._store(key, value)
+
+    def _store(self, key: str, value: Optional[EntityType]) -> None:
+        """Guarda a entrada e aplica o limite de tamanho (chamado com o lock)"""
+        if value is None:
+            if self.negative_ttl <= 0:
+                return
+            stored, expires_at = _MISSING, self.clock() + self.negative_ttl
+        else:
+            stored = value
+            expires_at = self.clock() + self.ttl if self.ttl is not None else None
+
+        self._entries[key] = (stored, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Remove uma entrada do cache e descarta as leituras em andamento"""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._loads.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache e descarta as leituras em andamento"""
+        with self._lock:
+            self._entries.clear()
+            self._loads.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachingUserRepository(UserRepository):
+    """Decorator que adiciona cache read-through a um UserRepository"""
+
+    def __init__(self, repository: UserRepository, cache: Optional[LruCache[User]] = None):
+        self.repository = repository
+        self.cache: LruCache[User] = cache if cache is not None else LruCache()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Contadores de hits, misses e evictions"""
+        return self.cache.stats
+
+    def save(self, user: User) -> None:
+        """Grava no backend e atualiza o cache (write-through)"""
+        # Invalidar antes da gravação descarta leituras concorrentes do valor antigo
+        self.cache.invalidate(user.id)
+        try:
+            self.repository.save(user)
+        except Exception:
+            self.cache.invalidate(user.id)
+            raise
+        self.cache.put(user.id, user)
+
+    def save_many(self, users: Iterable[User]) -> None:
+        """Grava o lote no backend e atualiza o cache"""
+        users = list(users)
+        for user in users:
+            self.cache.invalidate(user.id)
+        try:
+            self.repository.save_many(users)
+        except Exception:
+            for user in users:
+                self.cache.invalidate(user.id)
+            raise
+        for user in users:
+            self.cache.put(user.id, user)
+
+    def find_by_id(self, user_id: str) -> Optional[User]:
+        """Busca no cache e, em caso de miss, no backend"""
+        cached, user = self.cache.get(user_id)
+        if cached:
+            return user
+        token = self.cache.begin_load(user_id)
+        try:
+            user = self.repository.find_by_id(user_id)
+        except Exception:
+            self.cache.cancel_load(user_id, token)
+            raise
+        self.cache.finish_load(user_id, user, token)
+        return user
+
+    def find_many(self, user_ids: Iterable[str]) -> List[Optional[User]]:
+        """Busca no cache e consulta o backend apenas para os misses, em lote"""
+        return _find_many_cached(self.cache, self.repository.find_many, user_ids)
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        """
+        Delegado ao backend
+
+        O resultado não aquece o cache por ID: o ID só é conhecido depois da
+        leitura, então não haveria como descartá-la se um save concorrente
+        do mesmo usuário acontecesse durante a consulta.
+        """
+        return self.repository.find_by_email(email)
+
+    def find_all(self) -> List[User]:
+        """Delegado ao backend"""
+        return self.repository.find_all()
+
+    def iter_users(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[User]:
+        """Delegado ao backend"""
+        return self.repository.iter_users(after=after, limit=limit)
+
+    def delete(self, user_id: str) -> None:
+        """Remove do backend e invalida o cache"""
+        self.cache.invalidate(user_id)
+        try:
+            self.repository.delete(user_id)
+        finally:
+            self.cache.invalidate(user_id)
+
+
+class CachingOrderRepository(OrderRepository):
+    """
+    Decorator que adiciona cache read-through a um OrderRepository
+
+    Pedidos são mutáveis (add_item, update_quantity), então o cache guarda
+    uma cópia própria e cada hit devolve outra cópia: alterar o pedido
+    recebido não muda o que os outros leitores veem sem um save.
+
+    As consultas específicas do backend (find_by_product, find_by_total_range,
+    find_all) são repassadas sem cache; chamá-las num backend que não as
+    implementa levanta AttributeError.
+    """
+
+    def __init__(self, repository: OrderRepository, cache: Optional[LruCache[Order]] = None):
+        self.repository = repository
+        self.cache: LruCache[Order] = cache if cache is not None else LruCache()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Contadores de hits, misses e evictions"""
+        return self.cache.stats
+
+    def save(self, order: Order) -> None:
+        """Grava no backend e atualiza o cache (write-through)"""
+        # Invalidar antes da gravação descarta leituras concorrentes do valor antigo
+        self.cache.invalidate(order.id)
+        try:
+            self.repository.save(order)
+        except Exception:
+            self.cache.invalidate(order.id)
+            raise
+        self.cache.put(order.id, order.copy())
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """Grava o lote no backend e atualiza o cache"""
+        orders = list(orders)
+        for order in orders:
+            self.cache.invalidate(order.id)
+        try:
+            self.repository.save_many(orders)
+        except Exception:
+            for order in orders:
+                self.cache.invalidate(order.id)
+            raise
+        for order in orders:
+            self.cache.put(order.id, order.copy())
+
+    def find_by_id(self, order_id: str) -> Optional[Order]:
+        """Busca no cache e, em caso de miss, no backend"""
+        cached, order = self.cache.get(order_id)
+        if cached:
+            return _copy_order(order)
+        token = self.cache.begin_load(order_id)
+        try:
+            order = self.repository.find_by_id(order_id)
+        except Exception:
+            self.cache.cancel_load(order_id, token)
+            raise
+        self.cache.finish_load(order_id, _copy_order(order), token)
+        return order
+
+    def find_many(self, order_ids: Iterable[str]) -> List[Optional[Order]]:
+        """Busca no cache e consulta o backend apenas para os misses, em lote"""
+        return _find_many_cached(self.cache, self.repository.find_many, order_ids, _copy_order)
+
+    def find_by_product(self, product_id: str) -> List[Order]:
+        """Delegado ao backend"""
+        return self.repository.find_by_product(product_id)
+
+    def find_by_total_range(self, min_total: Money, max_total: Money) -> List[Order]:
+        """Delegado ao backend"""
+        return self.repository.find_by_total_range(min_total, max_total)
+
+    def find_all(self) -> List[Order]:
+        """Delegado ao backend"""
+        return self.repository.find_all()
+
+
+def _copy_order(order: Optional[Order]) -> Optional[Order]:
+    """Copia o pedido, preservando None (busca negativa)"""
+    return order.copy() if order is not None else None
+
+
+def _find_many_cached(
+    cache: LruCache[EntityType],
+    load_many: Callable[[List[str]], List[Optional[EntityType]]],
+    ids: Iterable[str],
+    copy: Optional[Callable[[Optional[EntityType]], Optional[EntityType]]] = None
+) -> List[Optional[EntityType]]:
+    """
+    Resolve os IDs pelo cache e carrega os misses com uma única chamada
+
+    Com copy, o cache guarda e devolve cópias das entidades.
+    """
+    ids = list(ids)
+    results: List[Optional[EntityType]] = [None] * len(ids)
+    missing_positions: List[int] = []
+    for position, entity_id in enumerate(ids):
+        cached, entity = cache.get(entity_id)
+        if cached:
+            results[position] = entity if copy is None else copy(entity)
+        else:
+            missing_positions.append(position)
+
+    if missing_positions:
+        missing_ids = [ids[position] for position in missing_positions]
+        tokens = [cache.begin_load(entity_id) for entity_id in missing_ids]
+        try:
+            loaded = load_many(missing_ids)
+        except Exception:
+            for entity_id, token in zip(missing_ids, tokens):
+                cache.cancel_load(entity_id, token)
+            raise
+        for position, entity_id, entity, token in zip(missing_positions, missing_ids, loaded, tokens):
+            results[position] = entity
+            cache.finish_load(entity_id, entity if copy is None else copy(entity), token)
+    return results
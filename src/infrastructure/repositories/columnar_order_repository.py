@@ -0,0 +1,162 @@
+"""
+Implementação colunar e compacta do OrderRepository.
+
+Em vez de manter um objeto OrderItem (com __dict__ e Money) por item,
+os itens ficam em colunas do módulo array:
+- product_codes: int32 com o código do product_id internado
+- quantities: int32
+- prices: int64 com o preço em unidades mínimas (Money.amount)
+
+Cada pedido guarda apenas o início e a quantidade dos seus itens nessas
+colunas, o total e o código da moeda; os objetos Order/OrderItem são
+reconstruídos somente quando acessados via find_by_id.
+
+Regravar um pedido reaproveita as linhas dos seus itens quando os novos
+cabem nelas; as linhas que deixam de ser usadas são contadas e as colunas
+são compactadas quando elas passam a ser maioria.
+"""
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.interfaces.order_repository import OrderRepository
+
+
+class ColumnarOrderRepository(OrderRepository):
+    """Repositório de pedidos em memória com armazenamento colunar"""
+
+    def __init__(self):
+        # Internação dos product_ids e das moedas
+        self.product_ids: List[str] = []
+        self.product_codes_by_id: Dict[str, int] = {}
+        self.currencies: List[str] = []
+        self.currency_codes_by_id: Dict[str, int] = {}
+
+        # Colunas dos itens
+        self.product_codes = array("i")
+        self.quantities = array("i")
+        self.prices = array("q")
+
+        # Colunas dos pedidos
+        self.order_rows: Dict[str, int] = {}
+        self.item_starts = array("q")
+        self.item_counts = array("i")
+        self.totals = array("q")
+        self.order_currencies = array("h")
+
+        # Linhas de itens que nenhum pedido referencia mais
+        self.dead_items = 0
+
+    @staticmethod
+    def _intern(value: str, values: List[str], codes: Dict[str, int]) -> int:
+        """Retorna o código do valor, registrando-o se necessário"""
+        code = codes.get(value)
+        if code is None:
+            code = len(values)
+            values.append(value)
+            codes[value] = code
+        return code
+
+    def save(self, order: Order) -> None:
+        """
+        Salva um pedido gravando seus itens nas colunas
+
+        Raises:
+            ValueError: Se os itens usarem moeda diferente do total
+            OverflowError: Se algum valor não couber no tipo da coluna; nesse
+                caso nenhuma coluna é alterada
+        """
+        currency = order.total.currency
+        if any(item.price.currency != currency for item in order.items):
+            raise ValueError("Itens do pedido devem usar a mesma moeda")
+
+        # Monta as linhas novas antes de alterar as colunas, para que um
+        # valor fora da faixa não deixe as colunas com tamanhos diferentes
+        product_codes = array("i", [
+            self._intern(item.product_id, self.product_ids, self.product_codes_by_id)
+            for item in order.items
+        ])
+        quantities = array("i", [item.quantity for item in order.items])
+        prices = array("q", [item.price.amount for item in order.items])
+        total = array("q", [order.total.amount])[0]
+        currency_code = array("h", [
+            self._intern(currency, self.currencies, self.currency_codes_by_id)
+        ])[0]
+        count = len(quantities)
+
+        row = self.order_rows.get(order.id)
+        if row is not None and count <= self.item_counts[row]:
+            # Os novos itens cabem nas linhas antigas do pedido
+            start = self.item_starts[row]
+            self.product_codes[start:start + count] = product_codes
+            self.quantities[start:start + count] = quantities
+            self.prices[start:start + count] = prices
+            self.dead_items += self.item_counts[row] - count
+        else:
+            if row is not None:
+                self.dead_items += self.item_counts[row]
+            start = len(self.quantities)
+            self.product_codes.extend(product_codes)
+            self.quantities.extend(quantities)
+            self.prices.extend(prices)
+
+        if row is None:
+            self.order_rows[order.id] = len(self.totals)
+            self.item_starts.append(start)
+            self.item_counts.append(count)
+            self.totals.append(total)
+            self.order_currencies.append(currency_code)
+        else:
+            self.item_starts[row] = start
+            self.item_counts[row] = count
+            self.totals[row] = total
+            self.order_currencies[row] = currency_code
+
+        if self.dead_items > len(self.quantities) // 2:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Regrava as colunas de itens sem as linhas não referenciadas"""
+        product_codes, quantities, prices = array("i"), array("i"), array("q")
+        for row in range(len(self.item_starts)):
+            start = self.item_starts[row]
+            end = start + self.item_counts[row]
+            self.item_starts[row] = len(quantities)
+            product_codes.extend(self.product_codes[start:end])
+            quantities.extend(self.quantities[start:end])
+            prices.extend(self.prices[start:end])
+        self.product_codes, self.quantities, self.prices = product_codes, quantities, prices
+        self.dead_items = 0
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """Salva vários pedidos"""
+        for order in orders:
+            self.save(order)
+
+    def find_by_id(self, order_id: str) -> Optional[Order]:
+        """Reconstrói o pedido a partir das colunas"""
+        row = self.order_rows.get(order_id)
+        if row is None:
+            return None
+
+        currency = self.currencies[self.order_currencies[row]]
+        start = self.item_starts[row]
+        end = start + self.item_counts[row]
+        items = [
+            OrderItem(
+                product_id=self.product_ids[code],
+                quantity=quantity,
+                price=Money(price, currency)
+            )
+            for code, quantity, price in zip(
+                self.product_codes[start:end],
+                self.quantities[start:end],
+                self.prices[start:end]
+            )
+        ]
+        return Order.trusted(id=order_id, items=items, total=Money(self.totals[row], currency))
+
+    def find_many(self, order_ids: Iterable[str]) -> List[Optional[Order]]:
+        """Busca vários pedidos por ID, preservando a ordem de entrada"""
+        return [self.find_by_id(order_id) for order_id in order_ids]
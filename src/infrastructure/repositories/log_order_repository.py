@@ -0,0 +1,314 @@
+"""
+Implementação do OrderRepository baseada em log append-only.
+
+Cada gravação acrescenta um registro ao final do arquivo de segmento no
+formato [tamanho: uint32 little-endian][payload JSON]. Um índice em memória
+mapeia o ID do pedido para a posição do seu registro mais recente, e as
+leituras decodificam o payload diretamente de um mmap do segmento.
+
+Os registros gravados depois do último mmap ficam também em um buffer em
+memória (a cauda), de onde são lidos; o mmap só é recriado quando a cauda
+passa de TAIL_LIMIT bytes, e não a cada leitura após uma gravação.
+
+O snapshot do índice é regravado por inteiro, em O(n) para n pedidos. Para
+não travar as gravações, o save só copia o índice e a serialização e o
+fsync rodam em um thread em segundo plano; para que o custo por gravação
+fique amortizado em O(1), o intervalo entre snapshots cresce com o índice
+(ver snapshot_ratio).
+
+O snapshot do índice guarda a identidade (inode) do segmento a que se
+refere; um snapshot de outro segmento (ex.: queda entre a troca do
+segmento compactado e a gravação do novo snapshot) é descartado e o log
+é reaplicado por inteiro.
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.interfaces.order_repository import OrderRepository
+
+_HEADER = struct.Struct("<I")
+
+
+class LogStructuredOrderRepository(OrderRepository):
+    """Repositório de pedidos persistido em um log append-only"""
+
+    LOG_FILE = "orders.log"
+    SNAPSHOT_FILE = "orders.idx"
+    # Tamanho máximo da cauda lida da memória antes de recriar o mmap
+    TAIL_LIMIT = 1 << 20
+
+    def __init__(
+        self,
+        directory: str,
+        snapshot_interval: int = 1000,
+        sync: bool = True,
+        snapshot_ratio: float = 0.5
+    ):
+        """
+        Args:
+            directory: Diretório onde ficam o segmento e o snapshot do índice
+            snapshot_interval: Quantidade mínima de gravações entre snapshots
+                do índice
+            snapshot_ratio: Gravações entre snapshots como fração do tamanho
+                do índice; mantém o custo dos snapshots amortizado em O(1)
+                por gravação, ao preço de reaplicar até essa fração do
+                índice na abertura
+            sync: Se True, cada save/save_many só retorna após os registros
+                chegarem ao disco (os.fsync); False troca durabilidade por vazão
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, self.LOG_FILE)
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_ratio = snapshot_ratio
+        self.sync = sync
+
+        # ID do pedido -> (offset do payload, tamanho do payload)
+        self.index: Dict[str, Tuple[int, int]] = {}
+        # Bytes ocupados por registros substituídos, recuperáveis com compact()
+        self.dead_bytes = 0
+
+        self._log_size = 0
+        self._writes_since_snapshot = 0
+        self._map: Optional[mmap.mmap] = None
+        self._map_size = 0
+        # Registros gravados após o fim do mmap (a partir de _map_size)
+        self._tail = bytearray()
+        # Snapshot periódico em andamento e o erro do último, se houver
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._snapshot_error: Optional[BaseException] = None
+        self._log = open(self.log_path, "ab")
+        self._load()
+
+    @staticmethod
+    def _encode(order: Order) -> bytes:
+        """Serializa o pedido no payload do registro"""
+        return json.dumps({
+            "id": order.id,
+            "total": [order.total.amount, order.total.currency],
+            "items": [
+                [item.product_id, item.quantity, item.price.amount, item.price.currency]
+                for item in order.items
+            ]
+        }, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _decode(payload: str) -> Order:
+        """Reconstrói o pedido a partir do payload do registro"""
+        data = json.loads(payload)
+        return Order.trusted(
+            id=data["id"],
+            items=[
+                OrderItem(product_id=product_id, quantity=quantity, price=Money(amount, currency))
+                for product_id, quantity, amount, currency in data["items"]
+            ],
+            total=Money(*data["total"])
+        )
+
+    def _remap(self) -> None:
+        """Recria o mmap para enxergar os registros acrescentados ao segmento"""
+        self._log.flush()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._map_size = os.path.getsize(self.log_path)
+        self._tail.clear()
+        if self._map_size:
+            with open(self.log_path, "rb") as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read_payload(self, offset: int, length: int) -> str:
+        """Decodifica o payload direto do mmap (ou da cauda), sem copiar para bytes"""
+        if offset >= self._map_size:
+            start = offset - self._map_size
+            with memoryview(self._tail)[start:start + length] as view:
+                return str(view, "utf-8")
+        with memoryview(self._map)[offset:offset + length] as view:
+            return str(view, "utf-8")
+
+    def _index_record(self, order_id: str, offset: int, length: int) -> None:
+        """Aponta o índice para o novo registro, contabilizando o anterior"""
+        previous = self.index.get(order_id)
+        if previous is not None:
+            self.dead_bytes += _HEADER.size + previous[1]
+        self.index[order_id] = (offset, length)
+
+    def _load(self) -> None:
+        """Carrega o snapshot do índice e reaplica apenas a cauda do log"""
+        self._log_size = os.path.getsize(self.log_path)
+        replay_from = 0
+
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as file:
+                snapshot = json.load(file)
+            # Um snapshot de outro segmento ou à frente do log (ex.: log
+            # truncado) é descartado
+            if (
+                snapshot.get("log_inode") == os.stat(self.log_path).st_ino
+                and snapshot["log_offset"] <= self._log_size
+            ):
+                replay_from = snapshot["log_offset"]
+                self.dead_bytes = snapshot["dead_bytes"]
+                self.index = {
+                    order_id: (offset, length)
+                    for order_id, (offset, length) in snapshot["index"].items()
+                }
+
+        self._remap()
+        offset = replay_from
+        while offset + _HEADER.size <= self._map_size:
+            (length,) = _HEADER.unpack_from(self._map, offset)
+            payload_offset = offset + _HEADER.size
+            if payload_offset + length > self._map_size:
+                break
+            order_id = json.loads(self._read_payload(payload_offset, length))["id"]
+            self._index_record(order_id, payload_offset, length)
+            offset = payload_offset + length
+
+        if offset < self._log_size:
+            # Registro parcial no final (gravação interrompida): descarta
+            self._map.close()
+            self._map = None
+            self._log.truncate(offset)
+            self._log_size = offset
+            self._remap()
+
+    def write_snapshot(self) -> None:
+        """Grava atomicamente o snapshot do índice em disco, no thread chamador"""
+        self._wait_snapshot()
+        self._store_snapshot(self._capture_snapshot())
+
+    def _capture_snapshot(self) -> dict:
+        """Copia o estado do índice que o snapshot vai gravar"""
+        self._log.flush()
+        self._writes_since_snapshot = 0
+        return {
+            "log_inode": os.fstat(self._log.fileno()).st_ino,
+            "log_offset": self._log_size,
+            "dead_bytes": self.dead_bytes,
+            "index": self.index.copy()
+        }
+
+    def _store_snapshot(self, snapshot: dict) -> None:
+        """Serializa o snapshot em um arquivo temporário e o publica com os.replace"""
+        temporary_path = f"{self.snapshot_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+
+    def _store_snapshot_in_background(self, snapshot: dict) -> None:
+        """Corpo do thread de snapshot: guarda o erro para o próximo _wait_snapshot"""
+        try:
+            self._store_snapshot(snapshot)
+        except BaseException as e:
+            self._snapshot_error = e
+
+    def _start_snapshot(self) -> None:
+        """Inicia um snapshot em segundo plano, se nenhum estiver em andamento"""
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            return
+        self._snapshot_thread = threading.Thread(
+            target=self._store_snapshot_in_background,
+            args=(self._capture_snapshot(),),
+            name="order-log-snapshot",
+            daemon=True
+        )
+        self._snapshot_thread.start()
+
+    def _wait_snapshot(self) -> None:
+        """
+        Aguarda o snapshot em segundo plano
+
+        Raises:
+            Exception: O erro do snapshot em segundo plano, se ele falhou
+        """
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+        error, self._snapshot_error = self._snapshot_error, None
+        if error is not None:
+            raise error
+
+    def save(self, order: Order) -> None:
+        """Acrescenta o pedido ao final do log"""
+        self.save_many([order])
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """Acrescenta vários pedidos ao log com um único flush (e fsync)"""
+        for order in orders:
+            payload = self._encode(order)
+            header = _HEADER.pack(len(payload))
+            self._log.write(header)
+            self._log.write(payload)
+            self._tail += header
+            self._tail += payload
+            self._index_record(order.id, self._log_size + _HEADER.size, len(payload))
+            self._log_size += _HEADER.size + len(payload)
+            self._writes_since_snapshot += 1
+        self._log.flush()
+        if self.sync:
+            os.fsync(self._log.fileno())
+
+        if len(self._tail) > self.TAIL_LIMIT:
+            self._remap()
+
+        if self._writes_since_snapshot >= self._snapshot_threshold():
+            self._start_snapshot()
+
+    def _snapshot_threshold(self) -> int:
+        """Gravações necessárias antes do próximo snapshot"""
+        return max(self.snapshot_interval, int(len(self.index) * self.snapshot_ratio))
+
+    def find_by_id(self, order_id: str) -> Optional[Order]:
+        """Busca um pedido pelo índice de offsets"""
+        entry = self.index.get(order_id)
+        if entry is None:
+            return None
+        return self._decode(self._read_payload(*entry))
+
+    def compact(self) -> None:
+        """Reescreve o segmento mantendo apenas a versão mais recente de cada pedido"""
+        self._wait_snapshot()
+        self._remap()
+        compacted_path = f"{self.log_path}.compact"
+        new_index: Dict[str, Tuple[int, int]] = {}
+        new_size = 0
+
+        with open(compacted_path, "wb") as file:
+            for order_id, (offset, length) in sorted(self.index.items(), key=lambda e: e[1][0]):
+                record_offset = offset - _HEADER.size
+                with memoryview(self._map)[record_offset:offset + length] as record:
+                    file.write(record)
+                new_index[order_id] = (new_size + _HEADER.size, length)
+                new_size += _HEADER.size + length
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._log.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        os.replace(compacted_path, self.log_path)
+
+        self._log = open(self.log_path, "ab")
+        self._log_size = new_size
+        self.index = new_index
+        self.dead_bytes = 0
+        self._remap()
+        self.write_snapshot()
+
+    def close(self) -> None:
+        """Grava o snapshot final e libera o arquivo e o mmap"""
+        self.write_snapshot()
+        self._log.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
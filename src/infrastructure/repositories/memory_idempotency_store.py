@@ -0,0 +1,123 @@
+"""
+Implementação em memória do IdempotencyStore.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+from src.domain.interfaces.idempotency_store import IdempotencyStore, ResultType
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """
+    Armazenamento limitado, com TTL, de execuções em andamento e concluídas
+
+    Execuções em andamento e resultados concluídos ficam em dicionários
+    separados. Os concluídos são guardados em ordem de conclusão, que é
+    também a ordem de expiração; descartar o mais antigo é um popitem do
+    início, O(1) por requisição mesmo com o armazenamento cheio. Execuções
+    em andamento nunca são descartadas, mas são limitadas a max_in_flight.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 24 * 60 * 60,
+        wait_timeout: Optional[float] = None,
+        max_in_flight: int = 10_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size: Quantidade máxima de chaves concluídas guardadas
+            ttl: Validade dos resultados concluídos, em segundos
+            wait_timeout: Tempo máximo que uma chamada duplicada aguarda a
+                execução em andamento; None aguarda indefinidamente
+            max_in_flight: Quantidade máxima de chaves em execução ao mesmo
+                tempo; além dela, chaves novas são recusadas
+            clock: Relógio monotônico (injetável para testes)
+        """
+        if max_size <= 0:
+            raise ValueError("Tamanho do armazenamento deve ser maior que zero")
+        if max_in_flight <= 0:
+            raise ValueError("Limite de execuções em andamento deve ser maior que zero")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.max_in_flight = max_in_flight
+        self.clock = clock
+        # Chave -> (Future do resultado, fingerprint)
+        self._in_flight: Dict[str, Tuple[Future, Optional[str]]] = {}
+        # Chave -> (Future do resultado, expiração, fingerprint), da mais antiga
+        self._completed: "OrderedDict[str, Tuple[Future, float, Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def run_once(
+        self,
+        key: str,
+        operation: Callable[[], ResultType],
+        fingerprint: Optional[str] = None,
+        store_if: Optional[Callable[[ResultType], bool]] = None
+    ) -> ResultType:
+        """
+        Executa a operação uma única vez por chave
+
+        Raises:
+            RuntimeError: Se já houver max_in_flight chaves em execução
+        """
+        with self._lock:
+            self._expire()
+            entry = self._in_flight.get(key)
+            if entry is None:
+                completed = self._completed.get(key)
+                if completed is not None:
+                    entry = (completed[0], completed[2])
+            if entry is not None:
+                future, stored_fingerprint = entry
+                if stored_fingerprint != fingerprint:
+                    raise ValueError("Chave de idempotência já usada com outra requisição")
+                owner = False
+            else:
+                if len(self._in_flight) >= self.max_in_flight:
+                    raise RuntimeError("Limite de requisições idempotentes em andamento atingido")
+                future = Future()
+                self._in_flight[key] = (future, fingerprint)
+                owner = True
+
+        if not owner:
+            return future.result(timeout=self.wait_timeout)
+
+        try:
+            result = operation()
+        except BaseException as e:
+            # A falha não é guardada: a chave pode ser tentada novamente
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            if store_if is None or store_if(result):
+                self._completed[key] = (future, self.clock() + self.ttl, fingerprint)
+                self._completed.move_to_end(key)
+                while len(self._completed) > self.max_size:
+                    self._completed.popitem(last=False)
+            # Se store_if recusar, chamadas concorrentes recebem o resultado, mas ele não é guardado
+        future.set_result(result)
+        return result
+
+    def _expire(self) -> None:
+        """Remove, do início, os resultados expirados (chamado com o lock)"""
+        now = self.clock()
+        completed = self._completed
+        while completed:
+            key = next(iter(completed))
+            if completed[key][1] > now:
+                break
+            del completed[key]
+
+    def __len__(self) -> int:
+        return len(self._in_flight) + len(self._completed)
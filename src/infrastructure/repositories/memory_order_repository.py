@@ -1,22 +1,225 @@
 """
 Implementação em memória do OrderRepository.
 """
-from typing import Dict, Optional
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 from src.domain.interfaces.order_repository import OrderRepository
-from src.domain.order import Order
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order
+from src.infrastructure.repositories.snapshot import paused_gc, read_snapshot, write_snapshot
+
+# Entrada do índice de totais: (moeda, total em unidades mínimas, ID do pedido)
+TotalKey = Tuple[str, int, str]
+_CURRENCY_AND_AMOUNT = itemgetter(0, 1)
+
+
+def _index_keys(order: Order) -> Tuple[TotalKey, FrozenSet[str]]:
+    """Chaves do pedido nos índices"""
+    total_key = (order.total.currency, order.total.amount, order.id)
+    return total_key, frozenset(item.product_id for item in order.items)
+
+
+class _SortedBlocks:
+    """
+    Lista ordenada dividida em blocos de até 2 * BLOCK_SIZE chaves
+
+    Inserção e remoção localizam o bloco por bisect sobre o maior elemento
+    de cada bloco e deslocam só aquele bloco: O(log n + BLOCK_SIZE), em vez
+    do deslocamento da lista inteira de um insort.
+    """
+
+    BLOCK_SIZE = 512
+
+    def __init__(self, sorted_keys: Iterable[TotalKey] = ()):
+        keys = list(sorted_keys)
+        size = self.BLOCK_SIZE
+        self._blocks: List[List[TotalKey]] = [keys[i:i + size] for i in range(0, len(keys), size)]
+        self._maxes: List[TotalKey] = [block[-1] for block in self._blocks]
+        self._len = len(keys)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[TotalKey]:
+        for block in self._blocks:
+            yield from block
+
+    def add(self, key: TotalKey) -> None:
+        """Insere a chave na posição ordenada"""
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        position = bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            position -= 1
+            block = self._blocks[position]
+            block.append(key)
+            self._maxes[position] = key
+        else:
+            block = self._blocks[position]
+            insort(block, key)
+        if len(block) > 2 * self.BLOCK_SIZE:
+            # Divide o bloco: a segunda metade fica com o maior elemento atual
+            self._blocks.insert(position + 1, block[self.BLOCK_SIZE:])
+            del block[self.BLOCK_SIZE:]
+            self._maxes.insert(position, block[-1])
+
+    def remove(self, key: TotalKey) -> None:
+        """Remove a chave, que deve estar presente"""
+        position = bisect_left(self._maxes, key)
+        block = self._blocks[position]
+        del block[bisect_left(block, key)]
+        self._len -= 1
+        if not block:
+            del self._blocks[position]
+            del self._maxes[position]
+        else:
+            self._maxes[position] = block[-1]
+
+    def irange(self, low: tuple, high: tuple, key: Callable[[TotalKey], tuple]) -> Iterator[TotalKey]:
+        """Percorre, em ordem, as chaves com low <= key(chave) <= high"""
+        first = bisect_left(self._maxes, low, key=key)
+        for position in range(first, len(self._blocks)):
+            block = self._blocks[position]
+            start = bisect_left(block, low, key=key) if position == first else 0
+            end = bisect_right(block, high, key=key)
+            yield from block[start:end]
+            if end < len(block):
+                return
 
 
 class InMemoryOrderRepository(OrderRepository):
-    """Implementação em memória do repositório de pedidos"""
+    """
+    Implementação em memória do repositório de pedidos
+
+    Mantém, de forma incremental a cada save, dois índices de consulta:
+    - índice invertido product_id -> IDs dos pedidos que contêm o produto
+    - lista ordenada de (moeda, total em unidades mínimas, ID) para
+      consultas por faixa de valor; pedidos em moedas diferentes convivem
+      sem que seus totais sejam comparados entre si
+
+    Complexidade do save: O(p + log n + B), sendo p a quantidade de produtos
+    do pedido e B o tamanho de bloco da lista de totais (_SortedBlocks).
+    """
     
     def __init__(self):
         self.orders: Dict[str, Order] = {}
+        self.product_index: Dict[str, Set[str]] = {}
+        self.totals = _SortedBlocks()
+        # Chaves indexadas de cada pedido, para remover as entradas antigas
+        # mesmo que o objeto tenha sido alterado após o save
+        self._indexed_keys: Dict[str, Tuple[TotalKey, FrozenSet[str]]] = {}
+
+    def _unindex(self, order_id: str) -> None:
+        """Remove as entradas do pedido dos índices"""
+        keys = self._indexed_keys.pop(order_id, None)
+        if keys is None:
+            return
+        total_key, product_ids = keys
+        for product_id in product_ids:
+            order_ids = self.product_index[product_id]
+            order_ids.discard(order_id)
+            if not order_ids:
+                del self.product_index[product_id]
+        self.totals.remove(total_key)
+
+    def _index(self, order: Order, keys: Tuple[TotalKey, FrozenSet[str]]) -> None:
+        """Adiciona o pedido aos índices"""
+        total_key, product_ids = keys
+        for product_id in product_ids:
+            self.product_index.setdefault(product_id, set()).add(order.id)
+        self.totals.add(total_key)
+        self._indexed_keys[order.id] = keys
 
     def save(self, order: Order) -> None:
-        """Salva um pedido na memória"""
+        """Salva um pedido na memória, atualizando os índices"""
+        # Tudo que pode falhar é calculado antes de alterar o estado
+        keys = _index_keys(order)
+        self._unindex(order.id)
         self.orders[order.id] = order
+        self._index(order, keys)
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """
+        Salva vários pedidos, atualizando os índices
+
+        As chaves de todos os pedidos são calculadas antes de alterar o
+        estado, então uma chave inválida não deixa o lote pela metade.
+        """
+        batch = [(order, _index_keys(order)) for order in orders]
+        for order, keys in batch:
+            self._unindex(order.id)
+            self.orders[order.id] = order
+            self._index(order, keys)
 
     def find_by_id(self, order_id: str) -> Optional[Order]:
         """Busca um pedido por ID na memória"""
-        return self.orders.get(order_id) 
\ No newline at end of file
+        return self.orders.get(order_id)
+
+    def find_many(self, order_ids: Iterable[str]) -> List[Optional[Order]]:
+        """Busca vários pedidos por ID, preservando a ordem de entrada"""
+        return list(map(self.orders.get, order_ids))
+
+    def find_by_product(self, product_id: str) -> List[Order]:
+        """
+        Busca os pedidos que contêm o produto
+
+        Complexidade: O(k), sendo k a quantidade de pedidos retornados.
+        """
+        return [self.orders[order_id] for order_id in self.product_index.get(product_id, ())]
+
+    def find_by_total_range(self, min_total: Money, max_total: Money) -> List[Order]:
+        """
+        Busca os pedidos com total entre min_total e max_total (inclusive),
+        em ordem crescente de total
+
+        Complexidade: O(log n + B + k), sendo k a quantidade de pedidos retornados
+        e B o tamanho de bloco da lista de totais.
+        """
+        if min_total.currency != max_total.currency:
+            raise ValueError(f"Moedas diferentes: {min_total.currency} e {max_total.currency}")
+        currency = min_total.currency
+        keys = self.totals.irange(
+            (currency, min_total.amount),
+            (currency, max_total.amount),
+            key=_CURRENCY_AND_AMOUNT
+        )
+        return [self.orders[order_id] for _, _, order_id in keys]
+
+    def snapshot(self, path: str) -> None:
+        """
+        Grava um snapshot binário dos pedidos
+
+        A serialização trabalha sobre uma cópia da lista de pedidos, então
+        leituras concorrentes não ficam bloqueadas nem veem o dicionário
+        mudar de tamanho durante a gravação.
+        """
+        write_snapshot(path, "orders", list(self.orders.values()))
+
+    def restore(self, path: str) -> None:
+        """Substitui o conteúdo do repositório pelo snapshot, reconstruindo os índices"""
+        with paused_gc():
+            orders: List[Order] = read_snapshot(path, "orders")
+            product_index: Dict[str, Set[str]] = {}
+            indexed_keys: Dict[str, Tuple[TotalKey, FrozenSet[str]]] = {}
+            totals = []
+            for order in orders:
+                keys = _index_keys(order)
+                total_key, product_ids = keys
+                for product_id in product_ids:
+                    product_index.setdefault(product_id, set()).add(order.id)
+                indexed_keys[order.id] = keys
+                totals.append(total_key)
+            # Uma única ordenação em vez de n inserções ordenadas
+            totals.sort()
+            sorted_totals = _SortedBlocks(totals)
+
+        # Os índices são trocados juntos, já completos
+        self.orders = {order.id: order for order in orders}
+        self.product_index = product_index
+        self._indexed_keys = indexed_keys
+        self.totals = sorted_totals
@@ -1,10 +1,27 @@
 """
 Implementação em memória do UserRepository.
 """
-from typing import Dict, List, Optional
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional
 
-from src.domain.entities.user import User
+from src.domain.entities.user import User, normalize_email
 from src.domain.interfaces.user_repository import UserRepository
+from src.infrastructure.repositories.snapshot import paused_gc, read_snapshot, write_snapshot
+
+
+def merge_pending_ids(sorted_ids: List[str], pending_ids: List[str]) -> List[str]:
+    """
+    Retorna uma nova lista ordenada com os IDs pendentes intercalados
+
+    Os IDs intercalados são retirados de pending_ids; os acrescentados durante
+    a intercalação ficam para a próxima. O timsort aproveita o trecho já
+    ordenado: O(n + k log k) para k IDs pendentes.
+    """
+    count = len(pending_ids)
+    merged = sorted_ids + pending_ids[:count]
+    merged.sort()
+    del pending_ids[:count]
+    return merged
 
 
 class InMemoryUserRepository(UserRepository):
@@ -12,20 +29,140 @@ class InMemoryUserRepository(UserRepository):
     
     def __init__(self):
         self.users: Dict[str, User] = {}
+        # Índice secundário: email normalizado -> id do usuário
+        self.email_index: Dict[str, str] = {}
+        # IDs ordenados, usados na paginação por cursor. IDs novos entram
+        # em _pending_ids em O(1) e são intercalados na próxima leitura
+        # ordenada: n inserções custam O(n log n) no total, não O(n²)
+        self.sorted_ids: List[str] = []
+        self._pending_ids: List[str] = []
 
     def save(self, user: User) -> None:
-        """Salva um usuário na memória"""
+        """Salva um usuário na memória mantendo os índices"""
+        email_key = normalize_email(user.email)
+        owner_id = self.email_index.get(email_key)
+        if owner_id is not None and owner_id != user.id:
+            raise ValueError("Email já cadastrado")
+
+        previous = self.users.get(user.id)
+        if previous is None:
+            self._pending_ids.append(user.id)
+        else:
+            # Remove a entrada antiga caso o usuário tenha trocado de email
+            previous_key = normalize_email(previous.email)
+            if previous_key != email_key:
+                del self.email_index[previous_key]
+
         self.users[user.id] = user
+        self.email_index[email_key] = user.id
+
+    def save_many(self, users: Iterable[User]) -> None:
+        """
+        Salva vários usuários de uma vez (tudo ou nada)
+
+        O lote inteiro é validado antes de qualquer alteração, então um email
+        duplicado não deixa gravações parciais.
+        """
+        # Em caso de IDs repetidos no lote, prevalece a última versão
+        batch: Dict[str, User] = {user.id: user for user in users}
+
+        batch_owners: Dict[str, str] = {}
+        for user_id, user in batch.items():
+            email_key = normalize_email(user.email)
+            if batch_owners.setdefault(email_key, user_id) != user_id:
+                raise ValueError("Email já cadastrado")
+            owner_id = self.email_index.get(email_key)
+            # O dono atual só libera o email se também estiver no lote
+            if owner_id is not None and owner_id != user_id and owner_id not in batch:
+                raise ValueError("Email já cadastrado")
+
+        new_ids = []
+        for user_id in batch:
+            previous = self.users.get(user_id)
+            if previous is None:
+                new_ids.append(user_id)
+            else:
+                self.email_index.pop(normalize_email(previous.email), None)
+
+        self.users.update(batch)
+        self.email_index.update(batch_owners)
+        self._pending_ids.extend(new_ids)
+
+    def _sorted_ids(self) -> List[str]:
+        """Intercala os IDs pendentes e retorna a lista ordenada"""
+        if self._pending_ids:
+            self.sorted_ids = merge_pending_ids(self.sorted_ids, self._pending_ids)
+        return self.sorted_ids
 
     def find_by_id(self, user_id: str) -> Optional[User]:
         """Busca um usuário por ID na memória"""
         return self.users.get(user_id)
 
+    def find_many(self, user_ids: Iterable[str]) -> List[Optional[User]]:
+        """Busca vários usuários por ID, preservando a ordem de entrada"""
+        return list(map(self.users.get, user_ids))
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        """Busca um usuário pelo email usando o índice secundário"""
+        user_id = self.email_index.get(normalize_email(email))
+        if user_id is None:
+            return None
+        return self.users.get(user_id)
+
     def find_all(self) -> List[User]:
         """Retorna todos os usuários"""
         return list(self.users.values())
 
+    def iter_users(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[User]:
+        """Percorre os usuários a partir do cursor sem copiar a tabela"""
+        remaining = limit
+        cursor = after
+        while remaining is None or remaining > 0:
+            # Reposiciona pelo cursor a cada passo, tolerando alterações concorrentes
+            sorted_ids = self._sorted_ids()
+            position = 0 if cursor is None else bisect_right(sorted_ids, cursor)
+            if position >= len(sorted_ids):
+                return
+            cursor = sorted_ids[position]
+            user = self.users.get(cursor)
+            if user is None:
+                continue
+            yield user
+            if remaining is not None:
+                remaining -= 1
+
     def delete(self, user_id: str) -> None:
-        """Remove um usuário da memória"""
-        if user_id in self.users:
-            del self.users[user_id] 
\ No newline at end of file
+        """Remove um usuário da memória (O(n): desloca a lista de IDs ordenados)"""
+        user = self.users.pop(user_id, None)
+        if user is not None:
+            self.email_index.pop(normalize_email(user.email), None)
+            sorted_ids = self._sorted_ids()
+            del sorted_ids[bisect_left(sorted_ids, user_id)]
+
+    def snapshot(self, path: str) -> None:
+        """
+        Grava um snapshot binário dos usuários
+
+        A serialização trabalha sobre uma cópia da lista de usuários, então
+        leituras concorrentes não ficam bloqueadas nem veem o dicionário
+        mudar de tamanho durante a gravação.
+        """
+        write_snapshot(path, "users", list(self.users.values()))
+
+    def restore(self, path: str) -> None:
+        """Substitui o conteúdo do repositório pelo snapshot, reconstruindo os índices"""
+        with paused_gc():
+            users: List[User] = read_snapshot(path, "users")
+            users_by_id = {user.id: user for user in users}
+            email_index = {normalize_email(user.email): user.id for user in users}
+            sorted_ids = sorted(users_by_id)
+
+        # Os índices são trocados juntos, já completos
+        self.users = users_by_id
+        self.email_index = email_index
+        self.sorted_ids = sorted_ids
+        self._pending_ids = []
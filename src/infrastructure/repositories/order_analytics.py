@@ -0,0 +1,221 @@
+"""
+Agregados analíticos de pedidos mantidos de forma incremental.
+
+OrderAnalytics guarda receita e quantidade por produto em colunas array
+indexadas pelo código interno do produto, contagens do histograma de valor
+dos pedidos e totais diários, todos em unidades mínimas (int). Cada pedido
+gravado atualiza os agregados em O(itens); as consultas só leem as colunas,
+sem percorrer os pedidos.
+
+AnalyticsOrderRepository é o decorator de OrderRepository que alimenta os
+agregados a cada gravação.
+"""
+import heapq
+import threading
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.domain.entities.money import DEFAULT_CURRENCY, Money
+from src.domain.entities.order import Order
+from src.domain.interfaces.order_repository import OrderRepository
+
+# Limites inferiores padrão das faixas do histograma, em unidades mínimas
+DEFAULT_BUCKET_EDGES = (0, 5_000, 10_000, 25_000, 50_000, 100_000)
+
+
+@dataclass(frozen=True)
+class HistogramBucket:
+    """Faixa do histograma de valor dos pedidos: lower <= total < upper"""
+    lower: Money
+    upper: Optional[Money]
+    count: int
+
+
+class _Contribution:
+    """O que um pedido somou aos agregados, para desfazer ao regravá-lo"""
+
+    __slots__ = ("day", "total", "bucket", "items")
+
+    def __init__(self, day: date, total: int, bucket: int, items: List[Tuple[int, int, int]]):
+        self.day = day
+        self.total = total
+        self.bucket = bucket
+        # (código do produto, quantidade, receita)
+        self.items = items
+
+
+class OrderAnalytics:
+    """
+    Agregados de pedidos em uma única moeda
+
+    A data de cada pedido é a do dia em que foi registrado pela primeira
+    vez (Order não tem data); regravar um pedido substitui seus valores
+    sem mudar o dia.
+    """
+
+    def __init__(
+        self,
+        currency: str = DEFAULT_CURRENCY,
+        bucket_edges: Sequence[int] = DEFAULT_BUCKET_EDGES,
+        today: Callable[[], date] = date.today
+    ):
+        """
+        Args:
+            currency: Moeda dos pedidos agregados
+            bucket_edges: Limites inferiores, crescentes, das faixas do
+                histograma em unidades mínimas; a última faixa é aberta
+            today: Fonte da data de registro (injetável para testes)
+        """
+        if not bucket_edges or list(bucket_edges) != sorted(set(bucket_edges)):
+            raise ValueError("Faixas do histograma devem ser crescentes e não vazias")
+        self.currency = currency
+        self.bucket_edges = tuple(bucket_edges)
+        self.today = today
+
+        self._product_codes: Dict[str, int] = {}
+        self._product_ids: List[str] = []
+        self._revenue = array("q")
+        self._quantity = array("q")
+        self._histogram = array("q", bytes(8 * len(self.bucket_edges)))
+        self._daily: Dict[date, int] = {}
+        self._contributions: Dict[str, _Contribution] = {}
+        self._lock = threading.Lock()
+
+    def check(self, order: Order) -> None:
+        """
+        Verifica se o pedido pode ser agregado
+
+        Raises:
+            ValueError: Se o pedido estiver em outra moeda
+        """
+        if order.total.currency != self.currency:
+            raise ValueError(f"Moedas diferentes: {order.total.currency} e {self.currency}")
+
+    def record(self, order: Order) -> None:
+        """Soma o pedido aos agregados, substituindo uma versão anterior"""
+        self.record_many([order])
+
+    def record_many(self, orders: Iterable[Order]) -> None:
+        """Soma os pedidos aos agregados com uma única aquisição do lock"""
+        orders = list(orders)
+        for order in orders:
+            self.check(order)
+        day = self.today()
+        with self._lock:
+            for order in orders:
+                previous = self._contributions.pop(order.id, None)
+                if previous is not None:
+                    self._apply(previous, -1)
+                contribution = self._contribution(order, previous.day if previous else day)
+                self._apply(contribution, 1)
+                self._contributions[order.id] = contribution
+
+    def _contribution(self, order: Order, day: date) -> _Contribution:
+        """Calcula a contribuição do pedido, internando produtos novos"""
+        items = []
+        for item in order.items:
+            code = self._product_codes.get(item.product_id)
+            if code is None:
+                code = len(self._product_ids)
+                self._product_codes[item.product_id] = code
+                self._product_ids.append(item.product_id)
+                self._revenue.append(0)
+                self._quantity.append(0)
+            items.append((code, item.quantity, item.price.amount * item.quantity))
+        total = order.total.amount
+        bucket = max(bisect_right(self.bucket_edges, total) - 1, 0)
+        return _Contribution(day, total, bucket, items)
+
+    def _apply(self, contribution: _Contribution, sign: int) -> None:
+        """Soma (sign=1) ou subtrai (sign=-1) a contribuição dos agregados"""
+        revenue, quantity = self._revenue, self._quantity
+        for code, item_quantity, item_revenue in contribution.items:
+            revenue[code] += sign * item_revenue
+            quantity[code] += sign * item_quantity
+        self._histogram[contribution.bucket] += sign
+        day_total = self._daily.get(contribution.day, 0) + sign * contribution.total
+        self._daily[contribution.day] = day_total
+
+    @property
+    def order_count(self) -> int:
+        """Quantidade de pedidos agregados"""
+        return len(self._contributions)
+
+    def revenue_by_product(self) -> Dict[str, Money]:
+        """Receita por produto"""
+        with self._lock:
+            return {
+                product_id: Money(amount, self.currency)
+                for product_id, amount in zip(self._product_ids, self._revenue)
+            }
+
+    def quantity_by_product(self) -> Dict[str, int]:
+        """Quantidade vendida por produto"""
+        with self._lock:
+            return dict(zip(self._product_ids, self._quantity))
+
+    def top_products(self, n: int = 10) -> List[Tuple[str, Money]]:
+        """Os n produtos de maior receita, em ordem decrescente"""
+        if n <= 0:
+            raise ValueError("Quantidade deve ser maior que zero")
+        with self._lock:
+            revenue = self._revenue
+            codes = heapq.nlargest(n, range(len(revenue)), key=revenue.__getitem__)
+            return [(self._product_ids[code], Money(revenue[code], self.currency)) for code in codes]
+
+    def order_value_histogram(self) -> List[HistogramBucket]:
+        """Contagem de pedidos por faixa de valor total"""
+        with self._lock:
+            counts = self._histogram.tolist()
+        uppers = self.bucket_edges[1:] + (None,)
+        return [
+            HistogramBucket(
+                lower=Money(lower, self.currency),
+                upper=Money(upper, self.currency) if upper is not None else None,
+                count=count
+            )
+            for lower, upper, count in zip(self.bucket_edges, uppers, counts)
+        ]
+
+    def daily_totals(self, start: Optional[date] = None, end: Optional[date] = None) -> Dict[date, Money]:
+        """Total vendido por dia, em ordem de data, opcionalmente entre start e end (inclusivos)"""
+        with self._lock:
+            days = sorted(self._daily.items())
+        return {
+            day: Money(amount, self.currency)
+            for day, amount in days
+            if (start is None or day >= start) and (end is None or day <= end)
+        }
+
+
+class AnalyticsOrderRepository(OrderRepository):
+    """Decorator que atualiza os agregados a cada pedido gravado"""
+
+    def __init__(self, repository: OrderRepository, analytics: Optional[OrderAnalytics] = None):
+        self.repository = repository
+        self.analytics = analytics if analytics is not None else OrderAnalytics()
+
+    def save(self, order: Order) -> None:
+        """Grava no backend e soma o pedido aos agregados"""
+        self.analytics.check(order)
+        self.repository.save(order)
+        self.analytics.record(order)
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """Grava o lote no backend e soma os pedidos aos agregados"""
+        orders = list(orders)
+        for order in orders:
+            self.analytics.check(order)
+        self.repository.save_many(orders)
+        self.analytics.record_many(orders)
+
+    def find_by_id(self, order_id: str) -> Optional[Order]:
+        """Busca o pedido no backend"""
+        return self.repository.find_by_id(order_id)
+
+    def find_many(self, order_ids: Iterable[str]) -> List[Optional[Order]]:
+        """Busca os pedidos no backend"""
+        return self.repository.find_many(order_ids)
@@ -0,0 +1,234 @@
+"""
+Implementações em memória thread-safe com lock striping.
+
+Os dados são divididos em N shards independentes, cada um com seu próprio
+lock. O shard é escolhido pelo hash do ID, de modo que operações sobre IDs
+diferentes raramente disputam o mesmo lock.
+
+Ordem de aquisição dos locks (evita deadlock): primeiro o shard do ID,
+depois as faixas do índice de email, sempre em ordem crescente.
+"""
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.domain.entities.order import Order
+from src.domain.entities.user import User, normalize_email
+from src.domain.interfaces.order_repository import OrderRepository
+from src.domain.interfaces.user_repository import UserRepository
+from src.infrastructure.repositories.memory_user_repository import merge_pending_ids
+
+DEFAULT_SHARDS = 16
+# Usuários lidos de cada shard por aquisição do lock em iter_users
+_ITER_PAGE_SIZE = 64
+
+
+class _UserShard:
+    """Partição de usuários protegida por um lock próprio"""
+    __slots__ = ("lock", "users", "sorted_ids", "pending_ids")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users: Dict[str, User] = {}
+        # IDs ordenados; os novos entram em pending_ids em O(1) e são
+        # intercalados na próxima leitura ordenada, como no InMemoryUserRepository
+        self.sorted_ids: List[str] = []
+        self.pending_ids: List[str] = []
+
+    def ordered_ids(self) -> List[str]:
+        """Intercala os IDs pendentes e retorna a lista ordenada (chamado com o lock)"""
+        if self.pending_ids:
+            self.sorted_ids = merge_pending_ids(self.sorted_ids, self.pending_ids)
+        return self.sorted_ids
+
+
+class _EmailStripe:
+    """Faixa do índice de email protegida por um lock próprio"""
+    __slots__ = ("lock", "owners")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.owners: Dict[str, str] = {}
+
+
+class _OrderShard:
+    """Partição de pedidos protegida por um lock próprio"""
+    __slots__ = ("lock", "orders")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.orders: Dict[str, Order] = {}
+
+
+class ShardedInMemoryUserRepository(UserRepository):
+    """Repositório de usuários em memória, seguro para uso concorrente"""
+
+    def __init__(self, shards: int = DEFAULT_SHARDS):
+        if shards <= 0:
+            raise ValueError("Quantidade de shards deve ser maior que zero")
+        self.shards = [_UserShard() for _ in range(shards)]
+        self.email_stripes = [_EmailStripe() for _ in range(shards)]
+
+    def _shard(self, user_id: str) -> _UserShard:
+        """Retorna o shard responsável pelo ID"""
+        return self.shards[hash(user_id) % len(self.shards)]
+
+    def _stripe_index(self, email_key: str) -> int:
+        """Retorna a faixa do índice responsável pelo email normalizado"""
+        return hash(email_key) % len(self.email_stripes)
+
+    def save(self, user: User) -> None:
+        """Salva o usuário, garantindo atomicamente a unicidade do email"""
+        email_key = normalize_email(user.email)
+        shard = self._shard(user.id)
+
+        with shard.lock:
+            previous = shard.users.get(user.id)
+            previous_key = normalize_email(previous.email) if previous else None
+
+            stripe_indexes = {self._stripe_index(email_key)}
+            if previous_key is not None and previous_key != email_key:
+                stripe_indexes.add(self._stripe_index(previous_key))
+            stripes = [self.email_stripes[i] for i in sorted(stripe_indexes)]
+
+            for stripe in stripes:
+                stripe.lock.acquire()
+            try:
+                new_stripe = self.email_stripes[self._stripe_index(email_key)]
+                owner_id = new_stripe.owners.get(email_key)
+                if owner_id is not None and owner_id != user.id:
+                    raise ValueError("Email já cadastrado")
+
+                if previous_key is not None and previous_key != email_key:
+                    del self.email_stripes[self._stripe_index(previous_key)].owners[previous_key]
+                new_stripe.owners[email_key] = user.id
+            finally:
+                for stripe in reversed(stripes):
+                    stripe.lock.release()
+
+            if previous is None:
+                shard.pending_ids.append(user.id)
+            shard.users[user.id] = user
+
+    def find_by_id(self, user_id: str) -> Optional[User]:
+        """Busca um usuário por ID"""
+        shard = self._shard(user_id)
+        with shard.lock:
+            return shard.users.get(user_id)
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        """Busca um usuário pelo email normalizado"""
+        email_key = normalize_email(email)
+        stripe = self.email_stripes[self._stripe_index(email_key)]
+        with stripe.lock:
+            user_id = stripe.owners.get(email_key)
+        if user_id is None:
+            return None
+        user = self.find_by_id(user_id)
+        # O usuário pode ter trocado de email entre as duas leituras
+        if user is None or normalize_email(user.email) != email_key:
+            return None
+        return user
+
+    def find_all(self) -> List[User]:
+        """Retorna todos os usuários a partir de um snapshot de cada shard"""
+        users: List[User] = []
+        for shard in self.shards:
+            with shard.lock:
+                users.extend(shard.users.values())
+        return users
+
+    def iter_users(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[User]:
+        """
+        Percorre os usuários em ordem de ID, intercalando os shards
+
+        Cada shard é lido sob demanda, em páginas pequenas a partir do
+        cursor, sem materializar a tabela.
+        """
+        page_size = _ITER_PAGE_SIZE if limit is None else min(limit, _ITER_PAGE_SIZE)
+        runs = [self._iter_shard(shard, after, page_size) for shard in self.shards]
+        return islice(heapq.merge(*runs, key=lambda user: user.id), limit)
+
+    @staticmethod
+    def _iter_shard(shard: _UserShard, after: Optional[str], page_size: int) -> Iterator[User]:
+        """Percorre um shard em ordem de ID, uma página por aquisição do lock"""
+        cursor = after
+        while page_size > 0:
+            with shard.lock:
+                sorted_ids = shard.ordered_ids()
+                start = 0 if cursor is None else bisect_right(sorted_ids, cursor)
+                page = [shard.users[user_id] for user_id in sorted_ids[start:start + page_size]]
+            yield from page
+            if len(page) < page_size:
+                return
+            cursor = page[-1].id
+
+    def delete(self, user_id: str) -> None:
+        """Remove um usuário de forma atômica"""
+        shard = self._shard(user_id)
+        with shard.lock:
+            user = shard.users.pop(user_id, None)
+            if user is None:
+                return
+            sorted_ids = shard.ordered_ids()
+            del sorted_ids[bisect_left(sorted_ids, user_id)]
+            email_key = normalize_email(user.email)
+            stripe = self.email_stripes[self._stripe_index(email_key)]
+            with stripe.lock:
+                if stripe.owners.get(email_key) == user_id:
+                    del stripe.owners[email_key]
+
+
+class ShardedInMemoryOrderRepository(OrderRepository):
+    """Repositório de pedidos em memória, seguro para uso concorrente"""
+
+    def __init__(self, shards: int = DEFAULT_SHARDS):
+        if shards <= 0:
+            raise ValueError("Quantidade de shards deve ser maior que zero")
+        self.shards = [_OrderShard() for _ in range(shards)]
+
+    def _shard(self, order_id: str) -> _OrderShard:
+        """Retorna o shard responsável pelo ID"""
+        return self.shards[hash(order_id) % len(self.shards)]
+
+    def save(self, order: Order) -> None:
+        """Salva um pedido"""
+        shard = self._shard(order.id)
+        with shard.lock:
+            shard.orders[order.id] = order
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """Salva vários pedidos adquirindo o lock de cada shard uma única vez"""
+        by_shard: Dict[int, Dict[str, Order]] = {}
+        for order in orders:
+            by_shard.setdefault(hash(order.id) % len(self.shards), {})[order.id] = order
+        for index, batch in by_shard.items():
+            shard = self.shards[index]
+            with shard.lock:
+                shard.orders.update(batch)
+
+    def find_by_id(self, order_id: str) -> Optional[Order]:
+        """Busca um pedido por ID"""
+        shard = self._shard(order_id)
+        with shard.lock:
+            return shard.orders.get(order_id)
+
+    def find_all(self) -> List[Order]:
+        """Retorna todos os pedidos a partir de um snapshot de cada shard"""
+        orders: List[Order] = []
+        for shard in self.shards:
+            with shard.lock:
+                orders.extend(shard.orders.values())
+        return orders
+
+    def delete(self, order_id: str) -> None:
+        """Remove um pedido de forma atômica"""
+        shard = self._shard(order_id)
+        with shard.lock:
+            shard.orders.pop(order_id, None)
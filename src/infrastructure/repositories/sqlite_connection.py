@@ -0,0 +1,31 @@
+"""
+Conexão SQLite compartilhada pelos repositórios persistentes.
+
+A conexão é aberta com check_same_thread=False e transações explícitas, então
+cada repositório serializa o uso dela com um lock próprio: sem isso o BEGIN
+ou o commit de um thread se intercalam com os de outro.
+"""
+import sqlite3
+
+# Limite conservador de parâmetros por instrução (SQLITE_MAX_VARIABLE_NUMBER
+# é 999 em versões antigas do SQLite)
+MAX_PARAMETERS = 500
+
+
+def connect(database: str) -> sqlite3.Connection:
+    """
+    Abre uma conexão SQLite configurada para escrita concorrente (WAL)
+
+    A conexão pode ser usada por vários threads, mas não ao mesmo tempo:
+    quem a compartilha deve protegê-la com um lock.
+    """
+    connection = sqlite3.connect(
+        database,
+        isolation_level=None,  # Transações controladas explicitamente
+        cached_statements=256,
+        check_same_thread=False
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA foreign_keys=ON")
+    return connection
@@ -0,0 +1,140 @@
+"""
+Implementação do OrderRepository persistida em SQLite.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.interfaces.order_repository import OrderRepository
+from src.infrastructure.repositories.sqlite_connection import MAX_PARAMETERS, connect
+
+_CREATE_ORDERS = """
+CREATE TABLE IF NOT EXISTS orders (
+    id TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    currency TEXT NOT NULL
+)
+"""
+# Itens normalizados: uma linha por OrderItem, na ordem original do pedido.
+# Valores monetários ficam em unidades mínimas inteiras (Money.amount).
+_CREATE_ORDER_ITEMS = """
+CREATE TABLE IF NOT EXISTS order_items (
+    order_id TEXT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    product_id TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    PRIMARY KEY (order_id, position)
+) WITHOUT ROWID
+"""
+_UPSERT_ORDER = """
+INSERT INTO orders (id, total, currency) VALUES (?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET total = excluded.total, currency = excluded.currency
+"""
+_DELETE_ITEMS = "DELETE FROM order_items WHERE order_id = ?"
+_INSERT_ITEM = """
+INSERT INTO order_items (order_id, position, product_id, quantity, price, currency)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+_FIND_ORDER = "SELECT id, total, currency FROM orders WHERE id = ?"
+_FIND_ORDERS = "SELECT id, total, currency FROM orders WHERE id IN ({placeholders})"
+_FIND_ORDERS_ITEMS = """
+SELECT order_id, product_id, quantity, price, currency FROM order_items
+WHERE order_id IN ({placeholders}) ORDER BY order_id, position
+"""
+_FIND_ITEMS = """
+SELECT product_id, quantity, price, currency FROM order_items
+WHERE order_id = ? ORDER BY position
+"""
+
+
+class SqliteOrderRepository(OrderRepository):
+    """
+    Implementação do repositório de pedidos em SQLite
+
+    Thread-safe: todo uso da conexão passa pelo lock do repositório, então
+    transações de threads diferentes não se intercalam e uma leitura nunca
+    vê um pedido gravado pela metade.
+    """
+
+    def __init__(self, database: str = ":memory:"):
+        self._lock = threading.Lock()
+        self.connection = connect(database)
+        self.connection.execute(_CREATE_ORDERS)
+        self.connection.execute(_CREATE_ORDER_ITEMS)
+
+    @staticmethod
+    def _item_rows(order: Order) -> List[tuple]:
+        """Converte os itens do pedido em linhas da tabela de itens"""
+        return [
+            (
+                order.id,
+                position,
+                item.product_id,
+                item.quantity,
+                item.price.amount,
+                item.price.currency
+            )
+            for position, item in enumerate(order.items)
+        ]
+
+    def save(self, order: Order) -> None:
+        """Salva um pedido e seus itens em uma transação"""
+        self.save_many([order])
+
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """Salva vários pedidos em uma única transação com executemany"""
+        orders = list(orders)
+        order_rows = [(order.id, order.total.amount, order.total.currency) for order in orders]
+        id_rows = [(order.id,) for order in orders]
+        item_rows = [row for order in orders for row in self._item_rows(order)]
+        with self._lock, self.connection:
+            self.connection.execute("BEGIN")
+            self.connection.executemany(_UPSERT_ORDER, order_rows)
+            self.connection.executemany(_DELETE_ITEMS, id_rows)
+            self.connection.executemany(_INSERT_ITEM, item_rows)
+
+    def find_by_id(self, order_id: str) -> Optional[Order]:
+        """Busca um pedido por ID, reconstruindo seus itens"""
+        with self._lock:
+            row = self.connection.execute(_FIND_ORDER, (order_id,)).fetchone()
+            if row is None:
+                return None
+            item_rows = self.connection.execute(_FIND_ITEMS, (order_id,)).fetchall()
+
+        items = [
+            OrderItem(product_id=product_id, quantity=quantity, price=Money(price, currency))
+            for product_id, quantity, price, currency in item_rows
+        ]
+        return Order.trusted(id=row[0], items=items, total=Money(row[1], row[2]))
+
+    def find_many(self, order_ids: Iterable[str]) -> List[Optional[Order]]:
+        """Busca vários pedidos com consultas IN em blocos"""
+        order_ids = list(order_ids)
+        found: Dict[str, Order] = {}
+        for start in range(0, len(order_ids), MAX_PARAMETERS):
+            chunk = order_ids[start:start + MAX_PARAMETERS]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                order_rows = self.connection.execute(
+                    _FIND_ORDERS.format(placeholders=placeholders),
+                    chunk
+                ).fetchall()
+                item_rows = self.connection.execute(
+                    _FIND_ORDERS_ITEMS.format(placeholders=placeholders),
+                    chunk
+                ).fetchall()
+            for order_id, total, currency in order_rows:
+                found[order_id] = Order.trusted(id=order_id, items=[], total=Money(total, currency))
+            for order_id, product_id, quantity, price, currency in item_rows:
+                found[order_id].items.append(
+                    OrderItem(product_id=product_id, quantity=quantity, price=Money(price, currency))
+                )
+        return [found.get(order_id) for order_id in order_ids]
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco"""
+        with self._lock:
+            self.connection.close()
@@ -0,0 +1,164 @@
+"""
+Implementação do UserRepository persistida em SQLite.
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.domain.entities.user import User, normalize_email
+from src.domain.interfaces.user_repository import UserRepository
+from src.infrastructure.repositories.sqlite_connection import MAX_PARAMETERS, connect
+
+# As instruções são mantidas constantes para que o cache de prepared
+# statements do sqlite3 as reutilize entre chamadas.
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_key TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL
+)
+"""
+_UPSERT = """
+INSERT INTO users (id, name, email, email_key, created_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    name = excluded.name,
+    email = excluded.email,
+    email_key = excluded.email_key,
+    created_at = excluded.created_at
+"""
+_SELECT_COLUMNS = "SELECT id, name, email, created_at FROM users"
+_FIND_BY_ID = f"{_SELECT_COLUMNS} WHERE id = ?"
+_FIND_BY_EMAIL = f"{_SELECT_COLUMNS} WHERE email_key = ?"
+_FIND_MANY = f"{_SELECT_COLUMNS} WHERE id IN ({{placeholders}})"
+_FIND_ALL = f"{_SELECT_COLUMNS} ORDER BY id"
+_ITER_AFTER = f"{_SELECT_COLUMNS} WHERE id > ? ORDER BY id LIMIT ?"
+_DELETE = "DELETE FROM users WHERE id = ?"
+# Linhas lidas por vez em iter_users, cada página com o lock adquirido
+_ITER_PAGE_SIZE = 500
+
+
+class SqliteUserRepository(UserRepository):
+    """
+    Implementação do repositório de usuários em SQLite
+
+    Thread-safe: todo uso da conexão passa pelo lock do repositório, então
+    transações de threads diferentes não se intercalam.
+    """
+
+    def __init__(self, database: str = ":memory:"):
+        self._lock = threading.Lock()
+        self.connection = connect(database)
+        self.connection.execute(_CREATE_TABLE)
+
+    @staticmethod
+    def _to_row(user: User) -> tuple:
+        """Converte a entidade em uma linha da tabela"""
+        return (
+            user.id,
+            user.name,
+            user.email,
+            normalize_email(user.email),
+            user.created_at.isoformat()
+        )
+
+    @staticmethod
+    def _to_entity(row: tuple) -> User:
+        """Converte uma linha da tabela em entidade, sem revalidar"""
+        return User.trusted(
+            id=row[0],
+            name=row[1],
+            email=row[2],
+            created_at=datetime.fromisoformat(row[3])
+        )
+
+    def save(self, user: User) -> None:
+        """Salva um usuário no banco"""
+        row = self._to_row(user)
+        try:
+            with self._lock:
+                self.connection.execute(_UPSERT, row)
+        except sqlite3.IntegrityError:
+            raise ValueError("Email já cadastrado")
+
+    def save_many(self, users: Iterable[User]) -> None:
+        """Salva vários usuários em uma única transação com executemany"""
+        rows = [self._to_row(user) for user in users]
+        try:
+            with self._lock, self.connection:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(_UPSERT, rows)
+        except sqlite3.IntegrityError:
+            raise ValueError("Email já cadastrado")
+
+    def find_by_id(self, user_id: str) -> Optional[User]:
+        """Busca um usuário por ID no banco"""
+        with self._lock:
+            row = self.connection.execute(_FIND_BY_ID, (user_id,)).fetchone()
+        return self._to_entity(row) if row else None
+
+    def find_many(self, user_ids: Iterable[str]) -> List[Optional[User]]:
+        """Busca vários usuários com consultas IN em blocos"""
+        user_ids = list(user_ids)
+        found: Dict[str, User] = {}
+        for start in range(0, len(user_ids), MAX_PARAMETERS):
+            chunk = user_ids[start:start + MAX_PARAMETERS]
+            sql = _FIND_MANY.format(placeholders=",".join("?" * len(chunk)))
+            with self._lock:
+                rows = self.connection.execute(sql, chunk).fetchall()
+            for row in rows:
+                found[row[0]] = self._to_entity(row)
+        return [found.get(user_id) for user_id in user_ids]
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        """Busca um usuário pelo email normalizado no banco"""
+        with self._lock:
+            row = self.connection.execute(
+                _FIND_BY_EMAIL,
+                (normalize_email(email),)
+            ).fetchone()
+        return self._to_entity(row) if row else None
+
+    def find_all(self) -> List[User]:
+        """Retorna todos os usuários"""
+        with self._lock:
+            rows = self.connection.execute(_FIND_ALL).fetchall()
+        return [self._to_entity(row) for row in rows]
+
+    def iter_users(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[User]:
+        """
+        Percorre os usuários a partir do cursor, lendo uma página por vez
+
+        O lock só é mantido durante a leitura de cada página, nunca enquanto
+        o chamador consome os usuários.
+        """
+        cursor = after if after is not None else ""
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_size = _ITER_PAGE_SIZE if remaining is None else min(remaining, _ITER_PAGE_SIZE)
+            with self._lock:
+                rows = self.connection.execute(_ITER_AFTER, (cursor, page_size)).fetchall()
+            for row in rows:
+                yield self._to_entity(row)
+            if len(rows) < page_size:
+                return
+            cursor = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def delete(self, user_id: str) -> None:
+        """Remove um usuário do banco"""
+        with self._lock:
+            self.connection.execute(_DELETE, (user_id,))
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco"""
+        with self._lock:
+            self.connection.close()
@@ -0,0 +1,154 @@
+"""
+Handler de logging que não bloqueia os threads chamadores.
+
+O thread que registra o log apenas enfileira o LogRecord em um deque
+(append atômico, sem lock). Um thread de fundo formata os registros como
+JSON, um por linha, e os escreve em lotes, com um único write e flush por
+lote. Com a fila cheia o registro é descartado e contado em dropped.
+
+Campos estruturados são passados em extra={"fields": {...}}. Como a
+formatação acontece depois, os argumentos do log devem ser valores que não
+mudam após a chamada.
+"""
+import json
+import logging
+import sys
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, List, Optional, TextIO, Union
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formata cada registro como um objeto JSON em uma linha"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage()
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class AsyncLogHandler(logging.Handler):
+    """Enfileira os registros e os escreve em lotes em um thread de fundo"""
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        capacity: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.05
+    ):
+        """
+        Args:
+            stream: Destino dos logs (padrão: sys.stderr)
+            capacity: Quantidade máxima de registros aguardando escrita
+            batch_size: Quantidade máxima de registros por escrita
+            flush_interval: Tempo máximo, em segundos, entre escritas
+        """
+        if capacity <= 0:
+            raise ValueError("Capacidade da fila deve ser maior que zero")
+        if batch_size <= 0:
+            raise ValueError("Tamanho do lote deve ser maior que zero")
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stderr
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.setFormatter(StructuredFormatter())
+
+        self.dropped = 0
+        self.written = 0
+
+        # Registros pendentes e marcadores de flush (Event)
+        self._records: Deque[Union[logging.LogRecord, threading.Event]] = deque()
+        self._wakeup = threading.Event()
+        self._drop_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="async-log-writer", daemon=True)
+        self._writer.start()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filtra e enfileira o registro sem adquirir o lock do handler"""
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return bool(rv)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Enfileira o registro, descartando-o se a fila estiver cheia"""
+        records = self._records
+        if self._closed or len(records) >= self.capacity:
+            # Caminho raro: o lock só é usado quando já há sobrecarga
+            with self._drop_lock:
+                self.dropped += 1
+            return
+        records.append(record)
+        if len(records) >= self.batch_size and not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Aguarda a escrita dos registros enfileirados até aqui"""
+        if self._closed or not self._writer.is_alive():
+            return
+        marker = threading.Event()
+        self._records.append(marker)
+        self._wakeup.set()
+        marker.wait(timeout)
+
+    def close(self) -> None:
+        """Escreve os registros pendentes e encerra o thread de fundo"""
+        if not self._closed:
+            self._closed = True
+            self._wakeup.set()
+            self._writer.join()
+        super().close()
+
+    def _run(self) -> None:
+        """Laço do thread de escrita"""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+            if self._closed:
+                self._drain()
+                return
+
+    def _drain(self) -> None:
+        """Escreve todos os registros pendentes, em lotes"""
+        records = self._records
+        while records:
+            lines: List[str] = []
+            markers: List[threading.Event] = []
+            while records and len(lines) < self.batch_size:
+                item = records.popleft()
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                    continue
+                try:
+                    lines.append(self.format(item))
+                except Exception:
+                    self.handleError(item)
+            if lines:
+                self._write(lines)
+            for marker in markers:
+                marker.set()
+
+    def _write(self, lines: List[str]) -> None:
+        """Escreve um lote com um único write e flush"""
+        try:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+            self.written += len(lines)
+        except Exception:
+            # Sem registro associado: relata o erro como o logging faria
+            self.handleError(logging.makeLogRecord({"msg": "Falha ao escrever logs"}))
@@ -0,0 +1,149 @@
+"""
+Decorator de PaymentProcessor que agrupa chamadas concorrentes em lotes.
+
+Cada chamada a process_payment entra em uma fila e o thread chamador
+aguarda o seu resultado. Threads despachantes agrupam os pagamentos
+pendentes e os enviam ao processador envolvido com uma única chamada a
+process_payments, economizando idas e voltas ao gateway.
+"""
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Tuple
+
+from src.domain.entities.payment import PaymentInfo, PaymentProcessor
+
+
+class BatchingPaymentProcessor(PaymentProcessor):
+    """Agrupa pagamentos concorrentes em chamadas process_payments"""
+
+    def __init__(
+        self,
+        processor: PaymentProcessor,
+        max_batch_size: int = 100,
+        window: float = 0.005,
+        flush_on_idle: bool = True,
+        max_in_flight: int = 1
+    ):
+        """
+        Args:
+            processor: Processador que recebe os lotes
+            max_batch_size: Tamanho máximo de cada lote
+            window: Tempo máximo, em segundos, que o primeiro pagamento
+                pendente espera pela formação do lote; usado apenas com
+                flush_on_idle=False
+            flush_on_idle: Se True, um despachante livre envia os pagamentos
+                pendentes imediatamente, sem esperar a janela (window é
+                ignorado); os lotes se formam enquanto os anteriores estão em voo
+            max_in_flight: Quantidade máxima de lotes enviados ao mesmo tempo
+                (um thread despachante por lote)
+        """
+        if max_batch_size <= 0:
+            raise ValueError("Tamanho do lote deve ser maior que zero")
+        if max_in_flight <= 0:
+            raise ValueError("Quantidade de lotes em voo deve ser maior que zero")
+        self.processor = processor
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.flush_on_idle = flush_on_idle
+
+        self.batches_sent = 0
+        self.payments_sent = 0
+
+        self._pending: List[Tuple[PaymentInfo, Future, float]] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self._dispatchers = [
+            threading.Thread(
+                target=self._run,
+                name=f"batching-payment-dispatcher-{i}",
+                daemon=True
+            )
+            for i in range(max_in_flight)
+        ]
+        for dispatcher in self._dispatchers:
+            dispatcher.start()
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        """Enfileira o pagamento e aguarda o resultado do seu lote"""
+        return self.submit(payment).result()
+
+    def process_payments(self, payments: List[PaymentInfo]) -> List[bool]:
+        """Enfileira vários pagamentos e aguarda todos os resultados"""
+        futures = [self.submit(payment) for payment in payments]
+        return [future.result() for future in futures]
+
+    def submit(self, payment: PaymentInfo) -> "Future[bool]":
+        """Enfileira o pagamento sem bloquear, retornando um Future"""
+        future: "Future[bool]" = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Processador de pagamentos encerrado")
+            self._pending.append((payment, future, time.monotonic()))
+            self._condition.notify()
+        return future
+
+    def _next_batch(self) -> List[Tuple[PaymentInfo, Future, float]]:
+        """Aguarda e retira o próximo lote da fila (vazio só ao encerrar)"""
+        with self._condition:
+            while True:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+
+                if not self.flush_on_idle:
+                    # Espera completar o lote ou vencer a janela do mais antigo;
+                    # o prazo é recalculado se outro despachante levar o lote
+                    while (
+                        self._pending
+                        and len(self._pending) < self.max_batch_size
+                        and not self._closed
+                    ):
+                        remaining = self._pending[0][2] + self.window - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+
+                if self._pending or self._closed:
+                    batch = self._pending[:self.max_batch_size]
+                    del self._pending[:self.max_batch_size]
+                    return batch
+
+    def _run(self) -> None:
+        """Laço de cada thread despachante"""
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[PaymentInfo, Future, float]]) -> None:
+        """Envia o lote ao processador e entrega cada resultado ao seu chamador"""
+        try:
+            results = self.processor.process_payments([payment for payment, _, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError("Quantidade de resultados diferente da de pagamentos")
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        with self._stats_lock:
+            self.batches_sent += 1
+            self.payments_sent += len(batch)
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
+
+    def close(self) -> None:
+        """Envia os pagamentos pendentes e encerra os threads despachantes"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for dispatcher in self._dispatchers:
+            dispatcher.join()
+
+    def __enter__(self) -> "BatchingPaymentProcessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,9 +2,12 @@
 Implementação do serviço de notificação por email.
 """
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List
+from email.utils import make_msgid
+from typing import List, Optional
 
 from src.domain.interfaces.notification_service import (
     NotificationService,
@@ -13,10 +16,23 @@ from src.domain.interfaces.notification_service import (
     NotificationResult,
     NotificationType
 )
+from src.domain.interfaces.template_renderer import TemplateRenderer
+from src.infrastructure.services.smtp_connection_pool import SmtpConnectionPool
 
 
 class EmailNotificationService(NotificationService):
-    """Implementação do serviço de notificação via SMTP"""
+    """
+    Implementação do serviço de notificação via SMTP
+
+    As conexões autenticadas ficam em um SmtpConnectionPool e são
+    reutilizadas entre chamadas; nenhuma conexão é aberta antes do
+    primeiro envio. Chame close() para encerrá-las; o serviço continua
+    utilizável depois disso.
+
+    Envios em massa são divididos em blocos de bulk_chunk_size
+    destinatários, enviados em paralelo por até bulk_concurrency conexões;
+    uma conexão que falha afeta apenas o seu bloco.
+    """
 
     def __init__(
         self,
@@ -24,13 +40,48 @@ class EmailNotificationService(NotificationService):
         smtp_port: int,
         smtp_user: str,
         smtp_password: str,
-        default_from_email: str
+        default_from_email: str,
+        pool_size: int = 4,
+        idle_timeout: float = 60.0,
+        use_tls: bool = True,
+        bulk_chunk_size: int = 100,
+        bulk_concurrency: Optional[int] = None,
+        bulk_max_in_flight: int = 1_000,
+        template_renderer: Optional[TemplateRenderer] = None
     ):
+        """
+        Args:
+            pool_size: Quantidade máxima de conexões SMTP abertas
+            idle_timeout: Tempo, em segundos, até fechar uma conexão ociosa
+            use_tls: Se True, executa STARTTLS nas conexões
+            bulk_chunk_size: Destinatários por bloco no envio em massa
+            bulk_concurrency: Blocos enviados em paralelo (padrão: pool_size)
+            bulk_max_in_flight: Limite de mensagens em blocos já despachados
+                e ainda não concluídos
+            template_renderer: Renderiza o corpo de conteúdos com template_id
+        """
+        if bulk_chunk_size <= 0:
+            raise ValueError("Tamanho do bloco deve ser maior que zero")
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
         self.smtp_user = smtp_user
         self.smtp_password = smtp_password
         self.default_from_email = default_from_email
+        # Domínio dos Message-ID; evita a consulta de DNS de socket.getfqdn()
+        self._message_id_domain = default_from_email.rpartition("@")[2] or "localhost"
+        self.pool = SmtpConnectionPool(
+            host=smtp_host,
+            port=smtp_port,
+            user=smtp_user,
+            password=smtp_password,
+            size=pool_size,
+            idle_timeout=idle_timeout,
+            use_tls=use_tls
+        )
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_concurrency = min(bulk_concurrency or pool_size, pool_size)
+        self.bulk_max_in_flight = bulk_max_in_flight
+        self.template_renderer = template_renderer
 
     def _create_email_message(
         self,
@@ -42,12 +93,15 @@ class EmailNotificationService(NotificationService):
         message["From"] = self.default_from_email
         message["To"] = recipient.identifier
         message["Subject"] = content.subject
+        # Identifica a mensagem: uma nova tentativa após queda reenvia o mesmo ID
+        message["Message-ID"] = make_msgid(domain=self._message_id_domain)
 
-        # Se houver template, poderia processar aqui
+        # Com template, o corpo é renderizado para cada destinatário
         body = content.body
-        if content.template_id and content.template_data:
-            # Aqui você poderia usar um sistema de templates como Jinja2
-            pass
+        if content.template_id and self.template_renderer is not None:
+            data = dict(content.template_data or {})
+            data["recipient"] = recipient
+            body = self.template_renderer.render(content.template_id, data)
 
         message.attach(MIMEText(body, "plain"))
         return message
@@ -57,7 +111,7 @@ class EmailNotificationService(NotificationService):
         recipient: NotificationRecipient,
         content: NotificationContent
     ) -> NotificationResult:
-        """Envia um email para um destinatário"""
+        """Envia um email para um destinatário usando uma conexão do pool"""
         if recipient.type != NotificationType.EMAIL:
             return NotificationResult(
                 success=False,
@@ -67,11 +121,7 @@ class EmailNotificationService(NotificationService):
 
         try:
             message = self._create_email_message(recipient, content)
-
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(message)
+            self.pool.send(message)
 
             return NotificationResult(
                 success=True,
@@ -91,43 +141,128 @@ class EmailNotificationService(NotificationService):
         recipients: List[NotificationRecipient],
         content: NotificationContent
     ) -> List[NotificationResult]:
-        """Envia emails para múltiplos destinatários"""
-        results = []
-        
-        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-            server.starttls()
-            server.login(self.smtp_user, self.smtp_password)
-
-            for recipient in recipients:
-                if recipient.type != NotificationType.EMAIL:
-                    results.append(
-                        NotificationResult(
-                            success=False,
-                            recipient=recipient,
-                            error_message="Tipo de notificação inválido para este serviço"
-                        )
-                    )
-                    continue
-
-                try:
-                    message = self._create_email_message(recipient, content)
-                    server.send_message(message)
-
-                    results.append(
-                        NotificationResult(
-                            success=True,
-                            recipient=recipient,
-                            external_id=f"email_{recipient.identifier}"
-                        )
-                    )
-
-                except Exception as e:
-                    results.append(
-                        NotificationResult(
-                            success=False,
-                            recipient=recipient,
-                            error_message=str(e)
-                        )
-                    )
-
-        return results 
\ No newline at end of file
+        """
+        Envia emails para múltiplos destinatários em blocos paralelos
+
+        Os resultados seguem a ordem dos destinatários. Se uma conexão cair
+        no meio de um bloco, os destinatários restantes desse bloco recebem
+        resultado de falha e os demais blocos seguem normalmente.
+        """
+        results: List[Optional[NotificationResult]] = [None] * len(recipients)
+        chunk_size = self.bulk_chunk_size
+        starts = range(0, len(recipients), chunk_size)
+        if len(starts) <= 1 or self.bulk_concurrency == 1:
+            for start in starts:
+                self._send_chunk(recipients, content, results, start, start + chunk_size)
+            return results
+
+        # Limita os blocos despachados para não enfileirar a campanha inteira
+        in_flight = threading.BoundedSemaphore(
+            max(self.bulk_max_in_flight // chunk_size, self.bulk_concurrency)
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.bulk_concurrency,
+            thread_name_prefix="email-bulk"
+        ) as executor:
+            for start in starts:
+                in_flight.acquire()
+                future = executor.submit(
+                    self._send_chunk, recipients, content, results, start, start + chunk_size
+                )
+                future.add_done_callback(lambda _: in_flight.release())
+        return results
+
+    def _send_chunk(
+        self,
+        recipients: List[NotificationRecipient],
+        content: NotificationContent,
+        results: List[Optional[NotificationResult]],
+        start: int,
+        end: int
+    ) -> None:
+        """
+        Envia os destinatários recipients[start:end] por uma conexão do pool
+
+        Se o servidor derrubar a conexão, o restante do bloco é tentado
+        uma vez em outra conexão, verificada com NOOP. Como em
+        SmtpConnectionPool.send, a mensagem em envio no momento da queda
+        pode ser entregue duas vezes.
+        """
+        end = min(end, len(recipients))
+        error: Optional[Exception] = None
+        for attempt in range(2):
+            try:
+                with self.pool.connection(check_health=attempt > 0) as server:
+                    self._send_chunk_over(server, recipients, content, results, start, end)
+                return
+            except smtplib.SMTPServerDisconnected as e:
+                error = e
+            except Exception as e:
+                error = e
+                break
+
+        # A conexão falhou: o restante do bloco fica com o erro
+        for position in range(start, end):
+            if results[position] is None:
+                results[position] = NotificationResult(
+                    success=False,
+                    recipient=recipients[position],
+                    error_message=str(error)
+                )
+
+    def _send_chunk_over(
+        self,
+        server: smtplib.SMTP,
+        recipients: List[NotificationRecipient],
+        content: NotificationContent,
+        results: List[Optional[NotificationResult]],
+        start: int,
+        end: int
+    ) -> None:
+        """Envia os destinatários do bloco ainda sem resultado pela conexão"""
+        for position in range(start, end):
+            if results[position] is not None:
+                continue
+            recipient = recipients[position]
+            if recipient.type != NotificationType.EMAIL:
+                results[position] = NotificationResult(
+                    success=False,
+                    recipient=recipient,
+                    error_message="Tipo de notificação inválido para este serviço"
+                )
+                continue
+            try:
+                message = self._create_email_message(recipient, content)
+            except Exception as e:
+                # Erro ao montar a mensagem (ex.: variável de template
+                # ausente): só este destinatário falha e a conexão segue em uso
+                results[position] = NotificationResult(
+                    success=False,
+                    recipient=recipient,
+                    error_message=str(e)
+                )
+                continue
+            try:
+                server.send_message(message)
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused) as e:
+                # Recusa do servidor: só este destinatário falha
+                results[position] = NotificationResult(
+                    success=False,
+                    recipient=recipient,
+                    error_message=str(e)
+                )
+                continue
+            results[position] = NotificationResult(
+                success=True,
+                recipient=recipient,
+                external_id=f"email_{recipient.identifier}"
+            )
+
+    def close(self) -> None:
+        """
+        Encerra as conexões SMTP abertas
+
+        O serviço continua utilizável: quem ainda o referencia (ex.: um
+        envio já na fila de um dispatcher) abre conexões novas sob demanda.
+        """
+        self.pool.reset()
@@ -0,0 +1,179 @@
+"""
+Servidor SMTP local e mínimo, usado como substituto do servidor real em
+testes e benchmarks.
+
+Implementa o suficiente do protocolo para o smtplib (EHLO/HELO, AUTH PLAIN
+e LOGIN, MAIL, RCPT, DATA, RSET, NOOP e QUIT), sem STARTTLS. O custo do
+handshake real (TLS e autenticação) é simulado com handshake_latency, e o
+do envio com message_latency. Um RCPT para drop_recipient derruba a
+conexão, simulando uma falha no meio de um lote.
+"""
+import base64
+import socket
+import socketserver
+import threading
+import time
+from typing import List, Optional, Set, Tuple
+
+_EHLO_REPLY = b"250-localhost\r\n250-AUTH PLAIN LOGIN\r\n250 SIZE 10485760\r\n"
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Atende uma conexão SMTP"""
+
+    server: "_SmtpTcpServer"
+
+    def handle(self) -> None:
+        owner = self.server.owner
+        owner._register(self.connection)
+        try:
+            time.sleep(owner.handshake_latency)
+            self._reply(b"220 localhost ESMTP\r\n")
+            self._session(owner)
+        except OSError:
+            pass
+        finally:
+            owner._unregister(self.connection)
+
+    def _reply(self, data: bytes) -> None:
+        self.wfile.write(data)
+        self.wfile.flush()
+
+    def _session(self, owner: "LocalSmtpServer") -> None:
+        sender = ""
+        recipients: List[str] = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self._reply(_EHLO_REPLY)
+            elif verb == "HELO":
+                self._reply(b"250 localhost\r\n")
+            elif verb == "AUTH":
+                if command.upper().startswith("AUTH LOGIN"):
+                    # Usuário e senha chegam em duas linhas separadas
+                    self._reply(b"334 " + base64.b64encode(b"Username:") + b"\r\n")
+                    self.rfile.readline()
+                    self._reply(b"334 " + base64.b64encode(b"Password:") + b"\r\n")
+                    self.rfile.readline()
+                time.sleep(owner.handshake_latency)
+                self._reply(b"235 2.7.0 Authentication successful\r\n")
+            elif verb == "MAIL":
+                sender = command.split(":", 1)[-1].strip()
+                recipients = []
+                self._reply(b"250 OK\r\n")
+            elif verb == "RCPT":
+                recipient = command.split(":", 1)[-1].strip()
+                if owner.drop_recipient and recipient.strip("<>") == owner.drop_recipient:
+                    return
+                recipients.append(recipient)
+                self._reply(b"250 OK\r\n")
+            elif verb == "DATA":
+                self._reply(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                data = bytearray()
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line == b".\r\n":
+                        break
+                    data += data_line
+                time.sleep(owner.message_latency)
+                owner._deliver(sender, recipients, bytes(data))
+                self._reply(b"250 OK queued\r\n")
+            elif verb in ("RSET", "NOOP"):
+                self._reply(b"250 OK\r\n")
+            elif verb == "QUIT":
+                self._reply(b"221 Bye\r\n")
+                return
+            else:
+                self._reply(b"502 Command not implemented\r\n")
+
+
+class _SmtpTcpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    owner: "LocalSmtpServer"
+
+
+class LocalSmtpServer:
+    """Servidor SMTP local executado em um thread de fundo"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        handshake_latency: float = 0.0,
+        message_latency: float = 0.0,
+        drop_recipient: Optional[str] = None
+    ):
+        """
+        Args:
+            host: Endereço de escuta
+            port: Porta de escuta (0 escolhe uma porta livre)
+            handshake_latency: Atraso simulado da saudação e da autenticação
+            message_latency: Atraso simulado de cada mensagem
+            drop_recipient: Endereço cujo RCPT derruba a conexão
+        """
+        self.handshake_latency = handshake_latency
+        self.message_latency = message_latency
+        self.drop_recipient = drop_recipient
+        self.messages: List[Tuple[str, List[str], bytes]] = []
+        self.connections_opened = 0
+
+        self._server = _SmtpTcpServer((host, port), _SmtpHandler)
+        self._server.owner = self
+        self._active: Set[socket.socket] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="local-smtp-server",
+            daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def drop_connections(self) -> None:
+        """Derruba todas as conexões abertas, como um servidor que reinicia"""
+        with self._lock:
+            active = list(self._active)
+        for connection in active:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Derruba as conexões e encerra o servidor"""
+        self.drop_connections()
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _register(self, connection: socket.socket) -> None:
+        with self._lock:
+            self._active.add(connection)
+            self.connections_opened += 1
+
+    def _unregister(self, connection: socket.socket) -> None:
+        with self._lock:
+            self._active.discard(connection)
+
+    def _deliver(self, sender: str, recipients: List[str], data: bytes) -> None:
+        with self._lock:
+            self.messages.append((sender, recipients, data))
+
+    def __enter__(self) -> "LocalSmtpServer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
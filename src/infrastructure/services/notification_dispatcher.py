@@ -0,0 +1,197 @@
+"""
+Despacho de notificações por uma fila limitada e um pool de workers.
+"""
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from src.domain.interfaces.notification_dispatcher import NotificationDispatcher, NotificationTicket
+from src.domain.interfaces.notification_service import (
+    NotificationContent,
+    NotificationRecipient,
+    NotificationResult,
+    NotificationService
+)
+
+_Job = Tuple[NotificationService, NotificationRecipient, NotificationContent, "Future[NotificationResult]"]
+
+# Marca de encerramento para os workers
+_STOP = None
+
+
+class ThreadedNotificationDispatcher(NotificationDispatcher):
+    """
+    Fila limitada de notificações drenada por threads de trabalho
+
+    Com a fila cheia, submit aguarda até enqueue_timeout por uma vaga e
+    então recusa a notificação (backpressure). close() para de aceitar
+    notificações e aguarda o envio das que já estão na fila.
+
+    O limite da fila é contado sob o lock, e a queue.Queue interna não tem
+    limite: assim as marcas de encerramento nunca bloqueiam close(), e o
+    teste de encerramento e a inserção na fila são atômicos em submit.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1_000,
+        enqueue_timeout: Optional[float] = 0.0,
+        max_tickets: int = 10_000
+    ):
+        """
+        Args:
+            workers: Quantidade de threads de envio
+            max_queue_size: Quantidade máxima de notificações aguardando envio
+            enqueue_timeout: Espera máxima por uma vaga na fila; 0 recusa
+                imediatamente e None aguarda indefinidamente
+            max_tickets: Quantidade de comprovantes recentes consultáveis
+                por get_ticket
+        """
+        if workers <= 0:
+            raise ValueError("Quantidade de workers deve ser maior que zero")
+        if max_queue_size <= 0:
+            raise ValueError("Tamanho da fila deve ser maior que zero")
+        self.max_queue_size = max_queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.max_tickets = max_tickets
+
+        self.accepted = 0
+        self.rejected = 0
+
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._tickets: "OrderedDict[str, NotificationTicket]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Sinalizada quando um worker libera uma vaga ou o dispatcher é encerrado
+        self._space = threading.Condition(self._lock)
+        self._queued = 0
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._run, name=f"notification-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(
+        self,
+        service: NotificationService,
+        recipient: NotificationRecipient,
+        content: NotificationContent
+    ) -> NotificationTicket:
+        """Enfileira a notificação e retorna o comprovante"""
+        future: "Future[NotificationResult]" = Future()
+        with self._space:
+            has_space = self._space.wait_for(
+                lambda: self._queued < self.max_queue_size or self._closed,
+                self.enqueue_timeout
+            )
+            if self._closed:
+                raise RuntimeError("Dispatcher de notificações encerrado")
+            if not has_space:
+                self.rejected += 1
+                raise RuntimeError("Fila de notificações cheia")
+            # Sob o lock: close() não pode enfileirar as marcas de
+            # encerramento entre o teste acima e esta inserção
+            self._queued += 1
+            self._queue.put_nowait((service, recipient, content, future))
+
+            ticket = NotificationTicket(str(uuid.uuid4()), future)
+            self.accepted += 1
+            self._tickets[ticket.id] = ticket
+            while len(self._tickets) > self.max_tickets:
+                self._tickets.popitem(last=False)
+        return ticket
+
+    def get_ticket(self, ticket_id: str) -> Optional[NotificationTicket]:
+        """Retorna um comprovante recente pelo ID, ou None"""
+        with self._lock:
+            return self._tickets.get(ticket_id)
+
+    @property
+    def pending(self) -> int:
+        """Quantidade de notificações aguardando envio"""
+        return self._queued
+
+    def _run(self) -> None:
+        """Laço de cada worker"""
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            self._release_slot()
+            self._send(job)
+
+    def _release_slot(self) -> None:
+        """Libera a vaga de uma notificação retirada da fila"""
+        with self._space:
+            self._queued -= 1
+            self._space.notify()
+
+    @staticmethod
+    def _send(job: _Job) -> None:
+        """Envia a notificação e entrega o resultado ao comprovante"""
+        service, recipient, content, future = job
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = service.send_notification(recipient, content)
+        except Exception as e:
+            result = NotificationResult(success=False, recipient=recipient, error_message=str(e))
+        future.set_result(result)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Para de aceitar notificações e aguarda o envio das enfileiradas
+
+        Args:
+            timeout: Espera máxima total pelos workers; notificações que
+                ainda estiverem na fila depois disso são marcadas como falha
+        """
+        with self._space:
+            if self._closed:
+                return
+            self._closed = True
+            # A fila interna não tem limite: enfileirar nunca bloqueia
+            for _ in self._workers:
+                self._queue.put_nowait(_STOP)
+            self._space.notify_all()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+        # Notificações que não chegaram a ser enviadas (workers presos além
+        # do timeout) recebem um resultado de falha
+        leftovers: List[_Job] = []
+        stops = 0
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is _STOP:
+                stops += 1
+            else:
+                self._release_slot()
+                leftovers.append(job)
+        # Devolve as marcas retiradas: um worker ainda ocupado precisa da sua
+        for _ in range(stops):
+            self._queue.put_nowait(_STOP)
+        for _, recipient, _, future in leftovers:
+            if future.set_running_or_notify_cancel():
+                future.set_result(NotificationResult(
+                    success=False,
+                    recipient=recipient,
+                    error_message="Dispatcher de notificações encerrado"
+                ))
+
+    def __enter__(self) -> "ThreadedNotificationDispatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,323 @@
+"""
+PaymentProcessor que distribui pagamentos entre processadores intercambiáveis.
+
+Para cada processador o roteador mantém médias móveis exponenciais (EWMA)
+da latência e da taxa de erro. Cada pagamento vai para o processador
+elegível mais rápido; processadores com erros demais ou lentos demais são
+ejetados por um circuit breaker e voltam a receber tráfego após um período
+de espera, com uma única requisição de teste (half-open).
+
+Só há repasse a outro processador quando o erro garante que a cobrança não
+foi feita (failover_errors); qualquer outro erro é devolvido ao chamador,
+que não sabe se o pagamento foi cobrado e não deve tentar em outro lugar.
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type
+
+from src.domain.entities.payment import PaymentInfo, PaymentProcessor
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Erros que acontecem antes de o pagamento chegar ao gateway
+DEFAULT_FAILOVER_ERRORS: Tuple[Type[Exception], ...] = (ConnectionRefusedError,)
+
+
+@dataclass(frozen=True)
+class PaymentRoute:
+    """Processador disponível para o roteador"""
+    name: str
+    processor: PaymentProcessor
+    # Moedas aceitas pelo processador; None aceita qualquer moeda
+    currencies: Optional[FrozenSet[str]] = None
+
+    def accepts(self, payment: PaymentInfo) -> bool:
+        """Indica se o processador pode receber o pagamento"""
+        return self.currencies is None or payment.currency in self.currencies
+
+
+@dataclass(frozen=True)
+class RouteStats:
+    """Estatísticas de roteamento de um processador"""
+    name: str
+    state: str
+    latency: Optional[float]
+    error_rate: float
+    requests: int
+    errors: int
+    ejections: int
+
+
+class _RouteState:
+    """Estado mutável de um processador, protegido pelo lock do roteador"""
+
+    __slots__ = (
+        "route", "latency", "error_rate", "requests", "errors",
+        "ejections", "state", "opened_at", "trial_in_flight"
+    )
+
+    def __init__(self, route: PaymentRoute):
+        self.route = route
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.ejections = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+
+
+class PaymentRouter(PaymentProcessor):
+    """
+    Envia cada pagamento ao processador saudável mais rápido
+
+    Uma exceção do processador conta como erro no circuit breaker. Se ela
+    for uma das failover_errors, o pagamento é repassado ao próximo
+    processador elegível; caso contrário ela é relançada, pois a cobrança
+    pode ter sido feita e repassá-la cobraria duas vezes. Uma recusa (False)
+    é resposta de negócio e é devolvida ao chamador. Com hedge_after, um
+    pagamento que demora mais que esse tempo é enviado também a um segundo
+    processador e vale a primeira resposta: use apenas com processadores
+    idempotentes, pois os dois podem cobrar.
+
+    Cada requisição guarda o estado do circuito em que foi enviada: só a
+    requisição de teste decide o circuito half-open, e respostas atrasadas
+    de requisições anteriores à ejeção apenas atualizam as estatísticas.
+    """
+
+    def __init__(
+        self,
+        routes: List[PaymentRoute],
+        alpha: float = 0.2,
+        error_threshold: float = 0.5,
+        max_latency: Optional[float] = None,
+        min_requests: int = 5,
+        cooldown: float = 30.0,
+        hedge_after: Optional[float] = None,
+        failover_errors: Tuple[Type[Exception], ...] = DEFAULT_FAILOVER_ERRORS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            routes: Processadores disponíveis
+            alpha: Peso de cada nova amostra nas médias móveis
+            error_threshold: Taxa de erro que abre o circuito
+            max_latency: Latência média, em segundos, que abre o circuito;
+                None desativa a ejeção por latência
+            min_requests: Requisições necessárias antes de abrir o circuito
+            cooldown: Tempo, em segundos, com o circuito aberto antes da
+                requisição de teste
+            hedge_after: Tempo, em segundos, antes de enviar o mesmo
+                pagamento a um segundo processador; None desativa o hedging
+            failover_errors: Exceções que garantem que a cobrança não foi
+                feita e permitem tentar o próximo processador
+            clock: Relógio monotônico (injetável para testes)
+        """
+        if not routes:
+            raise ValueError("Roteador deve ter pelo menos um processador")
+        names = [route.name for route in routes]
+        if len(set(names)) != len(names):
+            raise ValueError("Nomes de processadores devem ser únicos")
+        if not 0 < alpha <= 1:
+            raise ValueError("Alpha deve estar entre 0 e 1")
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.max_latency = max_latency
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.hedge_after = hedge_after
+        self.failover_errors = failover_errors
+        self.clock = clock
+
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+        self._routes = [_RouteState(route) for route in routes]
+        self._lock = threading.Lock()
+        self._executor = (
+            ThreadPoolExecutor(thread_name_prefix="payment-router")
+            if hedge_after is not None else None
+        )
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        """Processa o pagamento no processador elegível mais rápido"""
+        if self._executor is None:
+            return self._process_sequential(payment)
+        return self._process_hedged(payment)
+
+    def stats(self) -> Dict[str, RouteStats]:
+        """Retorna um retrato das estatísticas de cada processador"""
+        with self._lock:
+            return {
+                state.route.name: RouteStats(
+                    name=state.route.name,
+                    state=state.state,
+                    latency=state.latency,
+                    error_rate=state.error_rate,
+                    requests=state.requests,
+                    errors=state.errors,
+                    ejections=state.ejections
+                )
+                for state in self._routes
+            }
+
+    def _process_sequential(self, payment: PaymentInfo) -> bool:
+        """Tenta um processador por vez até obter uma resposta"""
+        tried: Set[str] = set()
+        last_error: Optional[Exception] = None
+        while True:
+            selected = self._select(payment, tried)
+            if selected is None:
+                raise RuntimeError("Nenhum processador de pagamento disponível") from last_error
+            state, trial = selected
+            tried.add(state.route.name)
+            try:
+                return self._call(state, trial, payment)
+            except self.failover_errors as e:
+                last_error = e
+
+    def _process_hedged(self, payment: PaymentInfo) -> bool:
+        """Envia a um segundo processador se o primeiro demorar demais"""
+        tried: Set[str] = set()
+        hedges: Set[Future] = set()
+        pending: Set[Future] = set()
+        last_error: Optional[Exception] = None
+        # Erro após o qual a cobrança pode ter sido feita: nada novo é enviado
+        charge_error: Optional[Exception] = None
+        while True:
+            can_send = charge_error is None and len(pending) < 2
+            selected = self._select(payment, tried) if can_send else None
+            if selected is not None:
+                state, trial = selected
+                tried.add(state.route.name)
+                future = self._executor.submit(self._call, state, trial, payment)
+                if pending:
+                    hedges.add(future)
+                    with self._lock:
+                        self.hedges_sent += 1
+                pending.add(future)
+            if not pending:
+                if charge_error is not None:
+                    raise charge_error
+                raise RuntimeError("Nenhum processador de pagamento disponível") from last_error
+
+            # Só espera com prazo se ainda houver para quem enviar o hedge
+            timeout = self.hedge_after if selected is not None and len(pending) < 2 else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except self.failover_errors as e:
+                    last_error = e
+                    continue
+                except Exception as e:
+                    # A cobrança pode ter sido feita: só a requisição já
+                    # enviada a outro processador ainda pode responder
+                    charge_error = e
+                    continue
+                if future in hedges:
+                    with self._lock:
+                        self.hedges_won += 1
+                return result
+
+    def _select(
+        self,
+        payment: PaymentInfo,
+        tried: Set[str]
+    ) -> Optional[Tuple[_RouteState, bool]]:
+        """
+        Escolhe o processador elegível com a menor latência média
+
+        Returns:
+            Optional[Tuple[_RouteState, bool]]: O processador e se a
+            requisição é a de teste do circuito half-open
+        """
+        now = self.clock()
+        with self._lock:
+            best: Optional[_RouteState] = None
+            for state in self._routes:
+                if state.route.name in tried or not state.route.accepts(payment):
+                    continue
+                if state.state == OPEN and now - state.opened_at >= self.cooldown:
+                    state.state = HALF_OPEN
+                if state.state == OPEN or (state.state == HALF_OPEN and state.trial_in_flight):
+                    continue
+                # Processadores sem amostras são escolhidos primeiro
+                if best is None or (state.latency or 0.0) < (best.latency or 0.0):
+                    best = state
+            if best is None:
+                return None
+            trial = best.state == HALF_OPEN
+            if trial:
+                best.trial_in_flight = True
+            return best, trial
+
+    def _call(self, state: _RouteState, trial: bool, payment: PaymentInfo) -> bool:
+        """Chama o processador e registra a latência e o resultado"""
+        started = self.clock()
+        try:
+            result = state.route.processor.process_payment(payment)
+        except Exception:
+            self._record(state, trial, self.clock() - started, failed=True)
+            raise
+        self._record(state, trial, self.clock() - started, failed=False)
+        return result
+
+    def _record(self, state: _RouteState, trial: bool, latency: float, failed: bool) -> None:
+        """
+        Atualiza as médias móveis e o circuit breaker do processador
+
+        Só a requisição de teste (trial) decide um circuito half-open; as
+        demais só mexem no circuito se ele ainda estiver fechado.
+        """
+        with self._lock:
+            state.requests += 1
+            if failed:
+                state.errors += 1
+            else:
+                state.latency = (
+                    latency if state.latency is None
+                    else self.alpha * latency + (1 - self.alpha) * state.latency
+                )
+            state.error_rate = self.alpha * failed + (1 - self.alpha) * state.error_rate
+
+            too_slow = self.max_latency is not None and latency > self.max_latency
+            if trial:
+                state.trial_in_flight = False
+                if failed or too_slow:
+                    self._open(state)
+                else:
+                    state.state = CLOSED
+                    state.error_rate = 0.0
+                    state.latency = latency
+                return
+
+            unhealthy = state.error_rate >= self.error_threshold or (
+                self.max_latency is not None
+                and state.latency is not None
+                and state.latency > self.max_latency
+            )
+            if state.state == CLOSED and state.requests >= self.min_requests and unhealthy:
+                self._open(state)
+
+    def _open(self, state: _RouteState) -> None:
+        """Abre o circuito do processador (chamado com o lock adquirido)"""
+        state.state = OPEN
+        state.opened_at = self.clock()
+        state.ejections += 1
+
+    def close(self) -> None:
+        """Encerra os threads usados pelo hedging"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "PaymentRouter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
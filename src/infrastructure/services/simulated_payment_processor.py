@@ -0,0 +1,70 @@
+"""
+Processadores de pagamento com latência simulada, para testes e
+benchmarks sem acesso a um gateway real.
+"""
+import asyncio
+import threading
+import time
+from typing import List
+
+from src.domain.entities.payment import AsyncPaymentProcessor, PaymentInfo, PaymentProcessor
+
+
+class SimulatedLatencyPaymentProcessor(AsyncPaymentProcessor):
+    """Processador assíncrono que simula a latência de ida e volta do gateway"""
+
+    def __init__(self, latency: float = 0.05, approve: bool = True):
+        """
+        Args:
+            latency: Tempo simulado de cada chamada, em segundos
+            approve: Resultado retornado para todos os pagamentos
+        """
+        self.latency = latency
+        self.approve = approve
+        self.processed: List[PaymentInfo] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def process_payment(self, payment: PaymentInfo) -> bool:
+        """Aguarda a latência simulada e retorna o resultado configurado"""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        self.processed.append(payment)
+        return self.approve
+
+
+class SimulatedLatencyBlockingPaymentProcessor(PaymentProcessor):
+    """
+    Processador síncrono que cobra a latência por ida e volta ao gateway
+
+    Tanto process_payment quanto process_payments custam uma única
+    latência, como em um gateway que aceita lotes.
+    """
+
+    def __init__(self, latency: float = 0.05, approve: bool = True):
+        """
+        Args:
+            latency: Tempo simulado de cada ida e volta, em segundos
+            approve: Resultado retornado para todos os pagamentos
+        """
+        self.latency = latency
+        self.approve = approve
+        self.round_trips = 0
+        self.batch_sizes: List[int] = []
+        self._lock = threading.Lock()
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        """Processa um pagamento em uma ida e volta"""
+        return self.process_payments([payment])[0]
+
+    def process_payments(self, payments: List[PaymentInfo]) -> List[bool]:
+        """Processa o lote inteiro em uma ida e volta"""
+        time.sleep(self.latency)
+        with self._lock:
+            self.round_trips += 1
+            self.batch_sizes.append(len(payments))
+        return [self.approve] * len(payments)
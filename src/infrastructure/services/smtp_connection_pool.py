@@ -0,0 +1,243 @@
+"""
+Pool de conexões SMTP autenticadas e reutilizáveis.
+
+Abrir uma conexão SMTP custa a conexão TCP, o STARTTLS e o LOGIN, várias
+idas e voltas a mais que o envio em si. O pool mantém até `size` conexões
+já autenticadas e as reutiliza entre chamadas.
+"""
+import smtplib
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.message import Message
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+class SmtpConnectionPool:
+    """
+    Pool limitado de conexões SMTP
+
+    Conexões ociosas por mais de idle_timeout são fechadas. Uma conexão
+    ociosa por mais de health_check_after recebe um NOOP antes de ser
+    reutilizada e é substituída se não responder. Conexões que falharam
+    com erro de transporte são descartadas; recusas do servidor (ex.:
+    destinatário inválido) não invalidam a conexão.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        size: int = 4,
+        idle_timeout: float = 60.0,
+        health_check_after: float = 1.0,
+        use_tls: bool = True,
+        timeout: float = 30.0,
+        acquire_timeout: Optional[float] = None,
+        connection_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP
+    ):
+        """
+        Args:
+            host: Servidor SMTP
+            port: Porta do servidor
+            user: Usuário para LOGIN (None não autentica)
+            password: Senha para LOGIN
+            size: Quantidade máxima de conexões abertas
+            idle_timeout: Tempo, em segundos, após o qual uma conexão ociosa é fechada
+            health_check_after: Tempo ocioso, em segundos, a partir do qual a
+                conexão é verificada com NOOP antes do uso (0 verifica sempre)
+            use_tls: Se True, executa STARTTLS em cada conexão nova
+            timeout: Timeout de socket das conexões
+            acquire_timeout: Tempo máximo de espera por uma conexão livre
+                (None aguarda indefinidamente)
+            connection_factory: Cria a conexão (injetável para testes)
+        """
+        if size <= 0:
+            raise ValueError("Tamanho do pool deve ser maior que zero")
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.acquire_timeout = acquire_timeout
+        self.connection_factory = connection_factory
+
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.reconnects = 0
+
+        # Conexões ociosas e o instante do último uso; as mais recentes à direita
+        self._idle: Deque[Tuple[smtplib.SMTP, float]] = deque()
+        # Geração de cada conexão emprestada; reset() avança a geração e as
+        # conexões de gerações anteriores são fechadas ao serem devolvidas
+        self._borrowed: Dict[smtplib.SMTP, int] = {}
+        self._generation = 0
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextmanager
+    def connection(self, check_health: bool = False) -> Iterator[smtplib.SMTP]:
+        """
+        Empresta uma conexão autenticada e a devolve ao pool ao final
+
+        Args:
+            check_health: Se True, verifica com NOOP mesmo uma conexão
+                usada há pouco
+        """
+        server = self._acquire(check_health)
+        healthy = True
+        try:
+            yield server
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # O servidor respondeu: a conexão continua utilizável
+            raise
+        except BaseException:
+            healthy = False
+            raise
+        finally:
+            self._release(server, healthy)
+
+    def send(self, message: Message) -> None:
+        """
+        Envia a mensagem, reconectando uma vez se o servidor derrubou a conexão
+
+        A nova tentativa não sabe em que ponto a conexão caiu: se ela caiu
+        depois que o servidor aceitou o DATA (antes da resposta chegar), a
+        mensagem pode ser entregue duas vezes. SMTP não tem idempotência;
+        use o Message-ID para que o destino descarte duplicatas.
+
+        Raises:
+            smtplib.SMTPException: Se o envio falhar
+        """
+        try:
+            with self.connection() as server:
+                server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            with self._lock:
+                self.reconnects += 1
+            # As demais conexões ociosas podem ter caído junto: verifica todas
+            with self.connection(check_health=True) as server:
+                server.send_message(message)
+
+    def _acquire(self, check_health: bool) -> smtplib.SMTP:
+        """Retorna uma conexão ociosa saudável ou abre uma nova"""
+        if self._closed:
+            raise RuntimeError("Pool de conexões SMTP encerrado")
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError("Tempo limite ao aguardar conexão SMTP")
+        try:
+            server = self._take_idle(check_health)
+            if server is None:
+                server = self._connect()
+            with self._lock:
+                self._borrowed[server] = self._generation
+            return server
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _take_idle(self, check_health: bool) -> Optional[smtplib.SMTP]:
+        """Retira a conexão ociosa mais recente que ainda esteja saudável"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                server, last_used = self._idle.pop()
+            idle_for = time.monotonic() - last_used
+            if idle_for > self.idle_timeout:
+                self._quit(server)
+                continue
+            if (check_health or idle_for >= self.health_check_after) and not self._is_alive(server):
+                self._quit(server)
+                continue
+            with self._lock:
+                self.connections_reused += 1
+            return server
+
+    def _connect(self) -> smtplib.SMTP:
+        """Abre e autentica uma conexão nova"""
+        server = self.connection_factory(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.user:
+                server.login(self.user, self.password or "")
+        except BaseException:
+            self._quit(server)
+            raise
+        with self._lock:
+            self.connections_opened += 1
+        return server
+
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        """Verifica a conexão com NOOP"""
+        try:
+            code, _ = server.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == 250
+
+    def _release(self, server: smtplib.SMTP, healthy: bool) -> None:
+        """Devolve a conexão ao pool, ou a fecha, e libera a vaga"""
+        expired: List[smtplib.SMTP] = []
+        now = time.monotonic()
+        with self._lock:
+            generation = self._borrowed.pop(server, None)
+            if healthy and not self._closed and generation == self._generation:
+                self._idle.append((server, now))
+                server = None
+            # As mais antigas ficam à esquerda
+            while self._idle and now - self._idle[0][1] > self.idle_timeout:
+                expired.append(self._idle.popleft()[0])
+        if server is not None:
+            expired.append(server)
+        self._slots.release()
+        for connection in expired:
+            self._quit(connection)
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        """Encerra a conexão educadamente e, se não der, fecha o socket"""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    @property
+    def idle_connections(self) -> int:
+        """Quantidade de conexões ociosas no pool"""
+        return len(self._idle)
+
+    def reset(self) -> None:
+        """
+        Fecha as conexões ociosas e as emprestadas, estas ao serem devolvidas
+
+        O pool continua utilizável: novos empréstimos abrem conexões novas.
+        """
+        with self._lock:
+            self._generation += 1
+            idle = [server for server, _ in self._idle]
+            self._idle.clear()
+        for server in idle:
+            self._quit(server)
+
+    def close(self) -> None:
+        """Fecha as conexões ociosas; as emprestadas são fechadas ao serem devolvidas"""
+        with self._lock:
+            self._closed = True
+        self.reset()
+
+    def __enter__(self) -> "SmtpConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
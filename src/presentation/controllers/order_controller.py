@@ -1,14 +1,28 @@
 """
 Controller para operações de pedido.
 """
-from dataclasses import asdict
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
-from src.application.dto.order_dto import CreateOrderInput, OrderItemInput
+from src.application.dto.order_dto import (
+    CreateOrderInput,
+    CreateOrdersBatchInput,
+    OrderItemInput,
+    OrderOutput
+)
 from src.application.use_cases.create_order_use_case import CreateOrderUseCase
-from src.domain.payment import CreditCardProcessor
+from src.application.use_cases.create_orders_batch_use_case import CreateOrdersBatchUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.order import check_quantity
+from src.domain.entities.payment import CreditCardProcessor, PayPalProcessor, PixProcessor
+from src.domain.interfaces.use_case import Response
+from src.infrastructure.repositories.memory_idempotency_store import InMemoryIdempotencyStore
 from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+from src.infrastructure.services.payment_router import PaymentRoute, PaymentRouter
+
+# Erros possíveis ao converter os itens recebidos: campo ausente, tipo
+# errado, preço que não é número ou com mais casas decimais que o suportado
+INVALID_INPUT_ERRORS = (KeyError, TypeError, ValueError, ArithmeticError)
 
 
 class OrderController:
@@ -17,49 +31,151 @@ class OrderController:
     def __init__(self):
         # Inicializa o repositório e o processador de pagamento
         self.order_repository = InMemoryOrderRepository()
-        self.payment_processor = CreditCardProcessor()
+        self.payment_processor = PaymentRouter([
+            PaymentRoute("credit_card", CreditCardProcessor()),
+            PaymentRoute("paypal", PayPalProcessor()),
+            PaymentRoute("pix", PixProcessor(), currencies=frozenset({"BRL"}))
+        ])
+        self.idempotency_store = InMemoryIdempotencyStore()
         
         # Inicializa os use cases
         self.create_order_use_case = CreateOrderUseCase(
             self.order_repository,
-            self.payment_processor
+            self.payment_processor,
+            self.idempotency_store
+        )
+        self.create_orders_batch_use_case = CreateOrdersBatchUseCase(
+            self.order_repository,
+            self.payment_processor,
+            self.idempotency_store
         )
 
-    def create_order(self, items: List[dict]) -> dict:
+    def create_order(self, items: List[dict], idempotency_key: Optional[str] = None) -> dict:
         """
         Cria um novo pedido
         
         Args:
             items: Lista de itens do pedido no formato:
                   [{"product_id": "1", "quantity": 2, "price": "10.00"}, ...]
+            idempotency_key: Chave opcional; repetições com a mesma chave
+                  recebem a resposta da primeira criação
             
         Returns:
             dict: Resposta do use case
         """
-        # Converte os itens para DTOs
-        order_items = [
-            OrderItemInput(
-                product_id=item["product_id"],
-                quantity=item["quantity"],
-                price=Decimal(item["price"])
-            )
-            for item in items
-        ]
-        
-        # Cria o DTO de entrada
-        input_dto = CreateOrderInput(items=order_items)
+        # Cria o DTO de entrada; dados malformados viram resposta de erro
+        try:
+            input_dto = self._to_order_input(items, idempotency_key)
+        except INVALID_INPUT_ERRORS as e:
+            return self._invalid_input(e)
         
         # Executa o use case
         response = self.create_order_use_case.execute(input_dto)
         
         # Converte a resposta para dict
+        return self._response_to_dict(response)
+
+    def create_orders_batch(self, orders: List[List[dict]]) -> dict:
+        """
+        Cria vários pedidos de uma vez
+        
+        Args:
+            orders: Lista de pedidos, cada um com os itens no formato de create_order
+            
+        Returns:
+            dict: Um resultado por pedido, na ordem de entrada
+        """
+        # Converte cada pedido separadamente: um pedido malformado falha sozinho
+        results: List[Optional[dict]] = [None] * len(orders)
+        inputs: List[CreateOrderInput] = []
+        positions: List[int] = []
+        for position, items in enumerate(orders):
+            try:
+                inputs.append(self._to_order_input(items))
+                positions.append(position)
+            except INVALID_INPUT_ERRORS as e:
+                results[position] = self._invalid_input(e)
+
+        response = self.create_orders_batch_use_case.execute(
+            CreateOrdersBatchInput(orders=inputs)
+        )
+
+        if response.success and response.data:
+            for position, result in zip(positions, response.data.results):
+                results[position] = self._response_to_dict(result)
+            return {
+                "success": True,
+                "data": {
+                    "results": results,
+                    "succeeded": response.data.succeeded
+                }
+            }
+        else:
+            return {
+                "success": False,
+                "error": response.error
+            }
+
+    @staticmethod
+    def _to_order_input(
+        items: List[dict],
+        idempotency_key: Optional[str] = None
+    ) -> CreateOrderInput:
+        """
+        Converte os itens recebidos em DTO, com os preços em Money e as
+        quantidades conferidas como int
+
+        Raises:
+            KeyError, TypeError, ValueError, ArithmeticError: Se os itens
+                estiverem malformados (ver INVALID_INPUT_ERRORS)
+        """
+        return CreateOrderInput(
+            items=[
+                OrderItemInput(
+                    product_id=item["product_id"],
+                    quantity=check_quantity(item["quantity"]),
+                    price=Money.from_decimal(Decimal(item["price"]))
+                )
+                for item in items
+            ],
+            idempotency_key=idempotency_key
+        )
+
+    @staticmethod
+    def _invalid_input(error: Exception) -> dict:
+        """Resposta de erro para itens que não puderam ser convertidos"""
+        return {
+            "success": False,
+            "error": f"Dados do pedido inválidos: {error}"
+        }
+
+    @classmethod
+    def _response_to_dict(cls, response: Response[OrderOutput]) -> dict:
+        """Converte a resposta de um pedido para dict"""
         if response.success and response.data:
             return {
                 "success": True,
-                "data": asdict(response.data)
+                "data": cls._order_to_dict(response.data)
             }
         else:
             return {
                 "success": False,
                 "error": response.error
-            } 
\ No newline at end of file
+            }
+
+    @staticmethod
+    def _order_to_dict(order: OrderOutput) -> dict:
+        """Converte o DTO de saída para dict, com os valores em Decimal"""
+        return {
+            "id": order.id,
+            "items": [
+                {
+                    "product_id": item.product_id,
+                    "quantity": item.quantity,
+                    "price": item.price.to_decimal()
+                }
+                for item in order.items
+            ],
+            "total": order.total.to_decimal(),
+            "currency": order.total.currency
+        }
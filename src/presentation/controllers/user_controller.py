@@ -2,6 +2,7 @@
 Controller para operações de usuário.
 """
 from dataclasses import asdict
+from typing import Iterator, Optional
 
 from src.application.dto.user_dto import CreateUserInput
 from src.application.use_cases.create_user_use_case import CreateUserUseCase
@@ -49,26 +50,56 @@ class UserController:
                 "error": response.error
             }
 
-    def list_users(self) -> dict:
+    def list_users(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> dict:
         """
-        Lista todos os usuários
+        Lista os usuários, opcionalmente paginados
         
+        Args:
+            limit: Tamanho da página; None lista todos
+            cursor: Cursor retornado pela página anterior
+            
         Returns:
-            dict: Lista de usuários
+            dict: Lista de usuários e o cursor da próxima página
         """
         # Executa o use case
-        response = self.list_users_use_case.execute(ListUsersInput())
+        response = self.list_users_use_case.execute(
+            ListUsersInput(limit=limit, cursor=cursor)
+        )
         
         # Converte a resposta para dict
         if response.success and response.data:
             return {
                 "success": True,
                 "data": {
-                    "users": [asdict(user) for user in response.data.users]
+                    "users": [asdict(user) for user in response.data.users],
+                    "next_cursor": response.data.next_cursor
                 }
             }
         else:
             return {
                 "success": False,
                 "error": response.error
-            } 
\ No newline at end of file
+            }
+
+    def iter_user_pages(self, page_size: int = 100) -> Iterator[dict]:
+        """
+        Percorre todos os usuários página a página, sob demanda
+        
+        Apenas uma página fica em memória por vez, independente do
+        tamanho da tabela.
+        
+        Args:
+            page_size: Quantidade de usuários por página
+            
+        Returns:
+            Iterator[dict]: Gerador de respostas no formato de list_users
+        """
+        cursor = None
+        while True:
+            page = self.list_users(limit=page_size, cursor=cursor)
+            yield page
+            if not page["success"]:
+                return
+            cursor = page["data"]["next_cursor"]
+            if cursor is None:
+                return
@@ -0,0 +1,100 @@
+"""
+Testes para o logging assíncrono estruturado.
+"""
+import io
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.payment import CreditCardProcessor, PaymentInfo
+from src.infrastructure.config.logging_config import APP_LOGGER, LoggingConfig
+from src.infrastructure.services.async_log_handler import AsyncLogHandler
+
+
+@pytest.fixture
+def app_logger():
+    """Restaura o logger da aplicação após o teste"""
+    logger = logging.getLogger(APP_LOGGER)
+    level, propagate = logger.level, logger.propagate
+    yield logger
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
+class BlockingStream(io.StringIO):
+    """Stream cuja escrita aguarda liberação, simulando I/O lento"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+def test_payment_is_logged_as_structured_record(app_logger):
+    """Testa que o processador registra um JSON com os campos do pagamento"""
+    stream = io.StringIO()
+    handler = LoggingConfig.configure(stream=stream)
+
+    CreditCardProcessor().process_payment(
+        PaymentInfo(amount=Money(1050), description="Pedido 1")
+    )
+    handler.flush()
+
+    entry = json.loads(stream.getvalue())
+    assert entry["message"] == "Processando pagamento"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "src.domain.entities.payment"
+    assert entry["method"] == "credit_card"
+    assert entry["amount"] == 1050
+    assert entry["currency"] == "BRL"
+
+
+def test_records_below_level_are_not_queued(app_logger):
+    """Testa a filtragem por nível antes do enfileiramento"""
+    stream = io.StringIO()
+    handler = LoggingConfig.configure(level=logging.WARNING, stream=stream)
+
+    CreditCardProcessor().process_payment(
+        PaymentInfo(amount=Money(1050), description="Pedido 1")
+    )
+    logging.getLogger("src.test").warning("atenção")
+    handler.flush()
+
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == ["atenção"]
+    assert handler.written == 1
+
+
+def test_full_queue_drops_and_counts():
+    """Testa o descarte, sem bloqueio, quando a fila está cheia"""
+    stream = BlockingStream()
+    handler = AsyncLogHandler(stream=stream, capacity=10, batch_size=10, flush_interval=0.001)
+    logger = logging.getLogger("test_full_queue")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        # O primeiro lote fica preso na escrita; os demais enchem a fila
+        logger.warning("primeiro")
+        while handler._records:
+            time.sleep(0.001)
+        for i in range(25):
+            logger.warning("registro %d", i)
+
+        assert handler.dropped == 15
+        stream.release.set()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert handler.written == 11
+    assert len(stream.getvalue().splitlines()) == 11
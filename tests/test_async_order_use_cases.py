@@ -0,0 +1,121 @@
+"""
+Testes para o use case assíncrono de criação de pedidos.
+"""
+import asyncio
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.application.dto.order_dto import CreateOrderInput, OrderItemInput
+from src.application.use_cases.async_create_order_use_case import AsyncCreateOrderUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.payment import AsyncPixProcessor
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+from src.infrastructure.services.simulated_payment_processor import SimulatedLatencyPaymentProcessor
+
+
+def make_input(price: str = "10.00") -> CreateOrderInput:
+    """Cria o DTO de um pedido com um único item"""
+    return CreateOrderInput(items=[
+        OrderItemInput(product_id="prod1", quantity=1, price=Money.from_decimal(Decimal(price)))
+    ])
+
+
+def test_async_create_order_success():
+    """Testa a criação assíncrona de um pedido"""
+    repository = InMemoryOrderRepository()
+    use_case = AsyncCreateOrderUseCase(repository, AsyncPixProcessor())
+
+    response = asyncio.run(use_case.execute(make_input("12.34")))
+
+    assert response.success is True
+    assert response.data.total == Money(1234)
+    assert repository.find_by_id(response.data.id) is not None
+
+
+def test_async_save_runs_outside_event_loop():
+    """Testa que o save síncrono do repositório não roda no thread do event loop"""
+    class ThreadRecordingRepository(InMemoryOrderRepository):
+        def save(self, order):
+            self.save_thread = threading.current_thread()
+            super().save(order)
+
+    repository = ThreadRecordingRepository()
+    use_case = AsyncCreateOrderUseCase(repository, AsyncPixProcessor())
+
+    response = asyncio.run(use_case.execute(make_input()))
+
+    assert response.success is True
+    assert repository.save_thread is not threading.main_thread()
+
+
+def test_async_orders_await_payment_concurrently():
+    """Testa que vários pedidos aguardam o pagamento ao mesmo tempo"""
+    processor = SimulatedLatencyPaymentProcessor(latency=0.1)
+    use_case = AsyncCreateOrderUseCase(InMemoryOrderRepository(), processor)
+
+    start = time.perf_counter()
+    responses = asyncio.run(use_case.execute_all([make_input() for _ in range(50)]))
+    elapsed = time.perf_counter() - start
+
+    assert all(response.success for response in responses)
+    assert processor.max_in_flight == 50
+    # Sequencialmente seriam 5 segundos
+    assert elapsed < 1.0
+
+
+def test_async_execute_all_respects_max_concurrency():
+    """Testa o limite de pagamentos simultâneos"""
+    processor = SimulatedLatencyPaymentProcessor(latency=0.01)
+    use_case = AsyncCreateOrderUseCase(InMemoryOrderRepository(), processor)
+
+    responses = asyncio.run(use_case.execute_all([make_input() for _ in range(20)], max_concurrency=5))
+
+    assert len(responses) == 20
+    assert processor.max_in_flight == 5
+
+
+def test_async_payment_timeout():
+    """Testa o prazo máximo do pagamento"""
+    repository = InMemoryOrderRepository()
+    processor = SimulatedLatencyPaymentProcessor(latency=1.0)
+    use_case = AsyncCreateOrderUseCase(repository, processor, payment_timeout=0.05)
+
+    response = asyncio.run(use_case.execute(make_input()))
+
+    assert response.success is False
+    assert "Tempo limite excedido" in response.error
+    assert repository.orders == {}
+
+
+def test_async_create_order_cancellation():
+    """Testa que o cancelamento é propagado e o pedido não é salvo"""
+    repository = InMemoryOrderRepository()
+    processor = SimulatedLatencyPaymentProcessor(latency=1.0)
+    use_case = AsyncCreateOrderUseCase(repository, processor)
+
+    async def run() -> None:
+        task = asyncio.create_task(use_case.execute(make_input()))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run())
+    assert repository.orders == {}
+    assert processor.in_flight == 0
+
+
+def test_async_payment_refused():
+    """Testa a recusa do pagamento"""
+    use_case = AsyncCreateOrderUseCase(
+        InMemoryOrderRepository(),
+        SimulatedLatencyPaymentProcessor(latency=0, approve=False)
+    )
+
+    response = asyncio.run(use_case.execute(make_input()))
+
+    assert response.success is False
+    assert response.error == "Falha no processamento do pagamento"
@@ -0,0 +1,109 @@
+"""
+Testes para o processador de pagamentos com micro-batching.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.payment import PaymentInfo, PaymentProcessor
+from src.infrastructure.services.batching_payment_processor import BatchingPaymentProcessor
+from src.infrastructure.services.simulated_payment_processor import (
+    SimulatedLatencyBlockingPaymentProcessor
+)
+
+
+class LimitPaymentProcessor(SimulatedLatencyBlockingPaymentProcessor):
+    """Aprova apenas pagamentos até o limite, para diferenciar os resultados"""
+
+    def process_payments(self, payments):
+        super().process_payments(payments)
+        return [payment.amount <= Money(1000) for payment in payments]
+
+
+class FailingPaymentProcessor(PaymentProcessor):
+    """Processador cujo gateway está fora do ar"""
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        raise ConnectionError("Gateway indisponível")
+
+
+def make_payment(amount: int) -> PaymentInfo:
+    """Cria um pagamento de teste"""
+    return PaymentInfo(amount=Money(amount), description=f"Pagamento {amount}")
+
+
+def test_concurrent_payments_are_batched():
+    """Testa que chamadas concorrentes compartilham idas ao gateway"""
+    gateway = LimitPaymentProcessor(latency=0.02)
+    amounts = [500 + i * 20 for i in range(64)]
+
+    with BatchingPaymentProcessor(gateway, max_batch_size=16) as processor:
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            results = list(executor.map(
+                lambda amount: processor.process_payment(make_payment(amount)),
+                amounts
+            ))
+
+    # Cada chamador recebe o próprio resultado
+    assert results == [amount <= 1000 for amount in amounts]
+    assert sum(gateway.batch_sizes) == 64
+    assert max(gateway.batch_sizes) <= 16
+    assert gateway.round_trips < 64
+
+
+def test_window_mode_fills_batches():
+    """Testa a formação de lotes pela janela de tempo"""
+    gateway = SimulatedLatencyBlockingPaymentProcessor(latency=0)
+    barrier = threading.Barrier(8)
+
+    def pay(amount: int) -> bool:
+        barrier.wait()
+        return processor.process_payment(make_payment(amount))
+
+    with BatchingPaymentProcessor(gateway, max_batch_size=8, window=1.0, flush_on_idle=False) as processor:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(pay, range(8)))
+
+    assert all(results)
+    # O lote é enviado ao atingir o tamanho máximo, antes de vencer a janela
+    assert gateway.batch_sizes == [8]
+
+
+def test_gateway_errors_reach_every_caller():
+    """Testa que uma falha do gateway é entregue a todos os chamadores do lote"""
+    with BatchingPaymentProcessor(FailingPaymentProcessor()) as processor:
+        with pytest.raises(ConnectionError, match="Gateway indisponível"):
+            processor.process_payment(make_payment(100))
+
+
+def test_close_flushes_pending_and_rejects_new_payments():
+    """Testa o encerramento com pagamentos pendentes"""
+    gateway = SimulatedLatencyBlockingPaymentProcessor(latency=0)
+    processor = BatchingPaymentProcessor(gateway, window=10, flush_on_idle=False)
+    futures = [processor.submit(make_payment(100)) for _ in range(3)]
+
+    processor.close()
+
+    assert [future.result(timeout=1) for future in futures] == [True, True, True]
+    with pytest.raises(RuntimeError, match="encerrado"):
+        processor.process_payment(make_payment(100))
+
+
+def test_window_mode_keeps_every_dispatcher_alive():
+    """Testa que um despachante que perde o lote para outro volta a aguardar"""
+    gateway = SimulatedLatencyBlockingPaymentProcessor(latency=0)
+
+    with BatchingPaymentProcessor(
+        gateway, max_batch_size=100, window=0.02, flush_on_idle=False, max_in_flight=4
+    ) as processor:
+        # Chegadas espaçadas acordam vários despachantes para o mesmo lote
+        futures = []
+        for _ in range(20):
+            futures.append(processor.submit(make_payment(100)))
+            time.sleep(0.002)
+
+        assert all(future.result(timeout=1) for future in futures)
+        assert [dispatcher.is_alive() for dispatcher in processor._dispatchers] == [True] * 4
@@ -0,0 +1,169 @@
+"""
+Testes para os repositórios com cache read-through.
+"""
+from decimal import Decimal
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.infrastructure.repositories.caching_repository import CachingOrderRepository, LruCache
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+
+
+class CountingOrderRepository(InMemoryOrderRepository):
+    """Backend que conta as leituras recebidas"""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def find_by_id(self, order_id: str):
+        self.reads += 1
+        return super().find_by_id(order_id)
+
+    def find_many(self, order_ids):
+        order_ids = list(order_ids)
+        self.reads += len(order_ids)
+        return super().find_many(order_ids)
+
+
+class FakeClock:
+    """Relógio controlado manualmente"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_order(order_id: str) -> Order:
+    """Cria um pedido de teste"""
+    return Order(
+        id=order_id,
+        items=[OrderItem(product_id="prod1", quantity=1, price=Money.from_decimal(Decimal("10.00")))],
+        total=Money.from_decimal(Decimal("10.00"))
+    )
+
+
+def test_recent_order_is_served_from_cache():
+    """Testa que o pedido recém-salvo é lido sem acessar o backend"""
+    backend = CountingOrderRepository()
+    repo = CachingOrderRepository(backend)
+
+    repo.save(make_order("1"))
+    for _ in range(10):
+        assert repo.find_by_id("1").id == "1"
+
+    assert backend.reads == 0
+    assert repo.stats.hits == 10
+    assert repo.stats.misses == 0
+
+
+def test_read_through_and_lru_eviction():
+    """Testa o carregamento sob demanda e a eviction do item menos recente"""
+    backend = CountingOrderRepository()
+    for order_id in ("1", "2", "3"):
+        backend.save(make_order(order_id))
+    repo = CachingOrderRepository(backend, LruCache(max_size=2))
+
+    repo.find_by_id("1")
+    repo.find_by_id("2")
+    repo.find_by_id("1")  # "1" passa a ser o mais recente
+    repo.find_by_id("3")  # remove "2"
+
+    assert repo.stats.evictions == 1
+    assert backend.reads == 3
+    repo.find_by_id("1")
+    assert backend.reads == 3
+    repo.find_by_id("2")
+    assert backend.reads == 4
+
+
+def test_ttl_and_negative_lookups_expire():
+    """Testa a expiração por TTL e o cache curto de buscas negativas"""
+    clock = FakeClock()
+    backend = CountingOrderRepository()
+    repo = CachingOrderRepository(backend, LruCache(ttl=10, negative_ttl=1, clock=clock))
+
+    # Busca negativa fica em cache por pouco tempo
+    assert repo.find_by_id("1") is None
+    assert repo.find_by_id("1") is None
+    assert backend.reads == 1
+
+    backend.save(make_order("1"))
+    clock.now = 2
+    assert repo.find_by_id("1") is not None
+    assert backend.reads == 2
+
+    # Entrada positiva expira após o TTL
+    clock.now = 11
+    repo.find_by_id("1")
+    assert backend.reads == 2
+    clock.now = 13
+    repo.find_by_id("1")
+    assert backend.reads == 3
+
+
+def test_find_many_only_loads_misses():
+    """Testa que find_many consulta o backend apenas para os IDs fora do cache"""
+    backend = CountingOrderRepository()
+    repo = CachingOrderRepository(backend)
+    repo.save(make_order("1"))
+    backend.save(make_order("2"))
+
+    found = repo.find_many(["2", "1", "3"])
+
+    assert [order.id if order else None for order in found] == ["2", "1", None]
+    assert backend.reads == 2
+
+
+def test_concurrent_save_during_miss_is_not_overwritten():
+    """Testa que a leitura iniciada antes de um save não guarda o valor antigo"""
+    class InterleavingRepository(InMemoryOrderRepository):
+        """Backend que simula um save concorrente durante a leitura"""
+
+        def find_by_id(self, order_id: str):
+            stale = super().find_by_id(order_id)
+            if order_id == "1" and not hasattr(self, "interleaved"):
+                self.interleaved = True
+                updated = make_order("1")
+                updated.items.append(OrderItem("prod2", 1, Money(500)))
+                updated.calculate_total()
+                repo.save(updated)
+            return stale
+
+    backend = InterleavingRepository()
+    backend.save(make_order("1"))
+    repo = CachingOrderRepository(backend)
+
+    assert repo.find_by_id("1").total == Money(1000)  # Valor lido antes do save
+    assert repo.find_by_id("1").total == Money(1500)
+
+
+def test_order_queries_are_forwarded_to_backend():
+    """Testa o repasse das consultas específicas do backend"""
+    backend = InMemoryOrderRepository()
+    repo = CachingOrderRepository(backend)
+    repo.save(make_order("1"))
+
+    assert [order.id for order in repo.find_by_product("prod1")] == ["1"]
+    assert [order.id for order in repo.find_by_total_range(Money(0), Money(1000))] == ["1"]
+
+
+def test_cached_orders_are_not_shared_between_readers():
+    """Testa que alterar um pedido lido não altera a cópia do cache"""
+    repo = CachingOrderRepository(InMemoryOrderRepository())
+    order = make_order("1")
+    repo.save(order)
+
+    # Alterações no pedido salvo e no pedido lido ficam fora do cache até um save
+    order.update_quantity("prod1", 5)
+    found = repo.find_by_id("1")
+    assert found.total == Money(1000)
+    found.update_quantity("prod1", 3)
+    assert repo.find_by_id("1").items[0].quantity == 1
+    assert repo.find_many(["1"])[0].total == Money(1000)
+
+    repo.save(found)
+    assert repo.find_by_id("1").total == Money(3000)
+    assert not hasattr(repo, "delete")
@@ -0,0 +1,121 @@
+"""
+Testes de concorrência para os repositórios thread-safe.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.user import User
+from src.infrastructure.repositories.sharded_memory_repository import (
+    ShardedInMemoryOrderRepository,
+    ShardedInMemoryUserRepository
+)
+from src.infrastructure.repositories.sqlite_order_repository import SqliteOrderRepository
+from src.infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+
+THREADS = 8
+OPERATIONS = 2_000
+
+
+def test_concurrent_user_saves_keep_email_unique():
+    """Testa que cadastros concorrentes com o mesmo email geram um único usuário"""
+    repo = ShardedInMemoryUserRepository(shards=8)
+    barrier = threading.Barrier(THREADS)
+    accepted = []
+
+    def signup(worker: int) -> None:
+        barrier.wait()
+        for i in range(200):
+            try:
+                repo.save(User(
+                    id=f"{worker}-{i}",
+                    name="User",
+                    email=f"user{i}@example.com",
+                    created_at=datetime.now()
+                ))
+                accepted.append(i)
+            except ValueError:
+                pass
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(signup, range(THREADS)))
+
+    assert sorted(accepted) == list(range(200))
+    assert len(repo.find_all()) == 200
+    assert all(repo.find_by_email(f"user{i}@example.com") for i in range(200))
+
+
+def test_concurrent_save_find_delete_stress():
+    """Testa gravações, leituras, remoções e snapshots concorrentes"""
+    repo = ShardedInMemoryOrderRepository(shards=8)
+    errors = []
+
+    def worker(worker_id: int) -> int:
+        operations = 0
+        try:
+            for i in range(OPERATIONS):
+                order_id = f"{worker_id}-{i % 50}"
+                repo.save(Order(
+                    id=order_id,
+                    items=[OrderItem(product_id="p", quantity=1, price=Money.from_decimal(Decimal("1.00")))],
+                    total=Money.from_decimal(Decimal("1.00"))
+                ))
+                found = repo.find_by_id(order_id)
+                assert found is None or found.id == order_id
+                if i % 3 == 0:
+                    repo.delete(order_id)
+                if i % 100 == 0:
+                    repo.find_all()
+                operations += 1
+        except Exception as e:  # pragma: no cover - reportado abaixo
+            errors.append(e)
+        return operations
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        total_operations = sum(executor.map(worker, range(THREADS)))
+
+    assert errors == []
+    assert total_operations == THREADS * OPERATIONS
+
+
+def test_concurrent_sqlite_save_many(tmp_path):
+    """Testa save_many e leituras concorrentes sobre a conexão SQLite compartilhada"""
+    orders = SqliteOrderRepository(str(tmp_path / "orders.db"))
+    users = SqliteUserRepository(str(tmp_path / "users.db"))
+    errors = []
+
+    def worker(worker_id: int) -> None:
+        try:
+            for i in range(100):
+                batch = [
+                    Order(
+                        id=f"{worker_id}-{i}-{n}",
+                        items=[OrderItem("p", n + 1, Money(100)), OrderItem("q", 1, Money(50))],
+                        total=Money(100 * (n + 1) + 50)
+                    )
+                    for n in range(3)
+                ]
+                orders.save_many(batch)
+                found = orders.find_by_id(batch[0].id)
+                assert found is not None and len(found.items) == 2
+                users.save_many([User(
+                    id=f"{worker_id}-{i}",
+                    name="User",
+                    email=f"user{worker_id}-{i}@example.com",
+                    created_at=datetime.now()
+                )])
+        except Exception as e:  # pragma: no cover - reportado abaixo
+            errors.append(e)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(worker, range(THREADS)))
+
+    assert errors == []
+    found = orders.find_many(f"{w}-{i}-2" for w in range(THREADS) for i in range(100))
+    assert all(order is not None and order.total == Money(350) for order in found)
+    assert len(list(users.iter_users())) == THREADS * 100
+    orders.close()
+    users.close()
@@ -0,0 +1,79 @@
+"""
+Testes para o value object Money e o cálculo de totais do pedido.
+"""
+from decimal import Decimal
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+
+
+def test_money_decimal_round_trip():
+    """Testa a conversão exata entre Decimal e unidades mínimas"""
+    money = Money.from_decimal(Decimal("10.50"))
+
+    assert money.amount == 1050
+    assert money.currency == "BRL"
+    assert money.to_decimal() == Decimal("10.50")
+    assert str(money.to_decimal()) == "10.50"
+
+
+def test_money_rejects_extra_precision():
+    """Testa que valores com mais casas decimais que o suportado são rejeitados"""
+    with pytest.raises(ValueError, match="excede 2 casas decimais"):
+        Money.from_decimal(Decimal("1.005"))
+
+
+def test_money_requires_integer_units():
+    """Testa que valores e quantidades fracionários são rejeitados"""
+    with pytest.raises(TypeError, match="deve ser int"):
+        Money(10.5)
+    with pytest.raises(TypeError, match="deve ser int"):
+        Money(True)
+    with pytest.raises(TypeError):
+        Money(150) * 1.5
+    with pytest.raises(TypeError):
+        0.5 * Money(150)
+
+
+def test_money_arithmetic_requires_same_currency():
+    """Testa a aritmética e a proteção contra moedas diferentes"""
+    assert Money(150) + Money(250) == Money(400)
+    assert Money(150) * 3 == Money(450)
+    assert Money(100) < Money(200)
+
+    with pytest.raises(ValueError, match="Moedas diferentes"):
+        Money(100, "BRL") + Money(100, "USD")
+
+
+def test_order_total_uses_integer_units():
+    """Testa o total do pedido, inclusive para pedidos vazios"""
+    order = Order(
+        id="1",
+        items=[
+            OrderItem(product_id="prod1", quantity=3, price=Money.from_decimal(Decimal("0.10"))),
+            OrderItem(product_id="prod2", quantity=1, price=Money.from_decimal(Decimal("0.20")))
+        ],
+        total=Money.zero()
+    )
+    order.calculate_total()
+    assert order.total == Money.from_decimal(Decimal("0.50"))
+
+    empty = Order(id="2", items=[], total=Money(999))
+    empty.calculate_total()
+    assert empty.total == Money.zero()
+
+
+def test_order_total_rejects_mixed_currencies():
+    """Testa que itens com moedas diferentes não podem ser somados"""
+    order = Order(
+        id="1",
+        items=[
+            OrderItem(product_id="prod1", quantity=1, price=Money(100, "BRL")),
+            OrderItem(product_id="prod2", quantity=1, price=Money(100, "USD"))
+        ],
+        total=Money.zero()
+    )
+
+    with pytest.raises(ValueError, match="mesma moeda"):
+        order.calculate_total()
@@ -1,15 +1,27 @@
 """
 Testes para a factory de notificação.
 """
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 import pytest
 
+from src.domain.entities.money import Money
 from src.domain.entities.order import Order, OrderItem
 from src.infrastructure.config.notification_config import NotificationConfig
 from src.application.use_cases.notify_order_created_use_case import (
     NotifyOrderCreatedUseCase,
     NotifyOrderCreatedInput
 )
+from src.infrastructure.factories.notification_factory import (
+    CachingNotificationFactory,
+    DefaultNotificationFactory
+)
+from src.domain.interfaces.notification_service import (
+    NotificationContent,
+    NotificationRecipient,
+    NotificationType
+)
+from src.infrastructure.services.local_smtp_server import LocalSmtpServer
 from src.infrastructure.services.mock_notification_service import MockNotificationService
 
 
@@ -70,10 +82,10 @@ def test_notify_order_with_different_services():
             OrderItem(
                 product_id="prod1",
                 quantity=2,
-                price=Decimal("10.50")
+                price=Money.from_decimal(Decimal("10.50"))
             )
         ],
-        total=Decimal("21.00")
+        total=Money.from_decimal(Decimal("21.00"))
     )
 
     # Testa com serviço mock
@@ -95,4 +107,113 @@ def test_notify_order_with_different_services():
     # Verifica se a notificação foi enviada
     notifications = MockNotificationService.get_notifications_sent()
     assert len(notifications) == 1
-    assert notifications[0][0].identifier == "customer@example.com" 
\ No newline at end of file
+    assert notifications[0][0].identifier == "customer@example.com" 
+
+
+class ClosableMockNotificationService(MockNotificationService):
+    """Serviço mock que registra o encerramento"""
+
+    def __init__(self, should_fail: bool = False):
+        super().__init__(should_fail)
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class CountingNotificationFactory(DefaultNotificationFactory):
+    """Factory que conta as criações e usa o serviço mock encerrável"""
+
+    def __init__(self):
+        self.created = 0
+
+    def create_notification_service(self, notification_type, config):
+        self.created += 1
+        return ClosableMockNotificationService(config.get("should_fail", False))
+
+
+def test_caching_factory_reuses_service_per_type_and_config():
+    """Testa a reutilização por tipo e configuração, independente da ordem das chaves"""
+    inner = CountingNotificationFactory()
+    factory = CachingNotificationFactory(inner)
+
+    first = factory.create_notification_service("mock", {"should_fail": False, "region": "br"})
+    same = factory.create_notification_service("mock", {"region": "br", "should_fail": False})
+    other = factory.create_notification_service("mock", {"should_fail": True})
+
+    assert same is first
+    assert other is not first
+    assert inner.created == 2
+
+
+def test_caching_factory_creates_once_under_concurrency():
+    """Testa que chamadas concorrentes recebem a mesma instância"""
+    inner = CountingNotificationFactory()
+    factory = CachingNotificationFactory(inner)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        services = list(executor.map(
+            lambda _: factory.create_notification_service("mock", {}), range(64)
+        ))
+
+    assert inner.created == 1
+    assert all(service is services[0] for service in services)
+
+
+def test_caching_factory_closes_invalidated_and_evicted_services():
+    """Testa a invalidação explícita e a remoção por limite, com close()"""
+    factory = CachingNotificationFactory(CountingNotificationFactory(), max_size=2)
+
+    a = factory.create_notification_service("mock", {"id": "a"})
+    b = factory.create_notification_service("mock", {"id": "b"})
+    factory.create_notification_service("mock", {"id": "a"})
+    c = factory.create_notification_service("mock", {"id": "c"})
+
+    # "b" era o usado há mais tempo
+    assert b.closed is True
+    assert a.closed is False and c.closed is False
+
+    assert factory.invalidate("mock", {"id": "a"}) == 1
+    assert a.closed is True
+    assert factory.create_notification_service("mock", {"id": "a"}) is not a
+
+    factory.close()
+    assert c.closed is True
+    assert len(factory) == 0
+
+
+def test_evicted_email_service_keeps_sending():
+    """Testa que um serviço removido do cache continua utilizável por quem o guarda"""
+    recipient = NotificationRecipient("ana@example.com", NotificationType.EMAIL)
+    content = NotificationContent(subject="Pedido criado", body="Obrigado!")
+    with LocalSmtpServer() as server:
+        config = {
+            "smtp_host": server.host,
+            "smtp_port": server.port,
+            "smtp_user": "user",
+            "smtp_password": "password",
+            "default_from_email": "loja@example.com",
+            "use_tls": False
+        }
+        factory = CachingNotificationFactory(DefaultNotificationFactory())
+        service = factory.create_notification_service("email", config)
+        with service.pool.connection() as borrowed:
+            # Removido do cache enquanto uma conexão está emprestada
+            assert factory.invalidate("email") == 1
+
+        assert service.send_notification(recipient, content).success is True
+        assert server.connections_opened == 2
+        # A conexão emprestada antes do close() não volta ao pool
+        assert borrowed.sock is None
+        service.close()
+
+
+def test_default_factory_reuses_email_service_across_executions():
+    """Testa que a factory padrão não cria um serviço (e um pool) por execução"""
+    factory = NotificationConfig.create_factory()
+    config = NotificationConfig.get_email_config()
+
+    first = factory.create_notification_service("email", config)
+
+    assert factory.create_notification_service("email", config) is first
+    factory.close()
@@ -1,6 +1,8 @@
 """
 Testes para o serviço de notificação e use cases relacionados.
 """
+import threading
+import time
 from decimal import Decimal
 import pytest
 
@@ -13,8 +15,11 @@ from src.domain.interfaces.notification_service import (
     NotificationContent,
     NotificationType
 )
+from src.domain.entities.money import Money
 from src.domain.entities.order import Order, OrderItem
+from src.domain.interfaces.notification_factory import NotificationFactory
 from src.infrastructure.services.mock_notification_service import MockNotificationService
+from src.infrastructure.services.notification_dispatcher import ThreadedNotificationDispatcher
 from src.infrastructure.config.notification_config import NotificationConfig
 
 
@@ -71,15 +76,15 @@ def test_notify_order_created_use_case():
             OrderItem(
                 product_id="prod1",
                 quantity=2,
-                price=Decimal("10.50")
+                price=Money.from_decimal(Decimal("10.50"))
             ),
             OrderItem(
                 product_id="prod2",
                 quantity=1,
-                price=Decimal("15.75")
+                price=Money.from_decimal(Decimal("15.75"))
             )
         ],
-        total=Decimal("36.75")
+        total=Money.from_decimal(Decimal("36.75"))
     )
 
     # Executa o use case
@@ -125,10 +130,10 @@ def test_notify_order_created_use_case_with_failure():
             OrderItem(
                 product_id="prod1",
                 quantity=1,
-                price=Decimal("10.00")
+                price=Money.from_decimal(Decimal("10.00"))
             )
         ],
-        total=Decimal("10.00")
+        total=Money.from_decimal(Decimal("10.00"))
     )
 
     # Executa o use case
@@ -142,4 +147,143 @@ def test_notify_order_created_use_case_with_failure():
 
     # Verifica o resultado
     assert response.success is False
-    assert "Falha simulada no envio" in response.error 
\ No newline at end of file
+    assert "Falha simulada no envio" in response.error
+
+
+def make_input(order_id: str = "123") -> NotifyOrderCreatedInput:
+    """Cria a entrada do use case para um pedido simples"""
+    order = Order(
+        id=order_id,
+        items=[OrderItem(product_id="prod1", quantity=1, price=Money.from_decimal(Decimal("10.00")))],
+        total=Money.from_decimal(Decimal("10.00"))
+    )
+    return NotifyOrderCreatedInput(
+        order=order,
+        customer_email="customer@example.com",
+        customer_name="John Doe",
+        notification_type="mock"
+    )
+
+
+class BlockingNotificationService(MockNotificationService):
+    """Serviço que só conclui o envio após ser liberado"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def send_notification(self, recipient, content):
+        self.release.wait(timeout=5)
+        return super().send_notification(recipient, content)
+
+
+class FixedServiceFactory(NotificationFactory):
+    """Factory que sempre retorna o mesmo serviço"""
+
+    def __init__(self, service):
+        self.service = service
+
+    def create_notification_service(self, notification_type, config):
+        return self.service
+
+
+def test_dispatch_returns_ticket_before_sending():
+    """Testa que execute aceita a notificação e o resultado chega pelo ticket"""
+    service = BlockingNotificationService()
+    with ThreadedNotificationDispatcher(workers=1) as dispatcher:
+        use_case = NotifyOrderCreatedUseCase(FixedServiceFactory(service), {}, dispatcher)
+
+        response = use_case.execute(make_input())
+        ticket = response.data
+
+        assert response.success is True
+        assert ticket.done() is False
+        assert dispatcher.get_ticket(ticket.id) is ticket
+
+        service.release.set()
+        result = ticket.result(timeout=5)
+
+    assert result.success is True
+    assert result.recipient.identifier == "customer@example.com"
+
+
+def test_dispatch_applies_backpressure_when_queue_is_full():
+    """Testa a recusa quando a fila está cheia"""
+    service = BlockingNotificationService()
+    with ThreadedNotificationDispatcher(workers=1, max_queue_size=1) as dispatcher:
+        use_case = NotifyOrderCreatedUseCase(FixedServiceFactory(service), {}, dispatcher)
+
+        first = use_case.execute(make_input("1"))
+        # Aguarda o worker retirar o primeiro da fila
+        while dispatcher.pending:
+            time.sleep(0.001)
+        second = use_case.execute(make_input("2"))
+        third = use_case.execute(make_input("3"))
+
+        assert first.success and second.success
+        assert third.success is False
+        assert "Fila de notificações cheia" in third.error
+        assert dispatcher.rejected == 1
+        service.release.set()
+
+
+def test_dispatcher_drains_queue_on_close():
+    """Testa que o encerramento envia as notificações já aceitas"""
+    dispatcher = ThreadedNotificationDispatcher(workers=2)
+    use_case = NotifyOrderCreatedUseCase(FixedServiceFactory(MockNotificationService()), {}, dispatcher)
+
+    tickets = [use_case.execute(make_input(str(i))).data for i in range(20)]
+    dispatcher.close()
+
+    assert all(ticket.done() and ticket.result().success for ticket in tickets)
+    assert len(MockNotificationService.get_notifications_sent()) == 20
+    rejected = use_case.execute(make_input("21"))
+    assert rejected.success is False
+    assert "encerrado" in rejected.error
+
+
+def test_dispatcher_close_honours_timeout_with_full_queue():
+    """Testa que close não bloqueia com a fila cheia e um serviço travado"""
+    service = BlockingNotificationService()
+    dispatcher = ThreadedNotificationDispatcher(workers=1, max_queue_size=1)
+    use_case = NotifyOrderCreatedUseCase(FixedServiceFactory(service), {}, dispatcher)
+
+    sending = use_case.execute(make_input("1")).data
+    while dispatcher.pending:
+        time.sleep(0.001)
+    queued = use_case.execute(make_input("2")).data
+
+    started = time.monotonic()
+    dispatcher.close(timeout=0.1)
+
+    assert time.monotonic() - started < 1
+    # A notificação que não saiu da fila falha; a que estava em envio conclui
+    assert queued.result(timeout=1).error_message == "Dispatcher de notificações encerrado"
+    service.release.set()
+    assert sending.result(timeout=5).success is True
+    dispatcher._workers[0].join(timeout=5)
+    assert not dispatcher._workers[0].is_alive()
+
+
+def test_submit_racing_close_always_resolves_ticket():
+    """Testa que toda notificação aceita durante o encerramento recebe um resultado"""
+    for _ in range(20):
+        dispatcher = ThreadedNotificationDispatcher(workers=2)
+        service = MockNotificationService()
+        recipient = NotificationRecipient("a@example.com", NotificationType.EMAIL)
+        content = NotificationContent(subject="s", body="b")
+        tickets = []
+
+        def submit_many():
+            for _ in range(200):
+                try:
+                    tickets.append(dispatcher.submit(service, recipient, content))
+                except RuntimeError:
+                    return
+
+        submitter = threading.Thread(target=submit_many)
+        submitter.start()
+        dispatcher.close(timeout=1)
+        submitter.join()
+
+        assert all(ticket.result(timeout=1) is not None for ticket in tickets)
@@ -0,0 +1,99 @@
+"""
+Testes para a entidade Order.
+"""
+import pickle
+from dataclasses import FrozenInstanceError, asdict, fields
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+
+
+@pytest.fixture
+def debug_totals():
+    """Ativa a conferência do total incremental durante o teste"""
+    Order.debug_totals = True
+    yield
+    Order.debug_totals = False
+
+
+def test_incremental_total(debug_totals):
+    """Testa que as alterações mantêm o total sem recálculo"""
+    order = Order(id="1", items=[], total=Money.zero())
+
+    order.add_item(OrderItem("a", 2, Money(1_000)))
+    order.add_item(OrderItem("b", 1, Money(250)))
+    assert order.total == Money(2_250)
+
+    order.update_quantity("a", 5)
+    assert order.total == Money(5_250)
+
+    removed = order.remove_item("b")
+    assert removed.product_id == "b"
+    assert order.total == Money(5_000)
+    assert [item.product_id for item in order.items] == ["a"]
+
+
+def test_changes_reject_invalid_operations_without_mutating():
+    """Testa moeda diferente e produto inexistente"""
+    order = Order(id="1", items=[], total=Money.zero())
+    order.add_item(OrderItem("a", 1, Money(1_000)))
+
+    with pytest.raises(ValueError, match="Moedas diferentes"):
+        order.add_item(OrderItem("b", 1, Money(1_000, "USD")))
+    with pytest.raises(ValueError, match="não está no pedido"):
+        order.update_quantity("x", 2)
+
+    assert len(order.items) == 1
+    assert order.total == Money(1_000)
+
+
+def test_validation_runs_only_when_dirty():
+    """Testa que validate() só refaz as verificações após uma alteração"""
+    order = Order(id="1", items=[], total=Money.zero())
+    order.add_item(OrderItem("a", 1, Money(1_000)))
+    assert order.dirty is True
+
+    order.validate()
+    assert order.dirty is False
+
+    order.update_quantity("a", 0)
+    assert order.dirty is True
+    with pytest.raises(ValueError, match="Quantidade de itens deve ser maior que zero"):
+        order.validate()
+
+
+def test_direct_changes_to_items_are_validated():
+    """Testa que alterações fora dos mutators não escapam da validação"""
+    order = Order.trusted(id="1", items=[OrderItem("a", 1, Money(1_000))], total=Money(1_000))
+    assert order.dirty is False
+
+    order.items.append(OrderItem("b", 0, Money(500)))
+    assert order.dirty is True
+    with pytest.raises(ValueError, match="Quantidade de itens deve ser maior que zero"):
+        order.validate()
+
+    with pytest.raises(FrozenInstanceError):
+        order.items[0].quantity = 0
+
+
+def test_validation_state_is_not_part_of_the_order_data():
+    """Testa que o estado de validação não aparece nos campos nem no pickle"""
+    order = Order(id="1", items=[OrderItem("a", 1, Money(1_000))], total=Money(1_000))
+    order.validate()
+
+    assert [f.name for f in fields(order)] == ["id", "items", "total"]
+    assert set(asdict(order)) == {"id", "items", "total"}
+    restored = pickle.loads(pickle.dumps(order))
+    assert "_validated_items" not in vars(restored)
+    assert restored == order
+    assert restored.dirty is True
+
+
+def test_debug_mode_detects_diverging_total(debug_totals):
+    """Testa que o modo debug acusa um total fora de sincronia"""
+    order = Order(id="1", items=[OrderItem("a", 1, Money(1_000))], total=Money(999))
+
+    with pytest.raises(AssertionError, match="Total incremental"):
+        order.add_item(OrderItem("b", 1, Money(100)))
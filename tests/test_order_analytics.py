@@ -0,0 +1,87 @@
+"""
+Testes para os agregados analíticos de pedidos.
+"""
+from datetime import date
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+from src.infrastructure.repositories.order_analytics import (
+    AnalyticsOrderRepository,
+    OrderAnalytics
+)
+
+
+def make_order(order_id: str, *items, currency: str = "BRL") -> Order:
+    """Cria um pedido a partir de tuplas (produto, quantidade, preço em centavos)"""
+    order = Order(
+        id=order_id,
+        items=[OrderItem(product_id, quantity, Money(price, currency)) for product_id, quantity, price in items],
+        total=Money(0, currency)
+    )
+    order.calculate_total()
+    return order
+
+
+@pytest.fixture
+def clock():
+    """Data de registro controlada pelo teste"""
+    return {"today": date(2024, 1, 1)}
+
+
+@pytest.fixture
+def repository(clock):
+    return AnalyticsOrderRepository(
+        InMemoryOrderRepository(),
+        OrderAnalytics(bucket_edges=(0, 5_000, 10_000), today=lambda: clock["today"])
+    )
+
+
+def test_aggregates_follow_saved_orders(repository, clock):
+    """Testa receita por produto, top-N, histograma e totais diários"""
+    repository.save(make_order("1", ("a", 2, 1_000), ("b", 1, 3_000)))
+    clock["today"] = date(2024, 1, 2)
+    repository.save_many([
+        make_order("2", ("b", 3, 3_000)),
+        make_order("3", ("c", 1, 20_000))
+    ])
+    analytics = repository.analytics
+
+    assert analytics.revenue_by_product() == {
+        "a": Money(2_000), "b": Money(12_000), "c": Money(20_000)
+    }
+    assert analytics.quantity_by_product() == {"a": 2, "b": 4, "c": 1}
+    assert analytics.top_products(2) == [("c", Money(20_000)), ("b", Money(12_000))]
+    assert [bucket.count for bucket in analytics.order_value_histogram()] == [0, 2, 1]
+    assert analytics.order_value_histogram()[-1].upper is None
+    assert analytics.daily_totals() == {
+        date(2024, 1, 1): Money(5_000),
+        date(2024, 1, 2): Money(29_000)
+    }
+    assert analytics.daily_totals(start=date(2024, 1, 2)) == {date(2024, 1, 2): Money(29_000)}
+    assert repository.find_by_id("3") is not None
+
+
+def test_resaving_order_replaces_its_contribution(repository, clock):
+    """Testa que regravar um pedido não duplica os agregados"""
+    repository.save(make_order("1", ("a", 1, 1_000)))
+    clock["today"] = date(2024, 1, 5)
+    repository.save(make_order("1", ("b", 2, 6_000)))
+    analytics = repository.analytics
+
+    assert analytics.order_count == 1
+    assert analytics.revenue_by_product() == {"a": Money(0), "b": Money(12_000)}
+    assert [bucket.count for bucket in analytics.order_value_histogram()] == [0, 0, 1]
+    # O pedido continua no dia em que foi registrado pela primeira vez
+    assert analytics.daily_totals() == {date(2024, 1, 1): Money(12_000)}
+
+
+def test_rejects_other_currency_before_saving(repository):
+    """Testa que pedidos em outra moeda não chegam ao backend"""
+    with pytest.raises(ValueError, match="Moedas diferentes"):
+        repository.save(make_order("1", ("a", 1, 1_000), currency="USD"))
+
+    assert repository.find_by_id("1") is None
+    assert repository.analytics.order_count == 0
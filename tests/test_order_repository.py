@@ -0,0 +1,380 @@
+"""
+Testes para os repositórios de pedidos.
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.interfaces.order_repository import OrderRepository
+from src.infrastructure.repositories.columnar_order_repository import ColumnarOrderRepository
+from src.infrastructure.repositories.log_order_repository import LogStructuredOrderRepository
+from src.infrastructure.repositories.caching_repository import CachingOrderRepository
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository, _SortedBlocks
+from src.infrastructure.repositories.order_analytics import AnalyticsOrderRepository
+from src.infrastructure.repositories.sharded_memory_repository import ShardedInMemoryOrderRepository
+from src.infrastructure.repositories.snapshot import write_snapshot
+from src.infrastructure.repositories.sqlite_order_repository import SqliteOrderRepository
+
+
+@pytest.fixture(params=["memory", "sharded", "cached", "columnar", "analytics", "sqlite", "log"])
+def repo(request, tmp_path):
+    """Executa os testes de repositório em todas as implementações"""
+    if request.param == "memory":
+        yield InMemoryOrderRepository()
+    elif request.param == "cached":
+        yield CachingOrderRepository(InMemoryOrderRepository())
+    elif request.param == "sharded":
+        yield ShardedInMemoryOrderRepository(shards=4)
+    elif request.param == "columnar":
+        yield ColumnarOrderRepository()
+    elif request.param == "analytics":
+        yield AnalyticsOrderRepository(InMemoryOrderRepository())
+    elif request.param == "log":
+        repository = LogStructuredOrderRepository(str(tmp_path))
+        yield repository
+        repository.close()
+    else:
+        repository = SqliteOrderRepository(":memory:")
+        yield repository
+        repository.close()
+
+
+def brl(value: str) -> Money:
+    """Cria um valor em reais a partir da representação decimal"""
+    return Money.from_decimal(Decimal(value))
+
+
+def make_order(order_id: str, *prices: str) -> Order:
+    """Cria um pedido de teste com um item por preço informado"""
+    order = Order(
+        id=order_id,
+        items=[
+            OrderItem(product_id=f"prod{i}", quantity=i + 1, price=brl(price))
+            for i, price in enumerate(prices)
+        ],
+        total=Money.zero()
+    )
+    order.calculate_total()
+    return order
+
+
+def test_order_repository(repo):
+    """Testa as operações do repositório de pedidos"""
+    order = make_order("1", "10.50", "3.25")
+
+    # Salva o pedido
+    repo.save(order)
+
+    # Busca o pedido
+    found_order = repo.find_by_id("1")
+    assert found_order is not None
+    assert found_order.total == brl("17.00")
+    assert [item.product_id for item in found_order.items] == ["prod0", "prod1"]
+    assert found_order.items[1].quantity == 2
+    assert found_order.items[1].price == brl("3.25")
+
+    assert repo.find_by_id("2") is None
+
+
+def test_order_repository_overwrites_items(repo):
+    """Testa que salvar novamente um pedido substitui seus itens"""
+    repo.save(make_order("1", "10.00", "20.00"))
+    repo.save(make_order("1", "5.00"))
+
+    found_order = repo.find_by_id("1")
+    assert len(found_order.items) == 1
+    assert found_order.total == brl("5.00")
+
+
+def test_save_many_and_find_many(repo):
+    """Testa a gravação e a busca em lote de pedidos"""
+    repo.save_many(make_order(str(i), "1.00", "2.00") for i in range(5))
+
+    found = repo.find_many(["4", "missing", "1"])
+
+    assert [order.id if order else None for order in found] == ["4", None, "1"]
+    assert found[0].total == brl("5.00")
+    assert len(found[2].items) == 2
+
+
+def test_find_many_default_implementation():
+    """Testa a implementação padrão para repositórios de terceiros"""
+
+    class MinimalOrderRepository(OrderRepository):
+        def __init__(self):
+            self.orders = {}
+
+        def save(self, order: Order) -> None:
+            self.orders[order.id] = order
+
+        def find_by_id(self, order_id: str):
+            return self.orders.get(order_id)
+
+    repo = MinimalOrderRepository()
+    repo.save_many([make_order("1", "1.00"), make_order("2", "2.00")])
+
+    assert [order.id if order else None for order in repo.find_many(["2", "3", "1"])] == ["2", None, "1"]
+
+
+def test_sqlite_order_repository_save_many():
+    """Testa a gravação em lote do repositório SQLite"""
+    repo = SqliteOrderRepository(":memory:")
+    repo.save_many(make_order(str(i), "1.00", "2.00") for i in range(100))
+
+    assert repo.find_by_id("0").total == brl("5.00")
+    assert len(repo.find_by_id("99").items) == 2
+    repo.close()
+
+
+def test_log_order_repository_restart_replays_tail(tmp_path):
+    """Testa o restart a partir do snapshot do índice mais a cauda do log"""
+    repo = LogStructuredOrderRepository(str(tmp_path), snapshot_interval=4)
+    for i in range(5):
+        repo.save(make_order(str(i), "1.00"))
+    repo.save(make_order("0", "7.00"))
+
+    # Simula uma queda: o snapshot, gravado em segundo plano, cobre só as 4
+    # primeiras gravações
+    repo._wait_snapshot()
+    repo._log.close()
+
+    reopened = LogStructuredOrderRepository(str(tmp_path))
+    assert reopened.find_by_id("4").total == brl("1.00")
+    assert reopened.find_by_id("0").total == brl("7.00")
+    assert reopened.dead_bytes > 0
+    reopened.close()
+
+
+def test_log_order_repository_snapshots_amortized_in_background(tmp_path, monkeypatch):
+    """Testa que o intervalo entre snapshots cresce com o índice"""
+    repo = LogStructuredOrderRepository(str(tmp_path), snapshot_interval=10, sync=False)
+    started = []
+    original = repo._capture_snapshot
+    monkeypatch.setattr(repo, "_capture_snapshot", lambda: started.append(len(repo.index)) or original())
+
+    repo.save_many(make_order(str(i), "1.00") for i in range(5))
+    for i in range(5, 2_000):
+        repo.save(make_order(str(i), "1.00"))
+
+    # Com intervalo fixo seriam 200 snapshots; crescendo com o índice, poucos
+    assert 0 < len(started) < 20
+    repo.close()
+    reopened = LogStructuredOrderRepository(str(tmp_path))
+    assert reopened.find_by_id("1999") is not None
+    reopened.close()
+
+
+def test_log_order_repository_discards_partial_record(tmp_path):
+    """Testa que um registro incompleto no final do log é descartado"""
+    repo = LogStructuredOrderRepository(str(tmp_path))
+    repo.save(make_order("1", "1.00"))
+    repo.close()
+
+    with open(tmp_path / LogStructuredOrderRepository.LOG_FILE, "ab") as file:
+        file.write(b"\xff\x00\x00\x00{\"id\"")
+
+    reopened = LogStructuredOrderRepository(str(tmp_path))
+    assert reopened.find_by_id("1") is not None
+    reopened.save(make_order("2", "2.00"))
+    assert reopened.find_by_id("2").total == brl("2.00")
+    reopened.close()
+
+
+def test_log_order_repository_compaction(tmp_path):
+    """Testa a compactação dos registros substituídos"""
+    repo = LogStructuredOrderRepository(str(tmp_path))
+    for version in range(10):
+        repo.save(make_order("1", f"{version + 1}.00"))
+    repo.save(make_order("2", "3.00"))
+    log_path = tmp_path / LogStructuredOrderRepository.LOG_FILE
+    size_before = log_path.stat().st_size
+
+    repo.compact()
+
+    assert log_path.stat().st_size < size_before
+    assert repo.dead_bytes == 0
+    assert repo.find_by_id("1").total == brl("10.00")
+    assert repo.find_by_id("2").total == brl("3.00")
+    repo.close()
+
+    reopened = LogStructuredOrderRepository(str(tmp_path))
+    assert reopened.find_by_id("1").total == brl("10.00")
+    reopened.close()
+
+
+def test_log_order_repository_ignores_snapshot_of_replaced_log(tmp_path):
+    """Testa a queda entre a troca do log compactado e o novo snapshot"""
+    repo = LogStructuredOrderRepository(str(tmp_path))
+    repo.save(make_order("1", "1.00"))
+    repo.save(make_order("2", "3.00"))
+    repo.write_snapshot()
+    snapshot_path = tmp_path / LogStructuredOrderRepository.SNAPSHOT_FILE
+    stale_snapshot = snapshot_path.read_bytes()
+    for version in range(1, 5):
+        repo.save(make_order("1", f"{version + 1}.00"))
+
+    repo.compact()
+    repo.close()
+    # O snapshot antigo, com offsets do log anterior, volta ao disco
+    snapshot_path.write_bytes(stale_snapshot)
+
+    reopened = LogStructuredOrderRepository(str(tmp_path))
+    assert reopened.find_by_id("1").total == brl("5.00")
+    assert reopened.find_by_id("2").total == brl("3.00")
+    reopened.close()
+
+
+def test_log_order_repository_reads_recent_writes_without_remapping(tmp_path, monkeypatch):
+    """Testa que ler logo após gravar não recria o mmap"""
+    repo = LogStructuredOrderRepository(str(tmp_path), sync=False)
+    remaps = []
+    original_remap = repo._remap
+    monkeypatch.setattr(repo, "_remap", lambda: (remaps.append(1), original_remap()))
+
+    for i in range(50):
+        repo.save(make_order(str(i), "1.00"))
+        assert repo.find_by_id(str(i)).total == brl("1.00")
+    assert remaps == []
+
+    monkeypatch.setattr(repo, "TAIL_LIMIT", 0)
+    repo.save(make_order("50", "2.00"))
+    assert remaps == [1]
+    assert repo.find_by_id("0").total == brl("1.00")
+    assert repo.find_by_id("50").total == brl("2.00")
+    repo.close()
+
+
+def test_memory_order_repository_find_by_product():
+    """Testa o índice invertido de produtos"""
+    repo = InMemoryOrderRepository()
+    repo.save(make_order("1", "1.00", "2.00"))  # prod0, prod1
+    repo.save(make_order("2", "3.00"))  # prod0
+    repo.save(make_order("3", "1.00", "1.00", "1.00"))  # prod0, prod1, prod2
+
+    assert sorted(order.id for order in repo.find_by_product("prod0")) == ["1", "2", "3"]
+    assert sorted(order.id for order in repo.find_by_product("prod2")) == ["3"]
+    assert repo.find_by_product("missing") == []
+
+    # Salvar novamente atualiza o índice
+    repo.save(make_order("3", "5.00"))
+    assert repo.find_by_product("prod2") == []
+
+
+def test_memory_order_repository_find_by_total_range():
+    """Testa a consulta por faixa de total"""
+    repo = InMemoryOrderRepository()
+    for order_id, price in (("a", "10.00"), ("b", "5.00"), ("c", "20.00"), ("d", "10.00")):
+        repo.save(make_order(order_id, price))
+
+    assert [o.id for o in repo.find_by_total_range(brl("5.00"), brl("10.00"))] == ["b", "a", "d"]
+    assert [o.id for o in repo.find_by_total_range(brl("10.01"), brl("100"))] == ["c"]
+    assert repo.find_by_total_range(brl("21"), brl("30")) == []
+
+    # Salvar novamente move o pedido na lista ordenada
+    repo.save(make_order("c", "1.00"))
+    assert [o.id for o in repo.find_by_total_range(brl("0"), brl("5.00"))] == ["c", "b"]
+
+    # Alterações acumuladas entre consultas, inclusive regravações com o mesmo total
+    repo.save_many([make_order("e", "2.00"), make_order("e", "7.00"), make_order("b", "5.00")])
+    repo.save(make_order("a", "30.00"))
+    assert [o.id for o in repo.find_by_total_range(brl("0"), brl("100"))] == ["c", "b", "e", "d", "a"]
+
+
+def test_memory_order_repository_interleaved_saves_and_range_queries(monkeypatch):
+    """Testa consultas por faixa intercaladas com saves, atravessando blocos"""
+    monkeypatch.setattr(_SortedBlocks, "BLOCK_SIZE", 4)
+    repo = InMemoryOrderRepository()
+    expected = {}
+    rng = random.Random(7)
+    for step in range(600):
+        order_id = str(rng.randrange(150))
+        cents = rng.randrange(1, 50) * 100
+        repo.save(make_order(order_id, f"{cents // 100}.00"))
+        expected[order_id] = cents
+        low, high = sorted(rng.sample(range(0, 5_000, 100), 2))
+        found = repo.find_by_total_range(Money(low), Money(high))
+        assert [(o.total.amount, o.id) for o in found] == sorted(
+            (total, key) for key, total in expected.items() if low <= total <= high
+        )
+    assert len(repo.totals) == len(expected)
+
+
+def test_memory_order_repository_indexes_orders_in_other_currencies():
+    """Testa pedidos em moedas diferentes no índice de totais"""
+    repo = InMemoryOrderRepository()
+    repo.save(make_order("brl", "10.00"))
+    usd_order = Order(
+        id="usd",
+        items=[OrderItem("prod0", 1, Money.from_decimal(Decimal("10.00"), "USD"))],
+        total=Money.zero("USD")
+    )
+    usd_order.calculate_total()
+    repo.save(usd_order)
+
+    assert [o.id for o in repo.find_by_total_range(brl("0"), brl("100"))] == ["brl"]
+    usd = Money.from_decimal(Decimal("100"), "USD")
+    assert [o.id for o in repo.find_by_total_range(Money.zero("USD"), usd)] == ["usd"]
+    assert sorted(o.id for o in repo.find_by_product("prod0")) == ["brl", "usd"]
+    with pytest.raises(ValueError, match="Moedas diferentes"):
+        repo.find_by_total_range(brl("0"), usd)
+
+
+def test_memory_order_repository_snapshot_and_restore(tmp_path):
+    """Testa o snapshot e a restauração do repositório em memória"""
+    repo = InMemoryOrderRepository()
+    repo.save(make_order("1", "1.00", "2.00"))
+    repo.save(make_order("2", "10.00"))
+    path = str(tmp_path / "orders.snapshot")
+
+    repo.snapshot(path)
+    restored = InMemoryOrderRepository()
+    restored.restore(path)
+
+    assert restored.find_by_id("1").total == brl("5.00")
+    assert sorted(o.id for o in restored.find_by_product("prod0")) == ["1", "2"]
+    assert [o.id for o in restored.find_by_total_range(brl("6"), brl("20"))] == ["2"]
+
+    # Um snapshot de outro tipo é rejeitado
+    users_path = str(tmp_path / "users.snapshot")
+    write_snapshot(users_path, "users", [])
+    with pytest.raises(ValueError, match="Snapshot inválido"):
+        restored.restore(users_path)
+
+
+def test_columnar_repository_overflow_leaves_columns_consistent():
+    """Testa que um valor fora da faixa não desalinha as colunas"""
+    repo = ColumnarOrderRepository()
+    repo.save(make_order("1", "1.00"))
+    huge = Order.trusted(id="2", items=[OrderItem("prod0", 1, Money(2 ** 63))], total=Money(2 ** 63))
+
+    with pytest.raises(OverflowError):
+        repo.save(huge)
+
+    assert len(repo.product_codes) == len(repo.quantities) == len(repo.prices) == 1
+    assert repo.find_by_id("2") is None
+    repo.save(make_order("3", "2.00"))
+    assert repo.find_by_id("3").total == brl("2.00")
+
+
+def test_columnar_repository_reuses_and_compacts_item_rows():
+    """Testa o reaproveitamento das linhas ao regravar e a compactação"""
+    repo = ColumnarOrderRepository()
+    repo.save(make_order("1", "1.00", "2.00"))
+    repo.save(make_order("2", "3.00"))
+
+    # Menos itens: grava nas linhas antigas
+    repo.save(make_order("1", "5.00"))
+    assert len(repo.quantities) == 3
+    assert repo.dead_items == 1
+
+    # Mais itens que antes: acrescenta ao final até as linhas mortas
+    # serem maioria, quando as colunas são compactadas
+    for count in range(2, 5):
+        repo.save(make_order("2", *["1.00"] * count))
+    assert repo.dead_items == 0
+    assert len(repo.quantities) == 1 + 4
+    assert repo.find_by_id("1").total == brl("5.00")
+    assert [item.price for item in repo.find_by_id("2").items] == [brl("1.00")] * 4
@@ -0,0 +1,388 @@
+"""
+Testes para os use cases de pedido.
+"""
+import threading
+from decimal import Decimal
+
+import pytest
+
+from src.application.dto.order_dto import CreateOrderInput, CreateOrdersBatchInput, OrderItemInput
+from src.application.use_cases.create_order_use_case import CreateOrderUseCase
+from src.application.use_cases.create_orders_batch_use_case import CreateOrdersBatchUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.payment import PaymentInfo, PaymentProcessor
+from src.infrastructure.repositories.memory_idempotency_store import InMemoryIdempotencyStore
+from src.infrastructure.repositories.memory_order_repository import InMemoryOrderRepository
+from src.presentation.controllers.order_controller import OrderController
+
+
+def test_create_order_success():
+    """Testa a criação de um pedido com sucesso"""
+    controller = OrderController()
+
+    # Cria um pedido
+    response = controller.create_order([
+        {"product_id": "prod1", "quantity": 2, "price": "10.50"},
+        {"product_id": "prod2", "quantity": 1, "price": "15.75"}
+    ])
+
+    # Verifica o sucesso e os valores convertidos para Decimal
+    assert response["success"] is True
+    assert response["data"]["total"] == Decimal("36.75")
+    assert response["data"]["currency"] == "BRL"
+    assert response["data"]["items"][0]["price"] == Decimal("10.50")
+
+    # Verifica que o pedido foi salvo
+    saved = controller.order_repository.find_by_id(response["data"]["id"])
+    assert saved is not None
+
+
+def test_create_order_without_items():
+    """Testa a criação de um pedido sem itens"""
+    controller = OrderController()
+
+    response = controller.create_order([])
+
+    assert response["success"] is False
+    assert "Pedido deve ter pelo menos um item" in response["error"]
+
+
+def test_create_order_invalid_quantity():
+    """Testa a criação de um pedido com quantidade inválida"""
+    controller = OrderController()
+
+    response = controller.create_order([
+        {"product_id": "prod1", "quantity": 0, "price": "10.00"}
+    ])
+
+    assert response["success"] is False
+    assert "Quantidade de itens deve ser maior que zero" in response["error"]
+
+
+def test_create_order_invalid_price_returns_error():
+    """Testa que preços malformados viram resposta de erro, sem exceção"""
+    controller = OrderController()
+
+    for price in ("10.005", "abc"):
+        response = controller.create_order([
+            {"product_id": "prod1", "quantity": 1, "price": price}
+        ])
+
+        assert response["success"] is False
+        assert "Dados do pedido inválidos" in response["error"]
+    assert controller.order_repository.orders == {}
+
+
+def test_create_order_rejects_non_int_quantity():
+    """Testa que quantidades que não são int são rejeitadas antes do total"""
+    controller = OrderController()
+
+    for quantity in ("2", True, 2.5):
+        response = controller.create_order([
+            {"product_id": "prod1", "quantity": quantity, "price": "10000000.00"}
+        ])
+
+        assert response["success"] is False
+        assert "Quantidade deve ser int" in response["error"]
+    assert controller.order_repository.orders == {}
+
+    # O use case também confere, para chamadores que montam o DTO diretamente
+    use_case = CreateOrderUseCase(InMemoryOrderRepository(), RecordingPaymentProcessor(Money(10 ** 9)))
+    for quantity in ("2", True, 2.5):
+        response = use_case.execute(make_input("10.00", quantity=quantity))
+        assert response.success is False
+        assert "Quantidade deve ser int" in response.error
+
+
+class RecordingPaymentProcessor(PaymentProcessor):
+    """Processador que registra as chamadas e recusa valores acima do limite"""
+
+    def __init__(self, limit: Money):
+        self.limit = limit
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        self.single_calls += 1
+        return payment.amount <= self.limit
+
+    def process_payments(self, payments):
+        self.batch_calls += 1
+        return [payment.amount <= self.limit for payment in payments]
+
+
+class CountingOrderRepository(InMemoryOrderRepository):
+    """Repositório que conta as chamadas de gravação"""
+
+    def __init__(self):
+        super().__init__()
+        self.save_many_calls = 0
+
+    def save_many(self, orders):
+        self.save_many_calls += 1
+        super().save_many(orders)
+
+
+def make_input(price: str, quantity: int = 1) -> CreateOrderInput:
+    """Cria o DTO de um pedido com um único item"""
+    return CreateOrderInput(items=[
+        OrderItemInput(product_id="prod1", quantity=quantity, price=Money.from_decimal(Decimal(price)))
+    ])
+
+
+def test_create_orders_batch_reports_each_order():
+    """Testa o lote com pedidos válidos, inválidos e com pagamento recusado"""
+    repository = CountingOrderRepository()
+    processor = RecordingPaymentProcessor(limit=Money.from_decimal(Decimal("100.00")))
+    use_case = CreateOrdersBatchUseCase(repository, processor)
+
+    response = use_case.execute(CreateOrdersBatchInput(orders=[
+        make_input("10.00", 2),
+        make_input("10.00", 0),
+        make_input("500.00"),
+        make_input("99.99")
+    ]))
+
+    results = response.data.results
+    assert response.success is True
+    assert [result.success for result in results] == [True, False, False, True]
+    assert "Quantidade de itens deve ser maior que zero" in results[1].error
+    assert results[2].error == "Falha no processamento do pagamento"
+    assert results[0].data.total == Money.from_decimal(Decimal("20.00"))
+    assert response.data.succeeded == 2
+
+    # Uma chamada de pagamento e uma escrita para o lote inteiro
+    assert processor.batch_calls == 1
+    assert processor.single_calls == 0
+    assert repository.save_many_calls == 1
+    assert repository.find_by_id(results[3].data.id) is not None
+    assert repository.find_by_id(results[0].data.id) is not None
+
+
+class ShortPaymentProcessor(PaymentProcessor):
+    """Processador com defeito que devolve um resultado a menos"""
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        return True
+
+    def process_payments(self, payments):
+        return [True] * (len(payments) - 1)
+
+
+def test_create_orders_batch_isolates_malformed_orders():
+    """Testa que erros inesperados de um pedido e resultados faltando não derrubam o lote"""
+    use_case = CreateOrdersBatchUseCase(InMemoryOrderRepository(), ShortPaymentProcessor())
+    malformed = CreateOrderInput(items=[OrderItemInput("prod1", "2", Money(100))])
+
+    response = use_case.execute(CreateOrdersBatchInput(
+        orders=[make_input("1.00"), malformed, make_input("2.00")]
+    ))
+
+    results = response.data.results
+    assert [result.success for result in results] == [False, False, False]
+    assert results[1].error.startswith("Erro ao criar pedido")
+    assert "Quantidade de resultados diferente" in results[0].error
+
+
+def test_create_orders_batch_honours_idempotency_keys():
+    """Testa que um lote repetido não cobra de novo os pedidos com chave"""
+    repository = InMemoryOrderRepository()
+    processor = RecordingPaymentProcessor(limit=Money.from_decimal(Decimal("100.00")))
+    use_case = CreateOrdersBatchUseCase(repository, processor, InMemoryIdempotencyStore())
+    keyed = make_input("10.00")
+    keyed.idempotency_key = "pedido-1"
+
+    first = use_case.execute(CreateOrdersBatchInput(orders=[keyed, make_input("20.00")]))
+    retry = use_case.execute(CreateOrdersBatchInput(orders=[keyed, make_input("20.00")]))
+
+    assert [result.success for result in first.data.results] == [True, True]
+    assert retry.data.results[0].data.id == first.data.results[0].data.id
+    # O pedido com chave foi cobrado uma vez; o sem chave, a cada lote
+    assert processor.single_calls == 1
+    assert processor.batch_calls == 2
+    assert len(repository.find_by_product("prod1")) == 3
+
+    # Sem armazenamento de idempotência, a chave não é ignorada em silêncio
+    unprotected = CreateOrdersBatchUseCase(InMemoryOrderRepository(), processor)
+    response = unprotected.execute(CreateOrdersBatchInput(orders=[keyed]))
+    assert response.data.results[0].success is False
+    assert "idempotência" in response.data.results[0].error
+    assert processor.single_calls == 1
+
+
+def test_create_orders_batch_controller():
+    """Testa a criação de pedidos em lote pelo controller"""
+    controller = OrderController()
+
+    response = controller.create_orders_batch([
+        [{"product_id": "prod1", "quantity": 1, "price": "10.00"}],
+        [],
+        [{"product_id": "prod1", "quantity": 1, "price": "1.001"}],
+        [{"product_id": "prod2", "quantity": 2, "price": "5.00"}]
+    ])
+
+    assert response["success"] is True
+    results = response["data"]["results"]
+    assert [result["success"] for result in results] == [True, False, False, True]
+    assert results[0]["data"]["total"] == Decimal("10.00")
+    assert "Dados do pedido inválidos" in results[2]["error"]
+    assert results[3]["data"]["total"] == Decimal("10.00")
+    assert response["data"]["succeeded"] == 2
+
+
+def test_create_order_with_idempotency_key_charges_once():
+    """Testa que repetições com a mesma chave recebem a resposta guardada"""
+    controller = OrderController()
+    items = [{"product_id": "prod1", "quantity": 1, "price": "10.00"}]
+
+    first = controller.create_order(items, idempotency_key="pedido-1")
+    second = controller.create_order(items, idempotency_key="pedido-1")
+    other = controller.create_order(items, idempotency_key="pedido-2")
+
+    assert first["success"] is True
+    assert second == first
+    assert other["data"]["id"] != first["data"]["id"]
+    assert len(controller.order_repository.orders) == 2
+
+
+class BlockingPaymentProcessor(PaymentProcessor):
+    """Processador que aguarda liberação antes de aprovar"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return True
+
+
+def test_concurrent_duplicate_waits_for_first_response():
+    """Testa que uma chamada concorrente aguarda a execução em andamento"""
+    processor = BlockingPaymentProcessor()
+    use_case = CreateOrderUseCase(InMemoryOrderRepository(), processor, InMemoryIdempotencyStore())
+    request = make_input("10.00")
+    request.idempotency_key = "pedido-1"
+    responses = []
+
+    threads = [threading.Thread(target=lambda: responses.append(use_case.execute(request)))
+               for _ in range(2)]
+    threads[0].start()
+    assert processor.started.wait(timeout=5)
+    threads[1].start()
+    processor.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert processor.calls == 1
+    assert len(responses) == 2
+    assert responses[0] is responses[1]
+
+
+def test_idempotency_store_expiration_and_bound():
+    """Testa a expiração por TTL e o limite de chaves concluídas"""
+    now = [0.0]
+    store = InMemoryIdempotencyStore(max_size=2, ttl=10, clock=lambda: now[0])
+    calls = []
+
+    def operation(value):
+        calls.append(value)
+        return value
+
+    assert store.run_once("a", lambda: operation(1)) == 1
+    assert store.run_once("a", lambda: operation(2)) == 1
+    now[0] = 11
+    assert store.run_once("a", lambda: operation(3)) == 3
+
+    store.run_once("b", lambda: operation(4))
+    store.run_once("c", lambda: operation(5))
+    assert len(store) == 2
+    assert store.run_once("a", lambda: operation(6)) == 6
+    assert calls == [1, 3, 4, 5, 6]
+
+
+def test_idempotency_store_bounds_in_flight_keys():
+    """Testa o limite de execuções em andamento, que não entram no descarte"""
+    store = InMemoryIdempotencyStore(max_size=1, max_in_flight=1)
+    results = []
+
+    def outer():
+        # "a" está em andamento: "b" excede o limite e é recusada
+        with pytest.raises(RuntimeError, match="em andamento"):
+            store.run_once("b", lambda: 2)
+        # Só "a" está guardada, em andamento
+        results.append(len(store))
+        return 1
+
+    assert store.run_once("a", outer) == 1
+    assert results == [1]
+    assert store.run_once("b", lambda: 2) == 2
+    assert store.run_once("a", lambda: 3) == 3
+    assert len(store) == 1
+
+
+def test_idempotency_store_does_not_keep_failures():
+    """Testa que uma operação que falha libera a chave"""
+    store = InMemoryIdempotencyStore()
+
+    def failing():
+        raise RuntimeError("falhou")
+
+    with pytest.raises(RuntimeError):
+        store.run_once("a", failing)
+    assert store.run_once("a", lambda: 1) == 1
+
+
+def test_idempotent_create_order_retries_declined_payment():
+    """Testa que uma recusa de pagamento não fica guardada para a chave"""
+    processor = RecordingPaymentProcessor(limit=Money(0))
+    use_case = CreateOrderUseCase(InMemoryOrderRepository(), processor, InMemoryIdempotencyStore())
+    request = make_input("10.00")
+    request.idempotency_key = "pedido-1"
+
+    assert use_case.execute(request).success is False
+    processor.limit = Money.from_decimal(Decimal("100.00"))
+    assert use_case.execute(request).success is True
+    assert processor.single_calls == 2
+
+
+def test_idempotency_key_reused_with_other_payload_is_rejected():
+    """Testa a recusa de uma chave reutilizada com outro conteúdo"""
+    use_case = CreateOrderUseCase(
+        InMemoryOrderRepository(),
+        RecordingPaymentProcessor(limit=Money.from_decimal(Decimal("100.00"))),
+        InMemoryIdempotencyStore()
+    )
+    first = make_input("10.00")
+    first.idempotency_key = "pedido-1"
+    other = make_input("20.00")
+    other.idempotency_key = "pedido-1"
+
+    assert use_case.execute(first).success is True
+    response = use_case.execute(other)
+
+    assert response.success is False
+    assert "outra requisição" in response.error
+
+
+def test_idempotency_wait_timeout_returns_failed_response():
+    """Testa que o timeout de espera pela execução em andamento vira resposta de erro"""
+    processor = BlockingPaymentProcessor()
+    use_case = CreateOrderUseCase(
+        InMemoryOrderRepository(), processor, InMemoryIdempotencyStore(wait_timeout=0.01)
+    )
+    request = make_input("10.00")
+    request.idempotency_key = "pedido-1"
+
+    first = threading.Thread(target=use_case.execute, args=(request,))
+    first.start()
+    assert processor.started.wait(timeout=5)
+    response = use_case.execute(request)
+    processor.release.set()
+    first.join(timeout=5)
+
+    assert response.success is False
+    assert "ainda em andamento" in response.error
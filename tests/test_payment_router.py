@@ -0,0 +1,232 @@
+"""
+Testes para o roteador de pagamentos.
+"""
+import threading
+import time
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.payment import PaymentInfo, PaymentProcessor
+from src.infrastructure.services.payment_router import PaymentRoute, PaymentRouter
+from src.infrastructure.services.simulated_payment_processor import (
+    SimulatedLatencyBlockingPaymentProcessor
+)
+
+
+class FakeClock:
+    """Relógio manual compartilhado pelos processadores de teste"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ClockedPaymentProcessor(PaymentProcessor):
+    """Processador que avança o relógio falso pela sua latência"""
+
+    def __init__(self, clock: FakeClock, latency: float, fail: bool = False):
+        self.clock = clock
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        self.calls += 1
+        self.clock.now += self.latency
+        if self.fail:
+            raise ConnectionRefusedError("Gateway indisponível")
+        return True
+
+
+def make_payment(currency: str = "BRL") -> PaymentInfo:
+    """Cria um pagamento de teste"""
+    return PaymentInfo(amount=Money(1000, currency), description="Pedido")
+
+
+def test_routes_to_fastest_backend():
+    """Testa que, após conhecer as latências, o mais rápido recebe o tráfego"""
+    clock = FakeClock()
+    slow = ClockedPaymentProcessor(clock, latency=0.3)
+    fast = ClockedPaymentProcessor(clock, latency=0.1)
+    router = PaymentRouter(
+        [PaymentRoute("slow", slow), PaymentRoute("fast", fast)],
+        clock=clock
+    )
+
+    # O primeiro só conhece o lento; o segundo experimenta o rápido sem amostras
+    for _ in range(10):
+        assert router.process_payment(make_payment()) is True
+
+    assert slow.calls == 1
+    assert fast.calls == 9
+    stats = router.stats()
+    assert stats["fast"].latency == pytest.approx(0.1)
+    assert stats["slow"].requests == 1
+
+
+def test_skips_backends_that_do_not_accept_currency():
+    """Testa a elegibilidade por moeda"""
+    clock = FakeClock()
+    pix = ClockedPaymentProcessor(clock, latency=0.01)
+    card = ClockedPaymentProcessor(clock, latency=0.2)
+    router = PaymentRouter(
+        [PaymentRoute("pix", pix, currencies=frozenset({"BRL"})), PaymentRoute("card", card)],
+        clock=clock
+    )
+
+    router.process_payment(make_payment("USD"))
+
+    assert pix.calls == 0
+    assert card.calls == 1
+
+
+def test_failover_and_circuit_breaker():
+    """Testa o repasse em caso de erro, a ejeção e o retorno após o cooldown"""
+    clock = FakeClock()
+    flaky = ClockedPaymentProcessor(clock, latency=0.01, fail=True)
+    backup = ClockedPaymentProcessor(clock, latency=0.5)
+    router = PaymentRouter(
+        [PaymentRoute("flaky", flaky), PaymentRoute("backup", backup)],
+        alpha=0.5,
+        min_requests=2,
+        cooldown=10,
+        clock=clock
+    )
+
+    for _ in range(5):
+        assert router.process_payment(make_payment()) is True
+
+    # Dois erros seguidos abrem o circuito; o resto vai direto ao backup
+    assert flaky.calls == 2
+    assert backup.calls == 5
+    assert router.stats()["flaky"].state == "open"
+    assert router.stats()["flaky"].ejections == 1
+
+    # Após o cooldown uma requisição de teste fecha o circuito
+    flaky.fail = False
+    clock.now += 10
+    router.process_payment(make_payment())
+    assert flaky.calls == 3
+    assert router.stats()["flaky"].state == "closed"
+
+
+def test_slow_backend_is_ejected():
+    """Testa a ejeção por latência média acima do limite"""
+    clock = FakeClock()
+    slow = ClockedPaymentProcessor(clock, latency=2.0)
+    router = PaymentRouter(
+        [PaymentRoute("slow", slow)],
+        max_latency=1.0,
+        min_requests=1,
+        clock=clock
+    )
+
+    router.process_payment(make_payment())
+
+    assert router.stats()["slow"].state == "open"
+    with pytest.raises(RuntimeError, match="Nenhum processador de pagamento disponível"):
+        router.process_payment(make_payment())
+
+
+def test_hedges_slow_request_to_second_backend():
+    """Testa que um pagamento lento é enviado também a outro processador"""
+    slow = SimulatedLatencyBlockingPaymentProcessor(latency=0.01)
+    fast = SimulatedLatencyBlockingPaymentProcessor(latency=0.03)
+    with PaymentRouter(
+        [PaymentRoute("slow", slow), PaymentRoute("fast", fast)],
+        hedge_after=0.05
+    ) as router:
+        # Aquece as médias com o "slow" como o mais rápido e então o torna lento
+        router.process_payment(make_payment())
+        router.process_payment(make_payment())
+        slow.latency = 0.5
+
+        assert router.process_payment(make_payment()) is True
+
+    assert router.hedges_sent == 1
+    assert router.hedges_won == 1
+
+
+class ScriptedPaymentProcessor(PaymentProcessor):
+    """Processador cujas chamadas esperam um evento e então respondem ou falham"""
+
+    def __init__(self):
+        self.calls = []
+
+    def process_payment(self, payment: PaymentInfo) -> bool:
+        release = threading.Event()
+        outcome = {}
+        self.calls.append((release, outcome))
+        release.wait(5)
+        if "error" in outcome:
+            raise outcome["error"]
+        return True
+
+
+def test_does_not_fail_over_when_charge_may_have_happened():
+    """Testa que um erro ambíguo não é repassado a outro processador"""
+    class TimingOutProcessor(PaymentProcessor):
+        def process_payment(self, payment: PaymentInfo) -> bool:
+            raise TimeoutError("Sem resposta do gateway")
+
+    clock = FakeClock()
+    backup = ClockedPaymentProcessor(clock, latency=0.5)
+    router = PaymentRouter(
+        [PaymentRoute("timeout", TimingOutProcessor()), PaymentRoute("backup", backup)],
+        clock=clock
+    )
+
+    with pytest.raises(TimeoutError):
+        router.process_payment(make_payment())
+
+    assert backup.calls == 0
+    assert router.stats()["timeout"].errors == 1
+
+
+def test_only_trial_request_decides_half_open_circuit():
+    """Testa que a resposta atrasada de antes da ejeção não fecha o circuito"""
+    clock = FakeClock()
+    processor = ScriptedPaymentProcessor()
+    router = PaymentRouter(
+        [PaymentRoute("gateway", processor)],
+        alpha=1.0,
+        min_requests=1,
+        cooldown=10,
+        clock=clock
+    )
+
+    def pay():
+        try:
+            router.process_payment(make_payment())
+        except RuntimeError:
+            pass  # Circuito aberto, sem outro processador
+
+    def submit():
+        thread = threading.Thread(target=pay)
+        thread.start()
+        while len(processor.calls) < len(threads) + 1:
+            time.sleep(0.001)
+        threads.append(thread)
+        return processor.calls[-1]
+
+    threads = []
+    late_release, _ = submit()  # Enviada com o circuito fechado
+    failing_release, failing = submit()
+    failing["error"] = ConnectionRefusedError("Gateway indisponível")
+    failing_release.set()
+    threads[1].join()
+    assert router.stats()["gateway"].state == "open"
+
+    clock.now += 10
+    trial_release, trial = submit()  # Requisição de teste
+    late_release.set()
+    threads[0].join()
+    assert router.stats()["gateway"].state == "half_open"
+
+    trial["error"] = ConnectionRefusedError("Gateway indisponível")
+    trial_release.set()
+    threads[2].join()
+    assert router.stats()["gateway"].state == "open"
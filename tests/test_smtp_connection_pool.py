@@ -0,0 +1,207 @@
+"""
+Testes para o pool de conexões SMTP e o serviço de email.
+"""
+import pytest
+
+from src.domain.interfaces.notification_service import (
+    NotificationContent,
+    NotificationRecipient,
+    NotificationType
+)
+from src.domain.interfaces.template_renderer import TemplateRenderer
+from src.infrastructure.factories.notification_factory import DefaultNotificationFactory
+from src.infrastructure.services.email_notification_service import EmailNotificationService
+from src.infrastructure.services.local_smtp_server import LocalSmtpServer
+from src.infrastructure.services.smtp_connection_pool import SmtpConnectionPool
+
+
+@pytest.fixture
+def smtp_server():
+    with LocalSmtpServer() as server:
+        yield server
+
+
+def make_service(server: LocalSmtpServer, **options) -> EmailNotificationService:
+    """Cria o serviço apontando para o servidor local, sem STARTTLS"""
+    return EmailNotificationService(
+        smtp_host=server.host,
+        smtp_port=server.port,
+        smtp_user="user",
+        smtp_password="password",
+        default_from_email="loja@example.com",
+        use_tls=False,
+        **options
+    )
+
+
+def email(address: str) -> NotificationRecipient:
+    return NotificationRecipient(identifier=address, type=NotificationType.EMAIL)
+
+
+CONTENT = NotificationContent(subject="Pedido criado", body="Obrigado!")
+
+
+def test_connections_are_reused(smtp_server):
+    """Testa que vários envios compartilham uma única conexão autenticada"""
+    service = make_service(smtp_server)
+    try:
+        results = [service.send_notification(email(f"c{i}@example.com"), CONTENT) for i in range(5)]
+    finally:
+        service.close()
+
+    assert all(result.success for result in results)
+    assert len(smtp_server.messages) == 5
+    assert smtp_server.connections_opened == 1
+    assert service.pool.connections_reused == 4
+    assert service.pool.idle_connections == 0
+
+
+def test_reconnects_when_server_drops_connection(smtp_server):
+    """Testa a reconexão transparente após a queda da conexão"""
+    service = make_service(smtp_server)
+    try:
+        assert service.send_notification(email("a@example.com"), CONTENT).success
+        smtp_server.drop_connections()
+        result = service.send_notification(email("b@example.com"), CONTENT)
+    finally:
+        service.close()
+
+    assert result.success is True
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.connections_opened == 2
+
+
+def test_idle_connections_expire(smtp_server):
+    """Testa o descarte de conexões ociosas além do idle_timeout"""
+    with SmtpConnectionPool(smtp_server.host, smtp_server.port, use_tls=False, idle_timeout=0.0) as pool:
+        with pool.connection():
+            pass
+        with pool.connection():
+            pass
+
+    assert smtp_server.connections_opened == 2
+    assert pool.connections_reused == 0
+
+
+def test_dead_idle_connection_fails_health_check(smtp_server):
+    """Testa que o NOOP detecta a conexão derrubada antes do uso"""
+    with SmtpConnectionPool(
+        smtp_server.host, smtp_server.port, use_tls=False, health_check_after=0.0
+    ) as pool:
+        with pool.connection():
+            pass
+        smtp_server.drop_connections()
+        with pool.connection() as server:
+            assert server.noop()[0] == 250
+
+    assert smtp_server.connections_opened == 2
+    assert pool.connections_reused == 0
+    assert pool.reconnects == 0
+
+
+def test_closed_pool_rejects_new_sends(smtp_server):
+    """Testa o encerramento do pool"""
+    pool = SmtpConnectionPool(smtp_server.host, smtp_server.port, use_tls=False)
+    pool.close()
+
+    with pytest.raises(RuntimeError, match="encerrado"):
+        with pool.connection():
+            pass
+
+
+def test_closed_service_reopens_connections(smtp_server):
+    """Testa que close() do serviço libera as conexões sem invalidá-lo"""
+    service = make_service(smtp_server)
+    assert service.send_notification(email("a@example.com"), CONTENT).success is True
+    service.close()
+    assert service.pool.idle_connections == 0
+
+    assert service.send_notification(email("b@example.com"), CONTENT).success is True
+    assert smtp_server.connections_opened == 2
+    service.close()
+
+
+def test_bulk_sends_chunks_in_parallel_and_keeps_order(smtp_server):
+    """Testa o envio em blocos paralelos com resultados na ordem de entrada"""
+    smtp_server.message_latency = 0.002
+    service = make_service(smtp_server, pool_size=4, bulk_chunk_size=5)
+    recipients = [email(f"c{i}@example.com") for i in range(40)]
+    recipients[7] = NotificationRecipient(identifier="+5511999999999", type=NotificationType.SMS)
+    try:
+        results = service.send_bulk_notifications(recipients, CONTENT)
+    finally:
+        service.close()
+
+    assert [result.recipient for result in results] == recipients
+    assert [i for i, result in enumerate(results) if not result.success] == [7]
+    assert len(smtp_server.messages) == 39
+    assert 1 < smtp_server.connections_opened <= 4
+
+
+def test_failing_connection_only_affects_its_chunk():
+    """Testa que a queda de uma conexão falha apenas o restante do seu bloco"""
+    with LocalSmtpServer(drop_recipient="c13@example.com") as server:
+        service = make_service(server, pool_size=2, bulk_chunk_size=5)
+        recipients = [email(f"c{i}@example.com") for i in range(20)]
+        try:
+            results = service.send_bulk_notifications(recipients, CONTENT)
+        finally:
+            service.close()
+
+    assert [i for i, result in enumerate(results) if not result.success] == [13, 14]
+    assert len(server.messages) == 18
+
+
+class FailingRenderer(TemplateRenderer):
+    """Renderizador que falha para um destinatário"""
+
+    def render(self, template_id, data):
+        if data["recipient"].identifier == "c2@example.com":
+            raise KeyError("Variável de template não encontrada: coupon")
+        return "Olá"
+
+
+def test_render_error_only_fails_its_recipient(smtp_server):
+    """Testa que um erro ao montar a mensagem não derruba o bloco nem a conexão"""
+    service = make_service(smtp_server, bulk_chunk_size=10, template_renderer=FailingRenderer())
+    content = NotificationContent(subject="Oi", body="", template_id="welcome")
+    recipients = [email(f"c{i}@example.com") for i in range(5)]
+    try:
+        results = service.send_bulk_notifications(recipients, content)
+    finally:
+        service.close()
+
+    assert [result.success for result in results] == [True, True, False, True, True]
+    assert "coupon" in results[2].error_message
+    assert smtp_server.connections_opened == 1
+
+
+def test_factory_passes_bulk_options(smtp_server):
+    """Testa que a factory repassa as opções de envio em massa"""
+    service = DefaultNotificationFactory().create_notification_service("email", {
+        "smtp_host": smtp_server.host,
+        "smtp_port": smtp_server.port,
+        "smtp_user": "user",
+        "smtp_password": "password",
+        "default_from_email": "loja@example.com",
+        "bulk_chunk_size": 7,
+        "bulk_concurrency": 2,
+        "bulk_max_in_flight": 70
+    })
+
+    assert (service.bulk_chunk_size, service.bulk_concurrency, service.bulk_max_in_flight) == (7, 2, 70)
+
+
+def test_factory_passes_template_renderer(smtp_server):
+    """Testa que a factory repassa o renderizador de templates"""
+    renderer = FailingRenderer()
+    service = DefaultNotificationFactory().create_notification_service("email", {
+        "smtp_host": smtp_server.host,
+        "smtp_port": smtp_server.port,
+        "smtp_user": "user",
+        "smtp_password": "password",
+        "default_from_email": "loja@example.com",
+        "template_renderer": renderer
+    })
+
+    assert service.template_renderer is renderer
@@ -0,0 +1,125 @@
+"""
+Testes para o registro de templates compilados.
+"""
+from email import message_from_bytes
+
+import pytest
+
+from src.application.templates.template_registry import TemplateRegistry, compile_template
+from src.domain.entities.money import Money
+from src.domain.entities.order import Order, OrderItem
+from src.domain.interfaces.notification_service import (
+    NotificationContent,
+    NotificationRecipient,
+    NotificationType
+)
+from src.infrastructure.services.email_notification_service import EmailNotificationService
+from src.infrastructure.services.local_smtp_server import LocalSmtpServer
+
+
+def make_order() -> Order:
+    return Order(
+        id="123",
+        items=[OrderItem("prod1", 2, Money(1050)), OrderItem("prod2", 1, Money(1575))],
+        total=Money(3675)
+    )
+
+
+def test_renders_variables_and_filters():
+    """Testa variáveis, caminhos com pontos em dicionários e objetos, e filtros"""
+    render = compile_template("{{ name|upper }}: {{order.id}} - {{ order.total | money }}")
+
+    assert render({"name": "ana", "order": make_order()}) == "ANA: 123 - R$ 36.75"
+
+
+def test_sections_repeat_items_and_see_outer_scope():
+    """Testa seções sobre listas, com busca no escopo externo"""
+    render = compile_template(
+        "Itens:\n"
+        "{{#order.items}}\n"
+        "- {{product_id}} ({{currency}}): {{quantity}}x {{price|money}}\n"
+        "{{/order.items}}\n"
+        "{{#vip}}VIP{{/vip}}{{#empty}}nunca{{/empty}}"
+    )
+
+    text = render({"order": make_order(), "currency": "BRL", "vip": True, "empty": []})
+
+    assert text == (
+        "Itens:\n"
+        "- prod1 (BRL): 2x R$ 10.50\n"
+        "- prod2 (BRL): 1x R$ 15.75\n"
+        "VIP"
+    )
+
+
+def test_invalid_templates_and_missing_variables():
+    """Testa erros de compilação e de renderização"""
+    with pytest.raises(ValueError, match="Seção não fechada"):
+        compile_template("{{#items}}x")
+    with pytest.raises(ValueError, match="Fechamento de seção inesperado"):
+        compile_template("{{#items}}x{{/other}}")
+    with pytest.raises(ValueError, match="Filtro de template desconhecido"):
+        compile_template("{{name|reverse}}")
+    with pytest.raises(KeyError, match="order.code"):
+        compile_template("{{order.code}}")({"order": make_order()})
+
+
+def test_registry_compiles_once_and_recompiles_after_eviction():
+    """Testa o cache LRU de funções compiladas"""
+    registry = TemplateRegistry(max_size=2)
+    registry.register("a", "A {{x}}")
+    registry.register("b", "B {{x}}")
+
+    for _ in range(3):
+        assert registry.render("a", {"x": 1}) == "A 1"
+    assert registry.compilations == 2
+
+    registry.register("c", "C {{x}}")  # Remove "b", o menos usado, do cache
+    assert registry.render("a", {"x": 2}) == "A 2"
+    assert registry.compilations == 3
+    assert registry.render("b", {"x": 3}) == "B 3"
+    assert registry.compilations == 4
+
+    with pytest.raises(KeyError, match="Template não registrado"):
+        registry.render("d", {})
+
+
+def test_email_service_renders_template_per_recipient():
+    """Testa a renderização do corpo no serviço de email"""
+    registry = TemplateRegistry()
+    registry.register("welcome", "Olá {{recipient.name}}, seu cupom é {{coupon}}")
+    content = NotificationContent(
+        subject="Bem-vindo",
+        body="",
+        template_id="welcome",
+        template_data={"coupon": "BEMVINDO10"}
+    )
+
+    with LocalSmtpServer() as server:
+        service = EmailNotificationService(
+            smtp_host=server.host,
+            smtp_port=server.port,
+            smtp_user="user",
+            smtp_password="password",
+            default_from_email="loja@example.com",
+            use_tls=False,
+            template_renderer=registry
+        )
+        try:
+            results = service.send_bulk_notifications(
+                [
+                    NotificationRecipient("ana@example.com", NotificationType.EMAIL, "Ana"),
+                    NotificationRecipient("bia@example.com", NotificationType.EMAIL, "Bia")
+                ],
+                content
+            )
+        finally:
+            service.close()
+
+    assert all(result.success for result in results)
+    bodies = sorted(
+        message_from_bytes(data).get_payload()[0].get_payload(decode=True).decode()
+        for _, _, data in server.messages
+    )
+    assert bodies == ["Olá Ana, seu cupom é BEMVINDO10", "Olá Bia, seu cupom é BEMVINDO10"]
+    assert registry.compilations == 1
@@ -5,7 +5,25 @@ from datetime import datetime
 import pytest
 
 from src.domain.entities.user import User
+from src.infrastructure.repositories.caching_repository import CachingUserRepository
 from src.infrastructure.repositories.memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sharded_memory_repository import ShardedInMemoryUserRepository
+from src.infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+
+
+@pytest.fixture(params=["memory", "sharded", "cached", "sqlite"])
+def repo(request):
+    """Executa os testes de repositório em todas as implementações"""
+    if request.param == "memory":
+        yield InMemoryUserRepository()
+    elif request.param == "cached":
+        yield CachingUserRepository(InMemoryUserRepository())
+    elif request.param == "sharded":
+        yield ShardedInMemoryUserRepository(shards=4)
+    else:
+        repository = SqliteUserRepository(":memory:")
+        yield repository
+        repository.close()
 
 
 def test_create_user():
@@ -31,9 +49,8 @@ def test_invalid_user_email():
         )
 
 
-def test_user_repository():
+def test_user_repository(repo):
     """Testa as operações do repositório de usuários"""
-    repo = InMemoryUserRepository()
     
     # Cria um usuário
     user = User(
@@ -58,4 +75,159 @@ def test_user_repository():
     
     # Remove o usuário
     repo.delete("1")
-    assert repo.find_by_id("1") is None 
\ No newline at end of file
+    assert repo.find_by_id("1") is None 
+
+
+def test_find_by_email_uses_normalized_email(repo):
+    """Testa a busca por email normalizado"""
+    repo.save(User(id="1", name="John Doe", email="John@Example.com", created_at=datetime.now()))
+
+    found_user = repo.find_by_email("  john@example.COM ")
+    assert found_user is not None
+    assert found_user.id == "1"
+    assert repo.find_by_email("jane@example.com") is None
+
+
+def test_duplicate_email_is_rejected(repo):
+    """Testa que dois usuários não podem compartilhar o mesmo email"""
+    repo.save(User(id="1", name="John Doe", email="john@example.com", created_at=datetime.now()))
+
+    with pytest.raises(ValueError, match="Email já cadastrado"):
+        repo.save(User(id="2", name="Other John", email="JOHN@example.com", created_at=datetime.now()))
+
+    assert repo.find_by_id("2") is None
+    assert repo.find_by_email("john@example.com").id == "1"
+
+
+def test_email_index_follows_updates_and_deletes(repo):
+    """Testa a manutenção do índice de email em atualizações e remoções"""
+    repo.save(User(id="1", name="John Doe", email="john@example.com", created_at=datetime.now()))
+
+    # Atualiza o email do usuário: o email antigo fica livre
+    repo.save(User(id="1", name="John Doe", email="johnny@example.com", created_at=datetime.now()))
+    assert repo.find_by_email("john@example.com") is None
+    assert repo.find_by_email("johnny@example.com").id == "1"
+
+    # Remove o usuário: o email pode ser reutilizado
+    repo.delete("1")
+    assert repo.find_by_email("johnny@example.com") is None
+    repo.save(User(id="2", name="Jane Doe", email="johnny@example.com", created_at=datetime.now()))
+    assert repo.find_by_email("johnny@example.com").id == "2"
+
+
+def test_iter_users_with_cursor(repo):
+    """Testa a iteração dos usuários a partir de um cursor"""
+    for user_id in ("3", "1", "2", "4"):
+        repo.save(User(id=user_id, name="User", email=f"user{user_id}@example.com", created_at=datetime.now()))
+
+    assert [u.id for u in repo.iter_users()] == ["1", "2", "3", "4"]
+    assert [u.id for u in repo.iter_users(limit=2)] == ["1", "2"]
+    assert [u.id for u in repo.iter_users(after="2")] == ["3", "4"]
+
+    repo.delete("3")
+    assert [u.id for u in repo.iter_users(after="2", limit=5)] == ["4"]
+
+    # Saves e deletes intercalados com leituras continuam ordenados
+    repo.save(User(id="0", name="User", email="user0@example.com", created_at=datetime.now()))
+    repo.save(User(id="5", name="User", email="user5@example.com", created_at=datetime.now()))
+    repo.delete("5")
+    assert [u.id for u in repo.iter_users()] == ["0", "1", "2", "4"]
+
+
+def test_iter_users_across_pages(repo):
+    """Testa a iteração ordenada com mais usuários que uma página de leitura"""
+    ids = [f"{i:04d}" for i in range(300)]
+    repo.save_many(
+        User(id=user_id, name="User", email=f"user{user_id}@example.com", created_at=datetime.now())
+        for user_id in reversed(ids)
+    )
+
+    assert [u.id for u in repo.iter_users()] == ids
+    assert [u.id for u in repo.iter_users(after="0099", limit=150)] == ids[100:250]
+
+
+def test_sharded_iter_users_reads_shards_lazily():
+    """Testa que o repositório particionado lê cada shard sob demanda"""
+    repo = ShardedInMemoryUserRepository(shards=2)
+    for i in range(200):
+        repo.save(User(id=f"{i:04d}", name="User", email=f"user{i}@example.com", created_at=datetime.now()))
+
+    users = repo.iter_users()
+    assert next(users).id == "0000"
+    # Gravados depois do início da iteração, mas antes de seus shards chegarem lá
+    repo.save(User(id="0199a", name="User", email="late@example.com", created_at=datetime.now()))
+    repo.delete("0150")
+    remaining = [u.id for u in users]
+
+    assert "0199a" in remaining
+    assert "0150" not in remaining
+    assert remaining == sorted(remaining)
+
+
+def test_sqlite_user_repository_persists_between_connections(tmp_path):
+    """Testa que o repositório SQLite mantém os dados após reabrir o banco"""
+    database = str(tmp_path / "users.db")
+    repo = SqliteUserRepository(database)
+    repo.save_many(
+        User(id=str(i), name=f"User {i}", email=f"user{i}@example.com", created_at=datetime.now())
+        for i in range(10)
+    )
+    repo.close()
+
+    reopened = SqliteUserRepository(database)
+    assert len(reopened.find_all()) == 10
+    assert reopened.find_by_email("USER3@example.com").id == "3"
+    reopened.close()
+
+
+def test_save_many_and_find_many(repo):
+    """Testa a gravação e a busca em lote de usuários"""
+    repo.save_many(
+        User(id=str(i), name=f"User {i}", email=f"user{i}@example.com", created_at=datetime.now())
+        for i in range(5)
+    )
+
+    found = repo.find_many(["3", "missing", "0"])
+
+    assert [user.id if user else None for user in found] == ["3", None, "0"]
+    assert repo.find_by_email("user4@example.com").id == "4"
+
+
+def test_memory_save_many_is_all_or_nothing():
+    """Testa que um lote com email duplicado não grava nenhum usuário"""
+    repo = InMemoryUserRepository()
+    repo.save(User(id="1", name="John Doe", email="john@example.com", created_at=datetime.now()))
+
+    with pytest.raises(ValueError, match="Email já cadastrado"):
+        repo.save_many([
+            User(id="2", name="Jane Doe", email="jane@example.com", created_at=datetime.now()),
+            User(id="3", name="Other John", email="john@example.com", created_at=datetime.now())
+        ])
+
+    assert repo.find_many(["2", "3"]) == [None, None]
+
+    # Troca de emails entre usuários do mesmo lote é permitida
+    repo.save(User(id="2", name="Jane Doe", email="jane@example.com", created_at=datetime.now()))
+    repo.save_many([
+        User(id="1", name="John Doe", email="jane@example.com", created_at=datetime.now()),
+        User(id="2", name="Jane Doe", email="john@example.com", created_at=datetime.now())
+    ])
+    assert repo.find_by_email("jane@example.com").id == "1"
+    assert repo.find_by_email("john@example.com").id == "2"
+
+
+def test_memory_user_repository_snapshot_and_restore(tmp_path):
+    """Testa o snapshot e a restauração do repositório em memória"""
+    repo = InMemoryUserRepository()
+    for i in range(5):
+        repo.save(User(id=str(i), name=f"User {i}", email=f"user{i}@example.com", created_at=datetime.now()))
+    path = str(tmp_path / "users.snapshot")
+
+    repo.snapshot(path)
+    restored = InMemoryUserRepository()
+    restored.restore(path)
+
+    assert [user.id for user in restored.iter_users()] == ["0", "1", "2", "3", "4"]
+    assert restored.find_by_email("USER2@example.com").id == "2"
+    with pytest.raises(ValueError, match="Email já cadastrado"):
+        restored.save(User(id="9", name="Copy", email="user1@example.com", created_at=datetime.now()))
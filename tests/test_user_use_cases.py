@@ -55,4 +55,64 @@ def test_list_users():
     # Verifica os dados dos usuários
     users = response["data"]["users"]
     assert any(user["name"] == "John Doe" for user in users)
-    assert any(user["name"] == "Jane Doe" for user in users) 
\ No newline at end of file
+    assert any(user["name"] == "Jane Doe" for user in users) 
+
+
+def test_create_user_duplicate_email():
+    """Testa a criação de um usuário com email já cadastrado"""
+    controller = UserController()
+    controller.create_user("John Doe", "john@example.com")
+
+    # Tenta criar outro usuário com o mesmo email
+    response = controller.create_user("Other John", "John@Example.com")
+
+    # Verifica a falha
+    assert response["success"] is False
+    assert "Email já cadastrado" in response["error"]
+    assert len(controller.list_users()["data"]["users"]) == 1
+
+
+def test_list_users_paginated():
+    """Testa a listagem paginada de usuários por cursor"""
+    controller = UserController()
+    for i in range(5):
+        controller.create_user(f"User {i}", f"user{i}@example.com")
+
+    # Primeira página
+    first_page = controller.list_users(limit=2)
+    assert first_page["success"] is True
+    assert len(first_page["data"]["users"]) == 2
+    assert first_page["data"]["next_cursor"] is not None
+
+    # Percorre as páginas seguintes usando o cursor
+    seen = [user["id"] for user in first_page["data"]["users"]]
+    cursor = first_page["data"]["next_cursor"]
+    while cursor is not None:
+        page = controller.list_users(limit=2, cursor=cursor)
+        seen.extend(user["id"] for user in page["data"]["users"])
+        cursor = page["data"]["next_cursor"]
+
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+
+
+def test_list_users_invalid_limit():
+    """Testa a listagem com limite inválido"""
+    controller = UserController()
+
+    response = controller.list_users(limit=0)
+
+    assert response["success"] is False
+    assert "Limite deve ser maior que zero" in response["error"]
+
+
+def test_iter_user_pages():
+    """Testa a geração preguiçosa das páginas de usuários"""
+    controller = UserController()
+    for i in range(5):
+        controller.create_user(f"User {i}", f"user{i}@example.com")
+
+    pages = list(controller.iter_user_pages(page_size=2))
+
+    assert [len(page["data"]["users"]) for page in pages] == [2, 2, 1]
+    assert pages[-1]["data"]["next_cursor"] is None
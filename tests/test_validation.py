@@ -0,0 +1,63 @@
+"""
+Testes para o motor de validação declarativo.
+"""
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.order import ORDER_VALIDATOR, Order, OrderItem
+from src.domain.entities.user import User
+from src.domain.entities.validation import Rule, ValidationFailure, Validator
+
+
+def make_order(*items) -> Order:
+    """Cria um pedido a partir de tuplas (quantidade, preço em centavos)"""
+    return Order(
+        id="1",
+        items=[OrderItem(f"prod{i}", quantity, Money(price)) for i, (quantity, price) in enumerate(items)],
+        total=Money.zero()
+    )
+
+
+def test_item_rules_keep_declaration_priority():
+    """Testa que a primeira regra declarada vence, mesmo falhando em um item posterior"""
+    order = make_order((1, 0), (0, 100))
+
+    assert ORDER_VALIDATOR.first_error(order) == "Quantidade de itens deve ser maior que zero"
+    assert ORDER_VALIDATOR.first_error(make_order((1, 0))) == "Preço dos itens deve ser maior que zero"
+    assert ORDER_VALIDATOR.first_error(make_order()) == "Pedido deve ter pelo menos um item"
+    assert ORDER_VALIDATOR.first_error(make_order((1, 100))) is None
+
+
+def test_validate_many_returns_all_failures():
+    """Testa o modo em lote"""
+    orders = [make_order((1, 100)), make_order(), make_order((2, 100)), make_order((0, 100))]
+
+    assert ORDER_VALIDATOR.validate_many(orders) == [
+        ValidationFailure(1, "Pedido deve ter pelo menos um item"),
+        ValidationFailure(3, "Quantidade de itens deve ser maior que zero")
+    ]
+
+
+def test_custom_check_and_invalid_rules():
+    """Testa regras com função própria e a recusa de regras malformadas"""
+    validator = Validator([Rule("name", "Nome muito longo", "check", lambda name: len(name) <= 3)])
+
+    with pytest.raises(ValueError, match="Nome muito longo"):
+        validator.validate(User.trusted("1", "Maria", "maria@example.com", datetime.now()))
+    with pytest.raises(ValueError, match="Operação de validação não suportada"):
+        Validator([Rule("name", "x", "~")])
+    with pytest.raises(ValueError, match="Atributo inválido"):
+        Validator([Rule("name; import os", "x")])
+
+
+def test_trusted_user_skips_validation():
+    """Testa que a carga confiável não revalida o usuário"""
+    user = User.trusted("1", "", "sem-arroba", datetime.now())
+
+    assert user.email == "sem-arroba"
+    with pytest.raises(ValueError, match="Nome do usuário não pode estar vazio"):
+        user.validate()
+    with pytest.raises(ValueError, match="Email inválido"):
+        User(id="2", name="Maria", email="sem-arroba", created_at=datetime.now())